@@ -0,0 +1,59 @@
+import sys
+import time
+
+from random import Random
+
+from src.catalog_generator import generate_catalog
+from src.catalog_generator import fill_store
+from src.game_store import GameStore
+
+OPERATIONS = 1000
+
+
+def measure(size: int) -> None:
+    """Fill a quiet store with a synthetic catalog and time index operations.
+
+    Args:
+        size: Number of catalog titles.
+    """
+    store = GameStore(verbose=False)
+    started = time.perf_counter()
+    fill_store(store, generate_catalog(size, random_seed=size))
+    filled = time.perf_counter() - started
+
+    sample = Random(0).sample(list(generate_catalog(size, random_seed=size)), min(OPERATIONS, size))
+    timings = {}
+    for name, search in (
+        ("developer", lambda game: store.search_by_developer(game.developer)),
+        ("genre", lambda game: store.search_by_genre(game.genre)),
+        ("release year", lambda game: store.search_by_release_year(game.release_year)),
+    ):
+        started = time.perf_counter()
+        for game in sample:
+            search(game)
+        timings[f"search by {name}"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for game in sample:
+        store.remove_game(game)
+    timings["remove"] = time.perf_counter() - started
+
+    print(f"\n📦{size} titles: fill {filled:.2f} s ({filled / size * 1e6:.2f} us/copy)")
+    print(
+        f"\tbuckets: {len(store._by_developer)} developers, {len(store._by_genre)} genres, "
+        f"{len(store._by_release_year)} years"
+    )
+    for name, elapsed in timings.items():
+        print(f"\t{name}: {elapsed / len(sample) * 1e6:.2f} us/op")
+
+
+def main() -> None:
+    """Measure index scaling for catalog sizes given on the command line."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    print(f"⏱️Index scaling ({OPERATIONS} operations per size):")
+    for size in sizes:
+        measure(size)
+
+
+if __name__ == "__main__":
+    main()
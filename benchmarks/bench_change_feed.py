@@ -0,0 +1,41 @@
+import sys
+import time
+
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+
+
+def _churn(store: GameStore, operations: int) -> float:
+    """Add and sell copies, returning seconds per add-and-buy pair."""
+    games = GAMES_DATABASE
+    started = time.perf_counter()
+    for number in range(operations):
+        game = games[number % len(games)]
+        store.add_game(game, 1000)
+        store.buy_game(game, 1000)
+    return (time.perf_counter() - started) / operations
+
+
+def main() -> None:
+    """Compare the write path with and without a change feed and time polling."""
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    plain = _churn(GameStore(verbose=False), operations)
+
+    store = GameStore(verbose=False)
+    subscription = store.change_feed(capacity=4 * operations).subscribe()
+    with_feed = _churn(store, operations)
+
+    started = time.perf_counter()
+    consumed = 0
+    while batch := subscription.poll(4096):
+        consumed += len(batch)
+    polled = time.perf_counter() - started
+
+    print(f"📰Change feed ({operations} add + buy pairs):")
+    print(f"\twithout feed: {plain * 1e6:.2f} us/pair")
+    print(f"\twith feed: {with_feed * 1e6:.2f} us/pair ({(with_feed / plain - 1) * 100:+.1f}%)")
+    print(f"\tpoll: {polled / consumed * 1e6:.3f} us/change for {consumed} changes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.catalog_generator import fill_store
+from src.catalog_generator import generate_catalog
+from src.export import export_columnar
+from src.export import export_csv
+from src.export import export_jsonl
+from src.game_store import GameStore
+
+COPIES = 10
+
+EXPORTS = [
+    ("csv", export_csv, "titles.csv"),
+    ("csv.gz", export_csv, "titles.csv.gz"),
+    ("jsonl", export_jsonl, "titles.jsonl"),
+    ("columnar", export_columnar, "titles.col"),
+    ("columnar.gz", export_columnar, "titles.col.gz"),
+]
+
+
+def main() -> None:
+    """Time every exporter and measure its peak memory in a separate traced run for the given catalog sizes."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    for size in sizes:
+        store = GameStore(verbose=False)
+        fill_store(store, generate_catalog(size, random_seed=size), copies=COPIES)
+        print(f"📤Export of {size} titles ({len(store)} copies):")
+        with tempfile.TemporaryDirectory() as directory:
+            for name, export, file_name in EXPORTS:
+                path = os.path.join(directory, file_name)
+                started = time.perf_counter()
+                export(store, path)
+                elapsed = time.perf_counter() - started
+                tracemalloc.start()
+                export(store, path)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                megabytes = os.path.getsize(path) / 2**20
+                print(
+                    f"\t{name}: {elapsed:.3f} s ({elapsed / size * 1e6:.2f} us/title), "
+                    f"{megabytes:.1f} MiB, peak memory {peak / 2**20:.1f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
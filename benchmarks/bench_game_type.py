@@ -0,0 +1,68 @@
+import timeit
+
+from typing import Any
+from typing import Callable
+
+from src.game import Game
+from src.game import type_checks_disabled
+from src.game_collection import GameCollection
+from src.games_db import GAMES_DATABASE
+
+NUMBER = 200_000
+
+
+def legacy_game_type(func: Callable) -> Callable:
+    """Reproduce the original `*args/**kwargs` decorator for comparison."""
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if len(args) > 1 and not isinstance(args[1], Game):
+            raise TypeError("Game must be of type Game")
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def measure(label: str, stmt: str, namespace: dict) -> float:
+    """Time a statement and print its per-call cost.
+
+    Args:
+        label: Name of the measured variant.
+        stmt: Statement to time.
+        namespace: Globals available to the statement.
+
+    Returns:
+        Per-call time in nanoseconds.
+    """
+    best = min(timeit.repeat(stmt, globals=namespace, number=NUMBER, repeat=5))
+    per_call = best / NUMBER * 1e9
+    print(f"\t{label:<30}{per_call:8.1f} ns/call")
+    return per_call
+
+
+def main() -> None:
+    """Compare `GameCollection.__contains__` with every validation variant."""
+    collection = GameCollection([GAMES_DATABASE[0]])
+    raw_contains = getattr(GameCollection.__contains__, "__wrapped__", GameCollection.__contains__)
+    namespace = {
+        "collection": collection,
+        "game": GAMES_DATABASE[0],
+        "contains": GameCollection.__contains__,
+        "raw_contains": raw_contains,
+        "legacy_contains": legacy_game_type(raw_contains),
+    }
+
+    print(f"⏱️game_type overhead ({NUMBER} calls, best of 5):")
+    if not __debug__:
+        print("\t⚠️running under -O, validation is compiled away")
+    legacy = measure("legacy *args wrapper", "legacy_contains(collection, game)", namespace)
+    checked = measure("validation enabled", "contains(collection, game)", namespace)
+    with type_checks_disabled():
+        disabled = measure("validation disabled", "contains(collection, game)", namespace)
+    raw = measure("compiled away (__wrapped__)", "raw_contains(collection, game)", namespace)
+    print(f"\t➖legacy -> enabled: {legacy - checked:.1f} ns/call")
+    print(f"\t➖legacy -> disabled: {legacy - disabled:.1f} ns/call")
+    print(f"\t➖legacy -> compiled away: {legacy - raw:.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import asyncio
+import sys
+
+from src.game_store import GameStore
+from src.games_db import get_games_database
+from src.http_service import StoreService
+from src.http_service import load_test
+from src.http_service import print_report
+
+
+async def run(connections: int, requests: int) -> None:
+    """Serve a filled store in-process and load-test it over localhost."""
+    store = GameStore(verbose=False)
+    for game in get_games_database():
+        for _ in range(10):
+            store.add_game(game, 1000)
+    service = StoreService(store)
+    await service.start()
+    try:
+        report = await load_test("127.0.0.1", service.port, connections, requests)
+    finally:
+        await service.close()
+    print(f"🌐{connections} connections:")
+    print_report(report)
+    print(f"\t📦Batches: {service.batches} ({service.requests / max(service.batches, 1):.1f} requests per batch)")
+
+
+def main() -> None:
+    """Load-test the service for connection counts given on the command line."""
+    requests = 20_000
+    for connections in [int(arg) for arg in sys.argv[1:]] or [1, 16, 64]:
+        asyncio.run(run(connections, requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import gc
+import sys
+import tracemalloc
+
+from src.catalog_generator import fill_store
+from src.catalog_generator import generate_catalog
+from src.game_store import GameStore
+
+COPIES = 3
+
+
+def traced_store(titles: int, copies: int) -> tuple[int, GameStore]:
+    """Build a quiet store and return the memory tracemalloc saw it allocate.
+
+    Args:
+        titles: Number of catalog titles.
+        copies: Copies added per title.
+
+    Returns:
+        Allocated bytes and the store, kept alive for the report.
+    """
+    games = list(generate_catalog(titles, random_seed=titles))
+    gc.collect()
+    tracemalloc.start()
+    store = GameStore(verbose=False)
+    fill_store(store, games, copies=copies)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return allocated, store
+
+
+def main() -> None:
+    """Report bytes per title and per copy for the catalog sizes given on the command line."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    print(f"⏱️GameStore memory (tracemalloc, catalog games allocated outside the store, 1 vs {COPIES} copies):")
+    for size in sizes:
+        single, _ = traced_store(size, 1)
+        multiple, store = traced_store(size, COPIES)
+        per_copy = (multiple - single) / ((COPIES - 1) * size)
+        per_title = single / size - per_copy
+        report = store.memory_report()
+        print(f"\n📦{size} titles:")
+        print(f"\ttraced: {single} B (1 copy), {multiple} B ({COPIES} copies)")
+        print(f"\tper title: {per_title:.0f} B, per extra copy: {per_copy:.0f} B")
+        print(f"\tmemory_report ({COPIES} copies, games included):")
+        for name, size_bytes in report.items():
+            print(f"\t\t{name}: {size_bytes} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import sys
+import time
+
+from random import Random
+
+from src.price_history import PriceHistory
+
+TITLES = 10_000
+
+
+def main() -> None:
+    """Time recording and querying a history of the size given on the command line."""
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = Random(0)
+    game_ids = [f"SYN_{number:07d}" for number in range(TITLES)]
+    history = PriceHistory()
+
+    started = time.perf_counter()
+    for step in range(events):
+        game_id = game_ids[rng.randrange(TITLES)]
+        if step % 4:
+            history.record_revenue(game_id, step, 1000)
+        else:
+            history.record_price(game_id, step, rng.randrange(500, 5000, 100))
+    recorded = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(10_000):
+        history.price_at(game_ids[rng.randrange(TITLES)], rng.randrange(events))
+    lookups = (time.perf_counter() - started) / 10_000
+
+    started = time.perf_counter()
+    windows = history.revenue_per_window(1000, 0, events)
+    windowed = time.perf_counter() - started
+
+    print(f"⏱️PriceHistory ({events} events, {TITLES} titles):")
+    print(f"\trecord: {recorded / events * 1e6:.2f} us/event")
+    print(f"\tprice_at: {lookups * 1e6:.2f} us/lookup")
+    print(f"\trevenue per 1000 steps: {len(windows)} windows in {windowed * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import sys
+import time
+
+from random import Random
+
+from src.catalog_generator import fill_store
+from src.catalog_generator import generate_catalog
+from src.game_store import GameStore
+from src.pricing import PricingEngine
+
+PASSES = 5
+
+
+def main() -> None:
+    """Time repricing passes over the catalog size given on the command line."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    games = list(generate_catalog(size, random_seed=1))
+    store = GameStore(verbose=False)
+    fill_store(store, games, copies=3)
+    rng = Random(0)
+    engine = PricingEngine()
+    engine.attach(store)
+
+    elapsed = 0.0
+    updated = 0
+    for _ in range(PASSES):
+        store.tick(engine.interval)
+        for game in rng.sample(games, size // 100):
+            store.buy_game(game, 100_000)
+        started = time.perf_counter()
+        updated += engine.reprice(store)
+        elapsed += time.perf_counter() - started
+
+    print(f"⏱️PricingEngine ({size} titles, {PASSES} passes):")
+    print(f"\treprice: {elapsed / PASSES * 1e3:.1f} ms/pass ({elapsed / PASSES / size * 1e6:.2f} us/title)")
+    print(f"\tprices changed: {updated / PASSES:.0f} per pass")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import sys
+import time
+
+from random import Random
+
+from src.catalog_generator import fill_store
+from src.catalog_generator import generate_catalog
+from src.game import Game
+from src.game_store import GameStore
+
+OPERATIONS = 500
+
+
+def legacy_remove(store: GameStore, game: Game) -> None:
+    """Remove a copy the way GameStore did before single-pass removal.
+
+    Every structure was checked for membership before removal, and
+    GameCollection.remove_game checked again before calling list.remove.
+
+    Args:
+        store: Store to remove the copy from.
+        game: Game to remove.
+    """
+    if game.game_id not in store._by_id:
+        return
+    for index in (store._by_id, *store._index_list):
+        bucket = index[index._get_key(game)]
+        if game not in bucket or game not in bucket._games:
+            raise ValueError("Game is not in dict")
+        bucket._games.remove(game)
+        if len(bucket) == 0:
+            del index._dct[index._get_key(game)]
+    if game not in store._all_copies._games:
+        raise ValueError("Game is not in collection")
+    store._all_copies._games.remove(game)
+    if game.game_id not in store._by_id:
+        del store._prices[game]
+
+
+def measure(size: int) -> None:
+    """Time legacy and single-pass removal on equally filled stores.
+
+    Args:
+        size: Number of catalog titles, each added with two copies.
+    """
+    games = list(generate_catalog(size, random_seed=size))
+    sample = Random(0).sample(games, min(OPERATIONS, size))
+    timings = {}
+    for name, remove in (
+        ("legacy", lambda store, game: legacy_remove(store, game)),
+        ("single pass", lambda store, game: store.remove_game(game)),
+    ):
+        store = GameStore(verbose=False)
+        fill_store(store, games, copies=2)
+        started = time.perf_counter()
+        for game in sample:
+            remove(store, game)
+        timings[name] = (time.perf_counter() - started) / len(sample)
+
+    print(f"\n📦{size} titles ({2 * size} copies):")
+    for name, elapsed in timings.items():
+        print(f"\t{name}: {elapsed * 1e6:.1f} us/remove")
+    print(f"\tspeedup: {timings['legacy'] / timings['single pass']:.1f}x")
+
+
+def main() -> None:
+    """Compare removal paths for catalog sizes given on the command line."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000]
+    print(f"⏱️GameStore.remove_game ({OPERATIONS} removals per size):")
+    for size in sizes:
+        measure(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from src.games_db import GAMES_DATABASE
+from src.simulation import simulate
+from src.trace import TraceWriter
+from src.trace import replay
+
+
+def main(start_games_amount: int = 100, steps: int = 200_000, random_seed: int = 0) -> None:
+    """Record a seeded simulation once and time its replay.
+
+    Args:
+        start_games_amount: Initial number of games in the recorded run.
+        steps: Number of simulation steps to record.
+        random_seed: Seed of the recorded run.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.trace")
+        started = time.perf_counter()
+        with TraceWriter(path, GAMES_DATABASE) as writer, contextlib.redirect_stdout(io.StringIO()):
+            simulate(start_games_amount, steps, random_seed, recorder=writer)
+        simulated = time.perf_counter() - started
+        size = os.path.getsize(path)
+
+        started = time.perf_counter()
+        store = replay(path)
+        replayed = time.perf_counter() - started
+
+    events = start_games_amount + steps
+    print(f"⏱️Trace replay ({events} events, {size} bytes):")
+    print(f"\tsimulate + record: {simulated:.3f} s ({events / simulated:,.0f} events/s)")
+    print(f"\treplay: {replayed:.3f} s ({events / replayed:,.0f} events/s)")
+    print(f"\t{store}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,62 @@
+import os
+import sys
+import tempfile
+import time
+
+from random import Random
+
+from src.catalog_generator import fill_store
+from src.catalog_generator import generate_catalog
+from src.game_store import GameStore
+from src.sqlite_store import SQLiteGameStore
+
+OPERATIONS = 20_000
+
+
+def run(name: str, store: GameStore | SQLiteGameStore, size: int) -> None:
+    """Time filling a store, buying random games and searching by developer.
+
+    Args:
+        name: Label of the store in the report.
+        store: Empty quiet store.
+        size: Number of catalog titles, each added with two copies.
+    """
+    games = list(generate_catalog(size, random_seed=size))
+    rng = Random(0)
+    buys = [rng.choice(games) for _ in range(OPERATIONS)]
+    developers = [rng.choice(games).developer for _ in range(1000)]
+
+    started = time.perf_counter()
+    fill_store(store, games, copies=2)
+    filled = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for game in buys:
+        store.buy_game(game, 5000)
+    bought = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for developer in developers:
+        store.search("developer", developer)
+    searched = time.perf_counter() - started
+
+    print(f"\t{name}:")
+    print(f"\t\tadd: {filled / (2 * size) * 1e6:.1f} us/copy")
+    print(f"\t\tbuy: {bought / OPERATIONS * 1e6:.1f} us/op")
+    print(f"\t\tsearch by developer: {searched / len(developers) * 1e6:.1f} us/op")
+
+
+def main() -> None:
+    """Compare the in-memory and SQLite stores for catalog sizes given on the command line."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    print(f"⏱️GameStore vs SQLiteGameStore ({OPERATIONS} buys per size):")
+    for size in sizes:
+        print(f"\n📦{size} titles ({2 * size} copies):")
+        run("in-memory", GameStore(verbose=False), size)
+        with tempfile.TemporaryDirectory() as directory:
+            with SQLiteGameStore(os.path.join(directory, "bench.db"), verbose=False) as store:
+                run("sqlite (file)", store, size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import time
+
+MODULES = ["src.main", "src.simulation"]
+
+RUNS = 10
+
+
+def import_times(module: str) -> list[tuple[int, int, str]]:
+    """Import a module in a fresh interpreter under `-X importtime`.
+
+    Args:
+        module: Dotted name of the module to import.
+
+    Returns:
+        List of (self us, cumulative us, module name) for every imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times.append((int(self_us), int(cumulative_us), name.strip()))
+    return times
+
+
+def wall_time(module: str) -> float:
+    """Measure the best interpreter start plus import time of a module.
+
+    Args:
+        module: Dotted name of the module to import.
+
+    Returns:
+        Best wall time in seconds over RUNS runs.
+    """
+    best = float("inf")
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """Report import cost of the CLI entry point and the simulation module."""
+    print("⏱️Startup time:")
+    for module in MODULES:
+        times = import_times(module)
+        total = next(cumulative for _, cumulative, name in times if name == module)
+        print(f"\n📦{module}: {total / 1000:.2f} ms import, {wall_time(module) * 1000:.1f} ms with interpreter start")
+        for self_us, cumulative_us, name in sorted(times, key=lambda item: item[0], reverse=True)[:5]:
+            print(f"\t{name:<24}self {self_us / 1000:6.2f} ms, cumulative {cumulative_us / 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
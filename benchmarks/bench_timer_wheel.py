@@ -0,0 +1,40 @@
+import sys
+import time
+
+from random import Random
+
+from src.timer_wheel import TimerWheel
+
+
+def main() -> None:
+    """Time scheduling and expiring the number of timers given on the command line."""
+    timers = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = Random(0)
+    deadlines = [rng.randrange(1, 100_000) for _ in range(timers)]
+    wheel: TimerWheel[int] = TimerWheel()
+
+    started = time.perf_counter()
+    for key, deadline in enumerate(deadlines):
+        wheel.schedule(key, deadline)
+    scheduled = time.perf_counter() - started
+
+    started = time.perf_counter()
+    fired = 0
+    for step in range(0, 100_000, 10):
+        fired += len(wheel.advance(step + 10))
+    advanced = time.perf_counter() - started
+
+    print(f"⏱️TimerWheel ({timers} timers over 100000 steps):")
+    print(f"\tschedule: {scheduled / timers * 1e6:.2f} us/timer")
+    print(f"\tadvance: {advanced:.3f} s for {fired} expirations ({advanced / fired * 1e6:.2f} us/timer)")
+
+    sparse: TimerWheel[int] = TimerWheel()
+    for key in range(1000):
+        sparse.schedule(key, rng.randrange(1, 10**12))
+    started = time.perf_counter()
+    fired = len(sparse.advance(10**12))
+    print(f"\tsparse: {time.perf_counter() - started:.3f} s to expire {fired} timers spread over 10^12 steps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import sys
+import time
+
+from random import seed
+
+from src.games_db import GAMES_DATABASE
+from src.simulation import random_step
+from src.workload import generate_workload
+
+
+def main(steps: int = 1_000_000) -> None:
+    """Compare per-step RNG draws with vectorized workload generation.
+
+    Args:
+        steps: Number of steps to generate.
+    """
+    seed(0)
+    started = time.perf_counter()
+    for _ in range(steps):
+        random_step()
+    per_step = time.perf_counter() - started
+
+    started = time.perf_counter()
+    workload = generate_workload(steps, len(GAMES_DATABASE), random_seed=0)
+    vectorized = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in workload.steps(GAMES_DATABASE):
+        pass
+    converted = time.perf_counter() - started
+
+    print(f"⏱️Workload generation ({steps} steps):")
+    print(f"\trandom_step loop: {per_step:.3f} s")
+    print(f"\tgenerate_workload: {vectorized:.3f} s ({per_step / vectorized:.0f}x faster)")
+    print(f"\tWorkload.steps conversion: {converted:.3f} s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,187 @@
+import csv
+
+from bisect import bisect
+from itertools import accumulate
+from random import Random
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Iterator
+
+from src.game import Game
+from src.game_store import GameStore
+
+if TYPE_CHECKING:
+    from src.sqlite_store import SQLiteGameStore
+
+GENRES = [
+    "Action",
+    "Action-Adventure",
+    "Adventure",
+    "FPS",
+    "Puzzle",
+    "Racing",
+    "RPG",
+    "Simulation",
+    "Sports",
+    "Strategy",
+    "Survival Horror",
+]
+
+CATALOG_FIELDS = ["title", "developer", "release_year", "genre", "game_id"]
+
+
+class CatalogSpec:
+    """Distributions used to generate a synthetic catalog.
+
+    Developers are drawn with Zipf weights, so a few studios own large buckets while
+    most own a handful of games.
+
+    Attributes:
+        developers: Number of distinct developers.
+        developer_skew: Zipf exponent of developer sizes, 0 for uniform.
+        genre_weights: Relative weight per genre.
+        first_year: Earliest release year.
+        last_year: Latest release year.
+        year_weights: Relative weight per release year, uniform over the range if omitted.
+    """
+
+    def __init__(
+        self,
+        developers: int = 1000,
+        developer_skew: float = 1.0,
+        genre_weights: dict[str, float] | None = None,
+        first_year: int = 1980,
+        last_year: int = 2025,
+        year_weights: dict[int, float] | None = None,
+    ) -> None:
+        """Initialize catalog distributions.
+
+        Args:
+            developers: Number of distinct developers.
+            developer_skew: Zipf exponent of developer sizes, 0 for uniform.
+            genre_weights: Relative weight per genre, uniform over GENRES if omitted.
+            first_year: Earliest release year.
+            last_year: Latest release year.
+            year_weights: Relative weight per release year, uniform over the range if omitted.
+
+        Raises:
+            ValueError: If a distribution is empty, has a negative weight or only zero
+                weights, or the year range is reversed.
+        """
+        if developers <= 0:
+            raise ValueError("Catalog needs at least one developer")
+        if first_year > last_year:
+            raise ValueError("First year is after last year")
+        self.developers = developers
+        self.developer_skew = developer_skew
+        self.genre_weights = genre_weights if genre_weights is not None else dict.fromkeys(GENRES, 1.0)
+        self.first_year = first_year
+        self.last_year = last_year
+        self.year_weights = (
+            year_weights if year_weights is not None else dict.fromkeys(range(first_year, last_year + 1), 1.0)
+        )
+        if not self.genre_weights or not self.year_weights:
+            raise ValueError("Genre and year distributions must not be empty")
+        for weights in (self.genre_weights.values(), self.year_weights.values()):
+            if any(weight < 0 for weight in weights) or sum(weights) <= 0:
+                raise ValueError("Genre and year weights must be non-negative with a positive sum")
+
+    def __repr__(self) -> str:
+        """Return string representation of the spec."""
+        return (
+            f"CatalogSpec({self.developers} developers, skew={self.developer_skew}, "
+            f"{len(self.genre_weights)} genres, {self.first_year}-{self.last_year})"
+        )
+
+
+def generate_catalog(size: int, spec: CatalogSpec | None = None, random_seed: int = 0) -> Iterator[Game]:
+    """Lazily generate a deterministic synthetic catalog.
+
+    Games are produced one at a time, so catalogs of millions of titles can be streamed
+    without holding them in memory. The same size, spec and seed give the same games.
+
+    Args:
+        size: Number of games to generate.
+        spec: Distributions of developers, genres and years.
+        random_seed: Seed of the private random generator.
+
+    Returns:
+        Iterator over generated games with ids `SYN_0000000`, `SYN_0000001`, ...
+    """
+    spec = spec if spec is not None else CatalogSpec()
+    rng = Random(random_seed)
+    draw = rng.random
+
+    developer_cumulative = list(accumulate(1 / rank**spec.developer_skew for rank in range(1, spec.developers + 1)))
+    developer_names = [f"Studio {number:05d}" for number in range(spec.developers)]
+    genres = list(spec.genre_weights)
+    genre_cumulative = list(accumulate(spec.genre_weights.values()))
+    years = list(spec.year_weights)
+    year_cumulative = list(accumulate(spec.year_weights.values()))
+
+    for number in range(size):
+        developer = developer_names[bisect(developer_cumulative, draw() * developer_cumulative[-1])]
+        genre = genres[bisect(genre_cumulative, draw() * genre_cumulative[-1])]
+        year = years[bisect(year_cumulative, draw() * year_cumulative[-1])]
+        yield Game(f"Synthetic Game {number}", developer, year, genre, f"SYN_{number:07d}")
+
+
+def fill_store(store: "GameStore | SQLiteGameStore", games: Iterable[Game], price: int = 1000, copies: int = 1) -> int:
+    """Stream games into a store.
+
+    Args:
+        store: In-memory or SQLite store to fill; a quiet store avoids printing per copy.
+        games: Games to add.
+        price: Price of every added game.
+        copies: Number of copies added per game.
+
+    Returns:
+        Number of copies added.
+    """
+    added = 0
+    add_game = store.add_game
+    for game in games:
+        for _ in range(copies):
+            add_game(game, price)
+        added += copies
+    return added
+
+
+def write_catalog(path: str, games: Iterable[Game]) -> int:
+    """Stream games into a CSV catalog file.
+
+    Args:
+        path: Path of the CSV file to create.
+        games: Games to write.
+
+    Returns:
+        Number of games written.
+    """
+    written = 0
+    with open(path, "w", newline="", encoding="utf-8") as stream:
+        writer = csv.writer(stream)
+        writer.writerow(CATALOG_FIELDS)
+        for game in games:
+            writer.writerow([game.title, game.developer, game.release_year, game.genre, game.game_id])
+            written += 1
+    return written
+
+
+def read_catalog(path: str) -> Iterator[Game]:
+    """Stream games from a CSV catalog file.
+
+    Args:
+        path: Path of a file written by `write_catalog`.
+
+    Returns:
+        Iterator over games in file order.
+
+    Raises:
+        ValueError: If the file header does not match the catalog format.
+    """
+    with open(path, newline="", encoding="utf-8") as stream:
+        reader = csv.reader(stream)
+        if next(reader, None) != CATALOG_FIELDS:
+            raise ValueError("Not a catalog file")
+        for title, developer, release_year, genre, game_id in reader:
+            yield Game(title, developer, int(release_year), genre, game_id)
@@ -0,0 +1,176 @@
+from array import array
+from typing import NamedTuple
+
+CHANGE_KINDS = ["add", "remove", "buy", "return", "price"]
+
+ADD, REMOVE, BUY, RETURN, PRICE = range(len(CHANGE_KINDS))
+
+
+class Change(NamedTuple):
+    """Single store mutation read from a change feed.
+
+    Attributes:
+        sequence: Position of the change in the feed, starting at 0.
+        kind: Change kind from CHANGE_KINDS.
+        game_id: Identifier of the affected game.
+        step: Store clock step of the change.
+        value: Price for "add", "buy", "return" and "price" changes, 0 for "remove".
+    """
+
+    sequence: int
+    kind: str
+    game_id: str
+    step: int
+    value: int
+
+
+class ChangeFeed:
+    """Fixed-size ring buffer of store mutations.
+
+    The writer stores each change into preallocated parallel arrays in O(1) and never
+    waits for readers; records are built only when a subscriber polls. Subscribers that
+    fall more than `capacity` changes behind lose the oldest ones.
+    """
+
+    def __init__(self, capacity: int = 1 << 16) -> None:
+        """Initialize an empty feed.
+
+        Args:
+            capacity: Number of changes kept, rounded up to a power of two.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("Feed capacity must be positive")
+        size = 1 << (capacity - 1).bit_length()
+        self._mask = size - 1
+        self._kinds = bytearray(size)
+        self._game_ids: list[str] = [""] * size
+        self._steps = array("q", bytes(8 * size))
+        self._values = array("q", bytes(8 * size))
+        self.head = 0
+
+    def __len__(self) -> int:
+        """Return number of changes currently held.
+
+        Returns:
+            Count of retained changes.
+        """
+        return min(self.head, self._mask + 1)
+
+    def __repr__(self) -> str:
+        """Return summary of the feed.
+
+        Returns:
+            String with the number of written changes and the capacity.
+        """
+        return f"ChangeFeed: {self.head} changes written, capacity {self._mask + 1}"
+
+    @property
+    def capacity(self) -> int:
+        """Return number of changes the feed retains."""
+        return self._mask + 1
+
+    def append(self, kind: int, game_id: str, step: int, value: int = 0) -> None:
+        """Record a change.
+
+        Args:
+            kind: Change code, e.g. ADD or BUY.
+            game_id: Identifier of the affected game.
+            step: Store clock step of the change.
+            value: Price involved in the change.
+        """
+        slot = self.head & self._mask
+        self._kinds[slot] = kind
+        self._game_ids[slot] = game_id
+        self._steps[slot] = step
+        self._values[slot] = value
+        self.head += 1
+
+    def subscribe(self, from_start: bool = False) -> "Subscription":
+        """Return a new cursor over the feed.
+
+        Args:
+            from_start: Whether to start at the oldest retained change instead of the next one.
+
+        Returns:
+            Subscription reading changes in order.
+        """
+        return Subscription(self, self.head - len(self) if from_start else self.head)
+
+    def read(self, start: int, stop: int) -> list[Change]:
+        """Return retained changes with sequences in `[start, stop)`.
+
+        Args:
+            start: First sequence, not older than the oldest retained change.
+            stop: Sequence after the last one, not beyond `head`.
+
+        Returns:
+            Changes in order.
+        """
+        mask = self._mask
+        kinds = self._kinds
+        game_ids = self._game_ids
+        steps = self._steps
+        values = self._values
+        return [
+            Change(
+                sequence,
+                CHANGE_KINDS[kinds[sequence & mask]],
+                game_ids[sequence & mask],
+                steps[sequence & mask],
+                values[sequence & mask],
+            )
+            for sequence in range(start, stop)
+        ]
+
+
+class Subscription:
+    """Independent cursor of one consumer over a change feed.
+
+    Attributes:
+        cursor: Sequence of the next change to read.
+        missed: Number of changes overwritten before this consumer read them.
+    """
+
+    def __init__(self, feed: ChangeFeed, cursor: int) -> None:
+        """Initialize cursor.
+
+        Args:
+            feed: Feed to read.
+            cursor: Sequence of the first change to read.
+        """
+        self._feed = feed
+        self.cursor = cursor
+        self.missed = 0
+
+    def __repr__(self) -> str:
+        """Return string representation of the subscription."""
+        return f"Subscription(cursor={self.cursor}, lag={self.lag}, missed={self.missed})"
+
+    @property
+    def lag(self) -> int:
+        """Return number of written changes not read yet."""
+        return self._feed.head - self.cursor
+
+    def poll(self, max_changes: int = 1024) -> list[Change]:
+        """Read the next batch of changes and advance the cursor.
+
+        Changes overwritten since the last poll are skipped and counted in `missed`.
+
+        Args:
+            max_changes: Largest batch size.
+
+        Returns:
+            Up to max_changes changes in order, empty if the consumer is up to date.
+        """
+        feed = self._feed
+        oldest = feed.head - len(feed)
+        if self.cursor < oldest:
+            self.missed += oldest - self.cursor
+            self.cursor = oldest
+        stop = min(feed.head, self.cursor + max_changes)
+        changes = feed.read(self.cursor, stop)
+        self.cursor = stop
+        return changes
@@ -0,0 +1,182 @@
+import os
+import pickle
+
+from random import setstate
+from threading import Thread
+from typing import Any
+
+from src.game_dict import DictByKey
+from src.game_store import GameStore
+from src.simulation import run_steps
+
+CHECKPOINT_MAGIC = b"GSCP"
+
+CHECKPOINT_VERSION = 2
+
+RUN_SUFFIX = ".run"
+
+
+class Checkpointer:
+    """Saves simulation checkpoints every `interval` steps.
+
+    A checkpoint holds the store, the state of the global `random` generator, the next
+    step index and the pricing engine. The immutable inputs of the run, the workload and
+    the spec sampler, are written once by `start` to the path with RUN_SUFFIX, so each
+    checkpoint only adds the cursor into them. The run pauses only to pickle the state
+    in memory; a background thread writes it to a temporary file and renames it over
+    the previous checkpoint, so the file on disk is always a complete checkpoint.
+    """
+
+    def __init__(self, path: str, interval: int = 100_000) -> None:
+        """Initialize checkpointer.
+
+        Args:
+            path: Checkpoint file path, overwritten by each checkpoint.
+            interval: Number of simulation steps between checkpoints.
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("Checkpoint interval must be positive")
+        self.path = path
+        self.interval = interval
+        self.saved = 0
+        self._writer: Thread | None = None
+        self._error: OSError | None = None
+
+    def __repr__(self) -> str:
+        """Return string representation of the checkpointer."""
+        return f"Checkpointer({self.path!r}, every {self.interval} steps, {self.saved} saved)"
+
+    def start(self, store: GameStore, run: dict[str, Any]) -> None:
+        """Check a run can be checkpointed and write its immutable inputs in the background.
+
+        Secondary index keys are pickled with the store, so they must be importable
+        functions; this is checked before the first step instead of at the first
+        checkpoint.
+
+        Args:
+            store: Store of the run.
+            run: Inputs that never change during the run, e.g. the workload.
+
+        Raises:
+            ValueError: If an index key or a run input cannot be pickled.
+        """
+        for name, index in store._indexes.items():
+            if isinstance(index, DictByKey):
+                try:
+                    pickle.dumps(index._key_func)
+                except (pickle.PicklingError, AttributeError, TypeError) as error:
+                    raise ValueError(f"Index {name} key cannot be pickled; use a module-level function") from error
+        try:
+            data = _dump(run)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise ValueError(f"Run inputs cannot be pickled: {error}") from error
+        self._start_writer(data, self.path + RUN_SUFFIX)
+
+    def save(self, state: dict[str, Any]) -> None:
+        """Pickle a simulation state and write it in the background.
+
+        Waits for the previous checkpoint to be written first.
+
+        Args:
+            state: Simulation state to save.
+
+        Raises:
+            OSError: If writing the previous checkpoint failed.
+        """
+        self._start_writer(_dump(state), self.path)
+        self.saved += 1
+
+    def wait(self) -> None:
+        """Block until the last checkpoint is on disk.
+
+        Raises:
+            OSError: If writing it failed.
+        """
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _start_writer(self, data: bytes, path: str) -> None:
+        """Wait for the previous write, then write data to a path in a background thread."""
+        self.wait()
+        self._writer = Thread(target=self._write, args=(data, path), daemon=True)
+        self._writer.start()
+
+    def _write(self, data: bytes, path: str) -> None:
+        """Write a checkpoint to a temporary file, sync it and rename it over the path."""
+        temporary = f"{path}.tmp"
+        try:
+            with open(temporary, "wb") as stream:
+                stream.write(data)
+                stream.flush()
+                os.fsync(stream.fileno())
+            os.replace(temporary, path)
+        except OSError as error:
+            self._error = error
+
+
+def _dump(state: dict[str, Any]) -> bytes:
+    """Return a pickled state behind the checkpoint magic and version."""
+    return CHECKPOINT_MAGIC + pickle.dumps((CHECKPOINT_VERSION, state), pickle.HIGHEST_PROTOCOL)
+
+
+def load_checkpoint(path: str) -> dict[str, Any]:
+    """Read a simulation state saved by a Checkpointer.
+
+    Checkpoints are pickles: load only files written by trusted runs.
+
+    Args:
+        path: Checkpoint file path.
+
+    Returns:
+        Saved simulation state.
+
+    Raises:
+        ValueError: If the file is not a checkpoint of a supported version.
+    """
+    with open(path, "rb") as stream:
+        if stream.read(len(CHECKPOINT_MAGIC)) != CHECKPOINT_MAGIC:
+            raise ValueError("Not a simulation checkpoint")
+        version, state = pickle.load(stream)
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {version}")
+    return state
+
+
+def resume(path: str, checkpoint: Checkpointer | None = None) -> GameStore:
+    """Continue a simulation from a checkpoint.
+
+    The final store matches the one of the uninterrupted run exactly, since the store,
+    the random generator and the pricing engine continue from their saved state. The
+    workload and the spec sampler are read from the file next to the checkpoint.
+
+    Args:
+        path: Checkpoint file path.
+        checkpoint: Optional checkpointer for the rest of the run.
+
+    Returns:
+        Store in its final state.
+    """
+    state = load_checkpoint(path)
+    run = load_checkpoint(path + RUN_SUFFIX)
+    setstate(state["random_state"])
+    store: GameStore = state["store"]
+    if state["verbose"]:
+        print(f"🔁Resuming simulation at step {state['next_step'] + 1}/{state['steps']}")
+    return run_steps(
+        store,
+        state["next_step"],
+        state["steps"],
+        run["workload"],
+        run["sampler"],
+        None,
+        state["verbose"],
+        state["pricing"],
+        checkpoint,
+    )
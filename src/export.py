@@ -0,0 +1,241 @@
+import csv
+import gzip
+import io
+import json
+import struct
+import sys
+
+from array import array
+from itertools import accumulate
+from itertools import islice
+from typing import IO
+from typing import Iterator
+from typing import cast
+
+from src.game import Game
+from src.game_store import GameStore
+
+EXPORT_FIELDS = ["game_id", "title", "developer", "release_year", "genre", "copies", "price"]
+
+STRING_COLUMNS = ("game_id", "title", "developer", "genre")
+
+INTEGER_COLUMNS = ("release_year", "copies", "price")
+
+CHUNK_ROWS = 8192
+
+BUFFER_SIZE = 1 << 20
+
+COLUMNAR_MAGIC = b"GSCL"
+
+COLUMNAR_VERSION = 1
+
+COLUMNAR_HEADER = struct.Struct("<4sH")
+
+ROW_GROUP = struct.Struct("<I")
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def iter_titles(store: GameStore) -> Iterator[tuple[Game, int, int]]:
+    """Stream the inventory grouped by title straight from the ID index.
+
+    Args:
+        store: Store to read; it must not change while the iterator is consumed.
+
+    Returns:
+        Iterator over (game, copies in stock, price) per title.
+    """
+    by_id = store._by_id
+    prices = store._prices
+    for game_id in by_id:
+        copies = by_id[game_id]
+        game = copies[0]
+        yield game, len(copies), prices[game]
+
+
+def _chunks(store: GameStore, chunk_rows: int) -> Iterator[list[tuple[Game, int, int]]]:
+    """Group titles into lists of at most chunk_rows."""
+    titles = iter_titles(store)
+    while chunk := list(islice(titles, chunk_rows)):
+        yield chunk
+
+
+def _open(path: str, compress: bool | None) -> IO[bytes]:
+    """Open an export file for writing, gzip-compressed if asked or if the path ends with .gz."""
+    if compress or (compress is None and path.endswith(".gz")):
+        return cast(IO[bytes], gzip.open(path, "wb", compresslevel=6))
+    return open(path, "wb", buffering=BUFFER_SIZE)
+
+
+def export_csv(store: GameStore, path: str, compress: bool | None = None, chunk_rows: int = CHUNK_ROWS) -> int:
+    """Write one CSV row per title with EXPORT_FIELDS columns.
+
+    Rows are formatted a chunk at a time and each chunk is written with one call, so
+    memory use does not grow with the inventory.
+
+    Args:
+        store: Store to export.
+        path: Output file path.
+        compress: Whether to gzip the file; decided by a ".gz" suffix if omitted.
+        chunk_rows: Number of titles formatted per write.
+
+    Returns:
+        Number of titles written.
+    """
+    written = 0
+    with _open(path, compress) as stream:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        for chunk in _chunks(store, chunk_rows):
+            writer.writerows(
+                (game.game_id, game.title, game.developer, game.release_year, game.genre, copies, price)
+                for game, copies, price in chunk
+            )
+            stream.write(buffer.getvalue().encode())
+            buffer.seek(0)
+            buffer.truncate()
+            written += len(chunk)
+        stream.write(buffer.getvalue().encode())
+    return written
+
+
+def export_jsonl(store: GameStore, path: str, compress: bool | None = None, chunk_rows: int = CHUNK_ROWS) -> int:
+    """Write one JSON object per line and title with EXPORT_FIELDS keys.
+
+    Args:
+        store: Store to export.
+        path: Output file path.
+        compress: Whether to gzip the file; decided by a ".gz" suffix if omitted.
+        chunk_rows: Number of titles formatted per write.
+
+    Returns:
+        Number of titles written.
+    """
+    written = 0
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    with _open(path, compress) as stream:
+        for chunk in _chunks(store, chunk_rows):
+            lines = [
+                encode(
+                    {
+                        "game_id": game.game_id,
+                        "title": game.title,
+                        "developer": game.developer,
+                        "release_year": game.release_year,
+                        "genre": game.genre,
+                        "copies": copies,
+                        "price": price,
+                    }
+                )
+                for game, copies, price in chunk
+            ]
+            lines.append("")
+            stream.write("\n".join(lines).encode())
+            written += len(chunk)
+    return written
+
+
+def _little_endian(values: array) -> bytes:
+    """Return array contents in little-endian byte order."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def export_columnar(store: GameStore, path: str, compress: bool | None = None, chunk_rows: int = CHUNK_ROWS) -> int:
+    """Write titles in a simple columnar format.
+
+    Layout: a header (magic, version) followed by row groups of up to chunk_rows titles.
+    A row group stores its row count and then every column of EXPORT_FIELDS in order:
+    string columns as rows + 1 uint32 end offsets followed by the UTF-8 blob, integer
+    columns as int64 values, all little-endian. Read it with `read_columnar`.
+
+    Args:
+        store: Store to export.
+        path: Output file path.
+        compress: Whether to gzip the file; decided by a ".gz" suffix if omitted.
+        chunk_rows: Number of titles per row group.
+
+    Returns:
+        Number of titles written.
+    """
+    written = 0
+    with _open(path, compress) as stream:
+        stream.write(COLUMNAR_HEADER.pack(COLUMNAR_MAGIC, COLUMNAR_VERSION))
+        for chunk in _chunks(store, chunk_rows):
+            games = [game for game, _, _ in chunk]
+            integers = {
+                "release_year": [game.release_year for game in games],
+                "copies": [copies for _, copies, _ in chunk],
+                "price": [price for _, _, price in chunk],
+            }
+            parts = [ROW_GROUP.pack(len(chunk))]
+            for field in EXPORT_FIELDS:
+                if field in INTEGER_COLUMNS:
+                    parts.append(_little_endian(array("q", integers[field])))
+                    continue
+                data = [getattr(game, field).encode() for game in games]
+                offsets = array("I", [0])
+                offsets.extend(accumulate(map(len, data)))
+                parts.append(_little_endian(offsets))
+                parts.extend(data)
+            stream.write(b"".join(parts))
+            written += len(chunk)
+    return written
+
+
+def _read_exactly(stream: IO[bytes], size: int) -> bytes:
+    """Read exactly size bytes.
+
+    Raises:
+        ValueError: If the file ends first.
+    """
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated columnar file")
+    return data
+
+
+def _read_array(stream: IO[bytes], typecode: str, count: int) -> array:
+    """Read count little-endian values of an array type."""
+    values = array(typecode)
+    values.frombytes(_read_exactly(stream, values.itemsize * count))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def read_columnar(path: str) -> Iterator[dict[str, list]]:
+    """Stream row groups of a file written by `export_columnar`, gzip-compressed or not.
+
+    Args:
+        path: Path of the columnar file.
+
+    Returns:
+        Iterator over row groups, each a map of EXPORT_FIELDS to column values.
+
+    Raises:
+        ValueError: If the file is not a columnar export or is truncated.
+    """
+    with open(path, "rb") as probe:
+        compressed = probe.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    stream = cast(IO[bytes], gzip.open(path, "rb")) if compressed else open(path, "rb", buffering=BUFFER_SIZE)
+    with stream:
+        header = stream.read(COLUMNAR_HEADER.size)
+        if len(header) != COLUMNAR_HEADER.size or COLUMNAR_HEADER.unpack(header) != (COLUMNAR_MAGIC, COLUMNAR_VERSION):
+            raise ValueError("Not a columnar export")
+        while row_count := stream.read(ROW_GROUP.size):
+            if len(row_count) != ROW_GROUP.size:
+                raise ValueError("Truncated columnar file")
+            (rows,) = ROW_GROUP.unpack(row_count)
+            group: dict[str, list] = {}
+            for field in EXPORT_FIELDS:
+                if field in STRING_COLUMNS:
+                    offsets = _read_array(stream, "I", rows + 1)
+                    blob = _read_exactly(stream, offsets[-1])
+                    group[field] = [blob[start:stop].decode() for start, stop in zip(offsets, offsets[1:])]
+                else:
+                    group[field] = _read_array(stream, "q", rows).tolist()
+            yield group
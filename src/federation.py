@@ -0,0 +1,250 @@
+import math
+
+from typing import Hashable
+
+from src.change_feed import Subscription
+from src.game import Game
+from src.game import game_type
+from src.game_collection import GameCollection
+from src.game_store import GameStore
+
+
+class StoreFederation:
+    """Several GameStores working as one inventory.
+
+    A global index maps each game_id to the stores that have it in stock, so finding
+    stock takes one lookup instead of a search in every store. The index follows the
+    change feed of every store, so stores may also be changed directly: each lookup
+    first applies the changes made since the previous one, and a store whose feed
+    overwrote changes before they were read is indexed again from its stock.
+    """
+
+    def __init__(self, verbose: bool = True) -> None:
+        """Initialize an empty federation.
+
+        Args:
+            verbose: Whether routing decisions are printed.
+        """
+        self._verbose = verbose
+        self._stores: dict[str, GameStore] = {}
+        self._locations: dict[str, tuple[float, float]] = {}
+        self._availability: dict[str, dict[str, None]] = {}
+        self._subscriptions: dict[str, Subscription] = {}
+
+    def __len__(self) -> int:
+        """Return number of stores in the federation.
+
+        Returns:
+            Count of stores.
+        """
+        return len(self._stores)
+
+    def __getitem__(self, name: str) -> GameStore:
+        """Return a store by name.
+
+        Args:
+            name: Store name.
+
+        Returns:
+            The store.
+        """
+        return self._stores[name]
+
+    def __repr__(self) -> str:
+        """Return summary of the federation.
+
+        Returns:
+            String with store count and the number of titles in stock anywhere.
+        """
+        self._sync()
+        return f"Store federation: {len(self._stores)} stores, {len(self._availability)} titles in stock"
+
+    def add_store(self, name: str, store: GameStore, location: tuple[float, float] = (0.0, 0.0)) -> None:
+        """Join a store to the federation, indexing its current stock.
+
+        The store's change feed is started if needed and the federation subscribes to it.
+
+        Args:
+            name: Unique store name.
+            store: Store to join.
+            location: Coordinates used to route purchases to the nearest store.
+
+        Raises:
+            ValueError: If a store with this name already exists.
+        """
+        if name in self._stores:
+            raise ValueError(f"Store {name} already exists")
+        self._stores[name] = store
+        self._locations[name] = location
+        self._subscriptions[name] = store.change_feed().subscribe()
+        self._index(name)
+
+    def where(self, game: Game) -> dict[str, int]:
+        """Return stores with a game in stock.
+
+        Args:
+            game: Game to look for.
+
+        Returns:
+            Map of store name to copies in stock, empty if out of stock everywhere.
+        """
+        self._sync()
+        found = {}
+        for name in self._availability.get(game.game_id, ()):
+            copies = self._stores[name].copies(game.game_id)
+            if copies:
+                found[name] = copies
+        return found
+
+    def add_game(self, name: str, game: Game, price: int) -> None:
+        """Add a game copy to a store.
+
+        Args:
+            name: Store name.
+            game: Game object to add.
+            price: Price in rubles for the game.
+        """
+        self._stores[name].add_game(game, price)
+
+    def remove_game(self, name: str, game: Game) -> bool:
+        """Remove a game copy from a store.
+
+        Args:
+            name: Store name.
+            game: Game object to remove.
+
+        Returns:
+            True if removal successful, False if game not found.
+        """
+        return self._stores[name].remove_game(game)
+
+    @game_type
+    def buy_game(
+        self,
+        game: Game,
+        client_balance: int,
+        near: tuple[float, float] | None = None,
+    ) -> str | None:
+        """Sell a copy from the best store that has one.
+
+        Among stores with the game in stock at an affordable price, the nearest one
+        is chosen when the client location is given, the cheapest one otherwise.
+
+        Args:
+            game: Game object to purchase.
+            client_balance: Client's available balance in rubles.
+            near: Optional client coordinates.
+
+        Returns:
+            Name of the store that sold the copy, None if no store could.
+        """
+        self._sync()
+        prices: dict[str, int] = {}
+        for name in self._availability.get(game.game_id, ()):
+            price = self._stores[name].price(game.game_id)
+            if price is not None and price <= client_balance:
+                prices[name] = price
+        candidates = list(prices)
+        if not candidates:
+            if self._verbose:
+                print(f'❌"{game.title}" sell failed:')
+                print("\t⚠️no store can sell it")
+            return None
+        if near is not None:
+            name = min(candidates, key=lambda candidate: math.dist(self._locations[candidate], near))
+        else:
+            name = min(candidates, key=prices.__getitem__)
+        if self._verbose:
+            print(f'🧭"{game.title}" routed to store {name}')
+        self._stores[name].buy_game(game, client_balance)
+        return name
+
+    @game_type
+    def transfer(self, game: Game, source: str, target: str, copies: int = 1) -> bool:
+        """Move copies of a game between stores, all or nothing.
+
+        Copies keep the source price unless the target already sells the title.
+
+        Args:
+            game: Game object to move.
+            source: Name of the store giving the copies.
+            target: Name of the store receiving the copies.
+            copies: Number of copies to move.
+
+        Returns:
+            True if every copy was moved, False if the source has too few and nothing moved.
+
+        Raises:
+            ValueError: If copies is not positive or both stores are the same.
+        """
+        if copies <= 0:
+            raise ValueError("Number of copies must be positive")
+        if source == target:
+            raise ValueError("Source and target are the same store")
+        giver = self._stores[source]
+        receiver = self._stores[target]
+        available = giver.copies(game.game_id) if game in giver else 0
+        source_price = giver.price(game.game_id)
+        if source_price is None or available < copies:
+            if self._verbose:
+                print(f'❌"{game.title}" transfer failed:')
+                print(f"\t⚠️store {source} has {available} of {copies} copies")
+            return False
+        target_price = receiver.price(game.game_id)
+        price = target_price if target_price is not None else source_price
+        for _ in range(copies):
+            giver.remove_game(game, False)
+            receiver.add_game(game, price)
+        if self._verbose:
+            print(f'🚚{copies} copies of "{game.title}" moved from {source} to {target}')
+        return True
+
+    def search(self, index: str, key: Hashable) -> dict[str, GameCollection]:
+        """Search every store's secondary index.
+
+        Args:
+            index: Index name, e.g. "developer", "release_year" or "genre".
+            key: Key to look up.
+
+        Returns:
+            Map of store name to matching copies, only for stores with matches.
+        """
+        found = {}
+        for name, store in self._stores.items():
+            result = store.search(index, key)
+            if len(result):
+                found[name] = result
+        return found
+
+    def _index(self, name: str) -> None:
+        """Add every title a store has in stock to the availability index."""
+        for game in self._stores[name]:
+            self._availability.setdefault(game.game_id, {})[name] = None
+
+    def _sync(self) -> None:
+        """Apply the changes every store made since the previous lookup."""
+        for name, subscription in self._subscriptions.items():
+            while subscription.lag:
+                missed = subscription.missed
+                changes = subscription.poll()
+                if subscription.missed != missed:
+                    for game_id in list(self._availability):
+                        self._refresh(name, game_id)
+                    self._index(name)
+                    subscription.cursor += subscription.lag
+                    break
+                for change in changes:
+                    if change.kind == "add":
+                        self._availability.setdefault(change.game_id, {})[name] = None
+                    elif change.kind == "remove":
+                        self._refresh(name, change.game_id)
+
+    def _refresh(self, name: str, game_id: str) -> None:
+        """Drop a store from the availability of a title it no longer stocks."""
+        if self._stores[name].copies(game_id):
+            return
+        stores = self._availability.get(game_id)
+        if stores is not None:
+            stores.pop(name, None)
+            if not stores:
+                del self._availability[game_id]
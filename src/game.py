@@ -1,5 +1,12 @@
+import functools
+import inspect
+
+from contextlib import contextmanager
 from typing import Any
 from typing import Callable
+from typing import Iterator
+
+_type_checks_enabled: bool = True
 
 
 class Game:
@@ -42,16 +49,17 @@ class Game:
         Returns:
             True if all attributes match, False otherwise.
         """
+        if self is other:
+            return True
         if not isinstance(other, Game):
             return False
-        matches = [
-            self.title == other.title,
-            self.developer == other.developer,
-            self.release_year == other.release_year,
-            self.genre == other.genre,
-            self.game_id == other.game_id,
-        ]
-        return all(matches)
+        return (
+            self.game_id == other.game_id
+            and self.title == other.title
+            and self.developer == other.developer
+            and self.release_year == other.release_year
+            and self.genre == other.genre
+        )
 
     def __hash__(self) -> int:
         """Return hash based on game_id for use in collections.
@@ -62,9 +70,54 @@ class Game:
         return hash(self.game_id)
 
 
+def set_type_checks(enabled: bool) -> None:
+    """Globally enable or disable the `game_type` argument validation.
+
+    Args:
+        enabled: Whether decorated methods should validate their Game argument.
+    """
+    global _type_checks_enabled
+    _type_checks_enabled = enabled
+
+
+def type_checks_enabled() -> bool:
+    """Return whether `game_type` validation is currently enabled.
+
+    Returns:
+        True if decorated methods validate their Game argument.
+    """
+    return _type_checks_enabled
+
+
+@contextmanager
+def type_checks_disabled() -> Iterator[None]:
+    """Temporarily disable `game_type` validation for a trusted bulk path.
+
+    Yields:
+        None; validation is restored to its previous state on exit.
+    """
+    previous = _type_checks_enabled
+    set_type_checks(False)
+    try:
+        yield
+    finally:
+        set_type_checks(previous)
+
+
 def game_type(func: Callable) -> Callable:
-    """Decorator to ensure second argument is a Game instance."""
+    """Decorator to ensure second argument is a Game instance.
+
+    The wrapper keeps the metadata and signature of the decorated method, and the
+    raw method stays reachable through `__wrapped__` for trusted callers. Under
+    `python -O` the decorator returns the method unchanged, so validation costs nothing.
+    """
+    if not __debug__:
+        return func
+    signature = inspect.signature(func)
+    # the Game parameter is resolved once here; `bind` is only needed when it is passed by keyword
+    name = list(signature.parameters)[1]
 
+    @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         """Wrapper function that validates argument type.
 
@@ -78,8 +131,10 @@ def game_type(func: Callable) -> Callable:
         Raises:
             TypeError: If second argument is not a Game instance.
         """
-        if len(args) > 1 and not isinstance(args[1], Game):
-            raise TypeError("Game must be of type Game")
+        if _type_checks_enabled:
+            game = args[1] if len(args) > 1 else signature.bind(*args, **kwargs).arguments[name]
+            if not isinstance(game, Game):
+                raise TypeError("Game must be of type Game")
         return func(*args, **kwargs)
 
     return wrapper
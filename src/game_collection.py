@@ -88,9 +88,25 @@ class GameCollection:
         Raises:
             ValueError: If game is not in collection.
         """
-        if game not in self._games:
+        if not self.discard(game):
             raise ValueError("Game is not in collection")
-        self._games.remove(game)
+
+    def discard(self, game: Game) -> bool:
+        """Remove the first copy of a game in a single scan, if present.
+
+        Worst case O(n) comparisons, stopping at the first equal copy.
+
+        Args:
+            game: Game object to remove.
+
+        Returns:
+            True if a copy was removed, False if game is not in collection.
+        """
+        try:
+            self._games.remove(game)
+        except ValueError:
+            return False
+        return True
 
     @game_type
     def index(self, game: Game) -> int:
@@ -1,6 +1,9 @@
 from abc import ABC
 from abc import abstractmethod
+from operator import attrgetter
+from typing import Callable
 from typing import Dict
+from typing import Hashable
 from typing import Iterator
 
 from src.game import Game
@@ -8,18 +11,18 @@ from src.game import game_type
 from src.game_collection import GameCollection
 
 
-
 class GameDict(ABC):
     """Abstract base class for dictionary-like collections of games.
 
-    Organizes games by a key (either string or integer) into GameCollection instances.
+    Organizes games by a key (a string, an integer or a tuple of them for composite keys)
+    into GameCollection instances.
     """
 
     def __init__(self) -> None:
         """Initialize an empty game dictionary."""
-        self._dct: Dict[int | str , GameCollection] = {}
+        self._dct: Dict[Hashable, GameCollection] = {}
 
-    def __getitem__(self, key: int | str) -> GameCollection:
+    def __getitem__(self, key: Hashable) -> GameCollection:
         """Return game collection associated with the key.
 
         Args:
@@ -30,7 +33,7 @@ class GameDict(ABC):
         """
         return self._dct[key]
 
-    def __contains__(self, key: int | str) -> bool:
+    def __contains__(self, key: Hashable) -> bool:
         """Check if key exists in dictionary.
 
         Args:
@@ -49,7 +52,7 @@ class GameDict(ABC):
         """
         return len(self._dct)
 
-    def __iter__(self) -> Iterator[int | str]:
+    def __iter__(self) -> Iterator[Hashable]:
         """Return iterator over dictionary keys.
 
         Returns:
@@ -87,15 +90,29 @@ class GameDict(ABC):
         Raises:
             ValueError: If game is not found in dictionary.
         """
-        key = self._get_key(game)
-        if key not in self._dct or game not in self._dct[key]:
+        if not self.discard(game):
             raise ValueError("Game is not in dict")
 
-        self._dct[key].remove_game(game)
-        if len(self._dct[key]) == 0:
+    def discard(self, game: Game) -> bool:
+        """Remove a copy of a game in a single pass over its bucket, if present.
+
+        One hash lookup plus at most one scan of the key's bucket, O(b) for a bucket of b copies.
+
+        Args:
+            game: Game object to remove.
+
+        Returns:
+            True if a copy was removed, False if game is not in dictionary.
+        """
+        key = self._get_key(game)
+        bucket = self._dct.get(key)
+        if bucket is None or not bucket.discard(game):
+            return False
+        if len(bucket) == 0:
             del self._dct[key]
+        return True
 
-    def search(self, key: int | str) -> GameCollection:
+    def search(self, key: Hashable) -> GameCollection:
         """Search for games by key.
 
         Args:
@@ -107,14 +124,14 @@ class GameDict(ABC):
         return self._dct.get(key, GameCollection())
 
     @abstractmethod
-    def _get_key(self, game: Game) -> int | str:
+    def _get_key(self, game: Game) -> Hashable:
         """Abstract method to extract key from a game.
 
         Args:
             game: Game object to extract key from.
 
         Returns:
-            Key value (string or integer) for the game.
+            Key value (string, integer or tuple) for the game.
 
         Raises:
             NotImplementedError: Must be implemented by subclass.
@@ -180,3 +197,37 @@ class DictByGenre(GameDict):
             Game's genre.
         """
         return game.genre
+
+
+class DictByKey(GameDict):
+    """Dictionary that organizes games by an arbitrary key function.
+
+    Key functions may return tuples to build composite indexes, e.g. by (developer, genre).
+    """
+
+    def __init__(self, key_func: Callable[[Game], Hashable]) -> None:
+        """Initialize an empty dictionary keyed by a function of the game.
+
+        Args:
+            key_func: Function extracting the key from a game.
+        """
+        super().__init__()
+        self._key_func = key_func
+
+    def _get_key(self, game: Game) -> Hashable:
+        """Extract key using the key function.
+
+        Args:
+            game: Game object to extract key from.
+
+        Returns:
+            Key returned by the key function.
+        """
+        return self._key_func(game)
+
+
+BUILTIN_INDEX_KEYS: dict[str, Callable[[Game], Hashable]] = {
+    "developer": attrgetter("developer"),
+    "release_year": attrgetter("release_year"),
+    "genre": attrgetter("genre"),
+}
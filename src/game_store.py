@@ -1,31 +1,82 @@
+from collections import OrderedDict
+from typing import Callable
+from typing import Hashable
 from typing import Iterator
 
+from src.change_feed import ADD
+from src.change_feed import BUY
+from src.change_feed import PRICE
+from src.change_feed import REMOVE
+from src.change_feed import RETURN
+from src.change_feed import ChangeFeed
 from src.game import Game
 from src.game import game_type
 from src.game_collection import GameCollection
+from src.game_dict import BUILTIN_INDEX_KEYS
 from src.game_dict import DictByDeveloper
 from src.game_dict import DictByGenre
 from src.game_dict import DictByID
+from src.game_dict import DictByKey
 from src.game_dict import DictByReleaseYear
+from src.game_dict import GameDict
+from src.ledger import SalesLedger
+from src.memory import deep_sizeof
+from src.price_history import PriceHistory
+from src.price_history import fits_int64
+from src.rankings import CountRanking
+from src.snapshot import PersistentIndexes
+from src.snapshot import StoreSnapshot
+from src.timer_wheel import TimerWheel
+from src.title_columns import TitleColumns
+
+BUILTIN_INDEXES: dict[str, type[GameDict]] = {
+    "developer": DictByDeveloper,
+    "release_year": DictByReleaseYear,
+    "genre": DictByGenre,
+}
+
+RETURN_PERIOD = 14
 
 
 class GameStore:
     """Store for managing game inventory, sales, and statistics.
 
     Tracks games through multiple indexing strategies and handles transactions.
+    Secondary indexes live in a registry: the built-in "developer", "release_year" and
+    "genre" indexes can be dropped, and custom ones declared with `add_index`.
     """
 
-    def __init__(self) -> None:
-        """Initialize game store with empty collections and statistics."""
+    def __init__(self, verbose: bool = True) -> None:
+        """Initialize game store with empty collections and statistics.
+
+        Args:
+            verbose: Whether operations print their log messages.
+        """
+        self._verbose = verbose
         self._all_copies: GameCollection = GameCollection()
         self._by_id: DictByID = DictByID()
-        self._by_developer: DictByDeveloper = DictByDeveloper()
-        self._by_release_year: DictByReleaseYear = DictByReleaseYear()
-        self._by_genre: DictByGenre = DictByGenre()
+        self._indexes: dict[str, GameDict] = {name: index_type() for name, index_type in BUILTIN_INDEXES.items()}
+        self._index_list: tuple[GameDict, ...] = tuple(self._indexes.values())
         self._prices: dict[Game, int] = {}
         self._profit: int = 0
         self._sold_games = 0
         self._return_games = 0
+        self._persistent: PersistentIndexes | None = None
+        self._step = 0
+        self._history: PriceHistory | None = None
+        self._ledger: SalesLedger | None = None
+        self.last_sale_id: int | None = None
+        self._next_sale_id = 0
+        self._open_sales: OrderedDict[int, tuple[str, int, int]] = OrderedDict()
+        self._open_by_game: dict[str, list[int]] = {}
+        self._stock: CountRanking | None = None
+        self._sellers: CountRanking | None = None
+        self._sellers_since = 0
+        self._holds: dict[int, tuple[Game, int]] = {}
+        self._hold_timers: TimerWheel[int] = TimerWheel()
+        self._next_hold_id = 1
+        self._feed: ChangeFeed | None = None
+        self._columns: TitleColumns | None = None
 
     def __len__(self) -> int:
         """Return total number of game copies in store.
@@ -44,7 +95,7 @@ class GameStore:
         Returns:
             True if game exists in store, False otherwise.
         """
-        return game in self._all_copies
+        return game in self._by_id.search(game.game_id)
 
     def __iter__(self) -> Iterator[Game]:
         """Return iterator over all game copies in store.
@@ -70,19 +121,64 @@ class GameStore:
         Args:
             game: Game object to add.
             price: Price in rubles for the game.
+
+        Raises:
+            ValueError: If the price is not an integer within the int64 range; the store
+                is left unchanged.
         """
+        if not fits_int64(price):
+            raise ValueError("Price must be an int64 integer")
         self._all_copies.add_game(game)
         self._by_id.add_game(game)
-        self._by_developer.add_game(game)
-        self._by_release_year.add_game(game)
-        self._by_genre.add_game(game)
+        for index in self._index_list:
+            index.add_game(game)
         self._prices[game] = price
-        print(f'📦"{game.title}" added. New price: {price} rub')
+        if self._stock is not None:
+            self._stock.increment(game)
+        if self._history is not None:
+            self._history.record_price(game.game_id, self._step, price)
+        if self._columns is not None:
+            self._columns.add(game, price)
+        if self._persistent is not None:
+            self._persistent.add(game, price)
+        if self._feed is not None:
+            self._feed.append(ADD, game.game_id, self._step, price)
+        if self._verbose:
+            print(f'📦"{game.title}" added. New price: {price} rub')
+
+    def copies(self, game_id: str) -> int:
+        """Return number of copies of a title in stock.
+
+        Args:
+            game_id: Game identifier.
+
+        Returns:
+            Copies in stock, 0 if the title is out of stock.
+        """
+        return len(self._by_id.search(game_id))
+
+    def price(self, game_id: str) -> int | None:
+        """Return current price of a title.
+
+        Args:
+            game_id: Game identifier.
+
+        Returns:
+            Price in rubles, None if the title is out of stock.
+        """
+        copies = self._by_id.search(game_id)
+        return self._prices[copies[0]] if len(copies) else None
 
     @game_type
     def remove_game(self, game: Game, print_log: bool = True) -> bool:
         """Remove a game copy from store inventory.
 
+        Every structure is updated by one discard without a separate membership check.
+        The ID index and each secondary index cost a hash lookup plus a scan of the key's
+        bucket up to the first equal copy, O(b) for b copies; copies sharing a game_id are
+        normally equal, so the scan usually stops at once. Removal from the list of all
+        n copies is a linear `list.remove`, so the whole call is O(n) in the worst case.
+
         Args:
             game: Game object to remove.
             print_log: Whether to print removal messages.
@@ -90,47 +186,92 @@ class GameStore:
         Returns:
             True if removal successful, False if game not found.
         """
-        if game.game_id not in self._by_id:
-            print(f'❌"{game.title}" remove failed:')
-            print("\t⚠️game is not in store")
+        if not self._by_id.discard(game):
+            if self._verbose:
+                print(f'❌"{game.title}" remove failed:')
+                print("\t⚠️game is not in store")
             return False
-        self._by_id.remove_game(game)
-        self._all_copies.remove_game(game)
-        self._by_developer.remove_game(game)
-        self._by_release_year.remove_game(game)
-        self._by_genre.remove_game(game)
-        if print_log:
+        self._all_copies.discard(game)
+        for index in self._index_list:
+            index.discard(game)
+        if self._stock is not None:
+            self._stock.decrement(game)
+        if self._columns is not None:
+            self._columns.remove(game.game_id)
+        if self._persistent is not None:
+            self._persistent.remove(game, (self._profit, self._sold_games, self._return_games))
+        if self._feed is not None:
+            self._feed.append(REMOVE, game.game_id, self._step)
+        if print_log and self._verbose:
             print(f'🚫copy of "{game.title}" removed from sale.')
         if game.game_id not in self._by_id:
             del self._prices[game]
-            print(f'⛔️"{game.title}" is out of stock.')
+            if self._verbose:
+                print(f'⛔️"{game.title}" is out of stock.')
         return True
 
     @game_type
-    def return_game(self, game: Game, price: int, days_passed: int) -> bool:
+    def return_game(self, game: Game, sale_id: int | None = None) -> bool:
         """Process game return from a client.
 
+        Sales made in the last RETURN_PERIOD store clock steps (days) are kept until the
+        clock moves past their return period, so the sale is found in O(1) and its
+        recorded price is refunded without the full ledger.
+
         Args:
             game: Game object being returned.
-            price: Price to refund in rubles.
-            days_passed: Days since purchase for return eligibility.
+            sale_id: Purchase id saved from `last_sale_id` after `buy_game`; the latest
+                sale of the game that was not returned yet if omitted.
 
         Returns:
-            True if return successful, False if return period expired.
+            True if return successful, False if there is no such sale, it was returned
+            already or its return period expired.
         """
-        if days_passed > 14:
-            print(f'❌"{game.title}" return failed:')
-            print("\t⚠️two weeks passed")
+        if sale_id is None:
+            open_ids = self._open_by_game.get(game.game_id)
+            if not open_ids:
+                if self._verbose:
+                    print(f'❌"{game.title}" return failed:')
+                    print("\t⚠️no purchase in the last two weeks")
+                return False
+            sale_id = open_ids[-1]
+        sale = self._open_sales.get(sale_id)
+        if sale is None or sale[0] != game.game_id:
+            if self._verbose:
+                print(f'❌"{game.title}" return failed:')
+                print("\t⚠️no such purchase in the last two weeks")
             return False
-        print(f'↩️"{game.title}" returned by client. Price: {price} rub')
+        price = sale[2]
+        if self._verbose:
+            print(f'↩️"{game.title}" returned by client. Price: {price} rub')
+        del self._open_sales[sale_id]
+        open_ids = self._open_by_game[game.game_id]
+        open_ids.remove(sale_id)
+        if not open_ids:
+            del self._open_by_game[game.game_id]
+        if self._ledger is not None and self._ledger.get(sale_id) is not None:
+            self._ledger.mark_returned(sale_id)
         self._profit -= price
         self._return_games += 1
+        if self._sellers is not None and sale_id >= self._sellers_since:
+            self._sellers.decrement(game)
+        if self._history is not None:
+            self._history.record_revenue(game.game_id, self._step, -price)
+        if self._columns is not None:
+            self._columns.sell(game.game_id, -1)
+        if self._persistent is not None:
+            self._persistent.set_counters((self._profit, self._sold_games, self._return_games))
+        if self._feed is not None:
+            self._feed.append(RETURN, game.game_id, self._step, price)
         return True
 
     @game_type
     def buy_game(self, game: Game, client_balance: int) -> bool:
         """Process game purchase by a client.
 
+        The purchase id of a successful purchase is kept in `last_sale_id` for a later
+        `return_game`.
+
         Args:
             game: Game object to purchase.
             client_balance: Client's available balance in rubles.
@@ -139,36 +280,516 @@ class GameStore:
             True if purchase successful, False if failed.
         """
         if game.game_id not in self._by_id:
-            print(f'❌"{game.title}" sell failed:')
-            print("\t⚠️Game is not in store")
+            if self._verbose:
+                print(f'❌"{game.title}" sell failed:')
+                print("\t⚠️Game is not in store")
             return False
 
         price = self._prices[game]
         if client_balance < price:
-            print(f'❌"{game.title}" sell failed:')
-            print(f"\t⚠️Not enough money ({client_balance} rub of {price} rub)")
+            if self._verbose:
+                print(f'❌"{game.title}" sell failed:')
+                print(f"\t⚠️Not enough money ({client_balance} rub of {price} rub)")
             return False
 
-        print(f'✅"{game.title}" sold for {price} rub')
+        if self._verbose:
+            print(f'✅"{game.title}" sold for {price} rub')
+        self._record_sale(game, price)
         self.remove_game(game, False)
+        return True
+
+    def _record_sale(self, game: Game, price: int) -> None:
+        """Update counters and open sales, and the optional structures that were started.
+
+        Args:
+            game: Sold game.
+            price: Price paid in rubles.
+        """
+        sale_id = self._next_sale_id
+        self._next_sale_id += 1
         self._profit += price
         self._sold_games += 1
+        self._open_sales[sale_id] = (game.game_id, self._step, price)
+        self._open_by_game.setdefault(game.game_id, []).append(sale_id)
+        if self._sellers is not None:
+            self._sellers.increment(game)
+        if self._history is not None:
+            self._history.record_revenue(game.game_id, self._step, price)
+        if self._ledger is not None:
+            self._ledger.record(game.game_id, self._step, price)
+        if self._columns is not None:
+            self._columns.sell(game.game_id)
+        self.last_sale_id = sale_id
+        if self._feed is not None:
+            self._feed.append(BUY, game.game_id, self._step, price)
+
+    @game_type
+    def reserve(self, game: Game, ttl: int) -> int | None:
+        """Hold a copy for a client while payment runs.
+
+        The copy leaves the inventory at its current price until the hold is committed,
+        released, or expires after ttl store clock steps.
+
+        Args:
+            game: Game object to hold.
+            ttl: Number of steps the hold lasts.
+
+        Returns:
+            Hold id, None if the game is not in store.
+
+        Raises:
+            ValueError: If ttl is not positive.
+        """
+        if ttl <= 0:
+            raise ValueError("Hold time must be positive")
+        if game.game_id not in self._by_id:
+            if self._verbose:
+                print(f'❌"{game.title}" reservation failed:')
+                print("\t⚠️Game is not in store")
+            return None
+        price = self._prices[game]
+        self.remove_game(game, False)
+        hold_id = self._next_hold_id
+        self._next_hold_id += 1
+        self._holds[hold_id] = (game, price)
+        self._hold_timers.schedule(hold_id, self._step + ttl)
+        if self._verbose:
+            print(f'⏳"{game.title}" reserved for {ttl} steps (hold {hold_id})')
+        return hold_id
+
+    def commit(self, hold_id: int) -> bool:
+        """Sell a held copy at the price it was held at.
+
+        Args:
+            hold_id: Hold id returned by `reserve`.
+
+        Returns:
+            True if the sale was made, False if the hold is unknown, released or expired.
+        """
+        hold = self._holds.pop(hold_id, None)
+        if hold is None:
+            if self._verbose:
+                print(f"❌hold {hold_id} commit failed:")
+                print("\t⚠️no such hold")
+            return False
+        self._hold_timers.cancel(hold_id)
+        game, price = hold
+        if self._verbose:
+            print(f'✅"{game.title}" sold for {price} rub (hold {hold_id})')
+        self._record_sale(game, price)
         return True
 
+    def release(self, hold_id: int) -> bool:
+        """Cancel a hold and put the copy back on sale.
+
+        The copy keeps the current price of its title, or the held price if the title
+        went out of stock meanwhile.
+
+        Args:
+            hold_id: Hold id returned by `reserve`.
+
+        Returns:
+            True if the copy was put back, False if the hold is unknown, committed or expired.
+        """
+        hold = self._holds.pop(hold_id, None)
+        if hold is None:
+            if self._verbose:
+                print(f"❌hold {hold_id} release failed:")
+                print("\t⚠️no such hold")
+            return False
+        self._hold_timers.cancel(hold_id)
+        game, price = hold
+        self.add_game(game, self._prices.get(game, price))
+        return True
+
+    def holds(self) -> int:
+        """Return number of active holds.
+
+        Returns:
+            Count of copies held and not yet committed, released or expired.
+        """
+        return len(self._holds)
+
+    def set_prices(self, games: list[Game], prices: list[int]) -> None:
+        """Change prices of titles in stock in bulk.
+
+        Args:
+            games: Games in stock to reprice.
+            prices: New price per game in rubles.
+
+        Raises:
+            ValueError: If the lists differ in length, a game is out of stock or a price is
+                not an int64 integer.
+        """
+        if len(games) != len(prices):
+            raise ValueError("Games and prices differ in length")
+        if not all(game in self._prices for game in games):
+            raise ValueError("Game is not in store")
+        if not all(map(fits_int64, prices)):
+            raise ValueError("Price must be an int64 integer")
+        self._prices.update(zip(games, prices))
+        step = self._step
+        if self._history is not None:
+            record_price = self._history.record_price
+            for game, price in zip(games, prices):
+                record_price(game.game_id, step, price)
+        if self._columns is not None:
+            set_price = self._columns.set_price
+            for game, price in zip(games, prices):
+                set_price(game.game_id, price)
+        if self._persistent is not None:
+            self._persistent.set_prices(zip(games, prices))
+        if self._feed is not None:
+            for game, price in zip(games, prices):
+                self._feed.append(PRICE, game.game_id, step, price)
+
+    @property
+    def step(self) -> int:
+        """Return current step of the store clock."""
+        return self._step
+
+    def history(self) -> PriceHistory:
+        """Return history of price changes and revenue, starting it on the first call.
+
+        The history is timed by the store clock and starts with the current price of every
+        title in stock; revenue is recorded from the first call on.
+
+        Returns:
+            Price history of the store.
+        """
+        if self._history is None:
+            self._history = PriceHistory()
+            for game_id in self._by_id:
+                game = self._by_id[game_id][0]
+                self._history.record_price(game.game_id, self._step, self._prices[game])
+        return self._history
+
+    def ledger(self) -> SalesLedger:
+        """Return ledger of sales, starting it on the first call.
+
+        Sales made from the first call on are recorded under their purchase ids; returns
+        do not need the ledger.
+
+        Returns:
+            Sales ledger of the store.
+        """
+        if self._ledger is None:
+            self._ledger = SalesLedger(self._next_sale_id)
+        return self._ledger
+
+    def tick(self, steps: int = 1) -> int:
+        """Advance the store clock, close sales past their return period and put copies of
+        expired holds back on sale.
+
+        Args:
+            steps: Number of steps to advance by.
+
+        Returns:
+            New current step.
+
+        Raises:
+            ValueError: If steps is negative.
+        """
+        if steps < 0:
+            raise ValueError("Clock cannot go backwards")
+        self._step += steps
+        open_sales = self._open_sales
+        while open_sales and self._step - open_sales[next(iter(open_sales))][1] > RETURN_PERIOD:
+            _, (game_id, _, _) = open_sales.popitem(last=False)
+            open_ids = self._open_by_game[game_id]
+            del open_ids[0]
+            if not open_ids:
+                del self._open_by_game[game_id]
+        for hold_id in self._hold_timers.advance(self._step):
+            if hold_id in self._holds:
+                if self._verbose:
+                    print(f"⌛hold {hold_id} expired")
+                self.release(hold_id)
+        return self._step
+
+    def snapshot(self) -> StoreSnapshot:
+        """Return an immutable point-in-time view of the store.
+
+        The first call builds structurally shared copies of the indexes in O(n); from then on
+        every mutation also updates them in O(log n) and each snapshot is taken in O(1).
+        Snapshots are never modified, so readers need no locks and never block writers.
+
+        Returns:
+            Read-only view of the current inventory, prices and statistics.
+        """
+        if self._persistent is None:
+            titles = (
+                (self._by_id[game_id][0], len(self._by_id[game_id]), self._prices[self._by_id[game_id][0]])
+                for game_id in self._by_id
+            )
+            self._persistent = PersistentIndexes(titles, (self._profit, self._sold_games, self._return_games))
+        return StoreSnapshot(self._persistent.state)
+
+    def change_feed(self, capacity: int = 1 << 16) -> ChangeFeed:
+        """Return the feed of store mutations, starting it on the first call.
+
+        From then on every added, removed, sold or returned copy and every price change
+        is appended to a ring buffer in O(1). Consumers call `subscribe()` on the feed and
+        poll batches by cursor, so they never slow the store down; a purchase is recorded
+        as a "buy" change followed by a "remove" one.
+
+        Args:
+            capacity: Number of changes retained for slow consumers, used on the first call only.
+
+        Returns:
+            Change feed of the store.
+        """
+        if self._feed is None:
+            self._feed = ChangeFeed(capacity)
+        return self._feed
+
+    def stats(self) -> dict[str, int]:
+        """Return store statistics.
+
+        Returns:
+            Dictionary with copy, title, developer, release year and genre counts,
+            profit and the numbers of sold and returned games.
+        """
+        return {
+            "games": len(self._all_copies),
+            "unique_games": len(self._by_id),
+            "unique_developers": self._count_keys("developer"),
+            "unique_release_years": self._count_keys("release_year"),
+            "unique_genres": self._count_keys("genre"),
+            "profit": self._profit,
+            "sold_games": self._sold_games,
+            "returned_games": self._return_games,
+        }
+
+    def top_sellers(self, n: int = 10) -> list[tuple[Game, int]]:
+        """Return best-selling titles without scanning the inventory.
+
+        The first call starts a count-bucket ranking of sales net of returns; from then on
+        it is updated in O(1) per purchase or return, so the answer takes O(n). Only sales
+        made after the first call are counted; `top_sellers(0)` starts counting.
+
+        Args:
+            n: Maximum number of titles.
+
+        Returns:
+            Up to n (Game, copies sold) pairs, best seller first.
+        """
+        if self._sellers is None:
+            self._sellers = CountRanking()
+            self._sellers_since = self._next_sale_id
+        return self._sellers.highest(n)
+
+    def low_stock(self, n: int = 10) -> list[tuple[Game, int]]:
+        """Return in-stock titles with the fewest copies left without scanning the inventory.
+
+        The first call builds a count-bucket ranking of the stock in O(n); from then on it
+        is updated in O(1) per added or removed copy.
+
+        Args:
+            n: Maximum number of titles.
+
+        Returns:
+            Up to n (Game, copies in stock) pairs, fewest copies first.
+        """
+        if self._stock is None:
+            by_id = self._by_id
+            self._stock = CountRanking.from_counts((by_id[game_id][0], len(by_id[game_id])) for game_id in by_id)
+        return self._stock.lowest(n)
+
+    def title_columns(self) -> TitleColumns:
+        """Return per-title columns for vectorized passes, starting them on the first call.
+
+        The first call fills one row per title in stock in O(n); from then on every
+        mutation updates its row in O(1). Sales are counted from the first call.
+
+        Returns:
+            Title columns of the store.
+        """
+        if self._columns is None:
+            self._columns = TitleColumns()
+            by_id = self._by_id
+            for game_id in by_id:
+                copies = by_id[game_id]
+                self._columns.add(copies[0], self._prices[copies[0]])
+                self._columns.stock[-1] = len(copies)
+        return self._columns
+
+    def memory_report(self) -> dict[str, int]:
+        """Return deep memory usage of the store by structure.
+
+        Game objects and their strings are shared by every structure, so they are
+        counted once under "games"; each structure then reports only the memory it adds.
+
+        Returns:
+            Bytes per structure ("games", "all_copies", "by_id", "index:<name>" per
+            secondary index, "prices", "sales", "history", "ledger", "rankings", "columns",
+            "holds", "snapshot" and "feed") and their "total"; structures not started report 0.
+        """
+        seen: set[int] = set()
+        report = {"games": sum(deep_sizeof(game, seen) for game in self._all_copies)}
+        report["all_copies"] = deep_sizeof(self._all_copies, seen)
+        report["by_id"] = deep_sizeof(self._by_id, seen)
+        for name, index in self._indexes.items():
+            report[f"index:{name}"] = deep_sizeof(index, seen)
+        report["prices"] = deep_sizeof(self._prices, seen)
+        report["sales"] = deep_sizeof(self._open_sales, seen) + deep_sizeof(self._open_by_game, seen)
+        report["history"] = deep_sizeof(self._history, seen) if self._history is not None else 0
+        report["ledger"] = deep_sizeof(self._ledger, seen) if self._ledger is not None else 0
+        report["rankings"] = sum(
+            deep_sizeof(ranking, seen) for ranking in (self._stock, self._sellers) if ranking is not None
+        )
+        report["columns"] = deep_sizeof(self._columns, seen) if self._columns is not None else 0
+        report["holds"] = deep_sizeof(self._holds, seen) + deep_sizeof(self._hold_timers, seen)
+        report["snapshot"] = deep_sizeof(self._persistent, seen) if self._persistent is not None else 0
+        report["feed"] = deep_sizeof(self._feed, seen) if self._feed is not None else 0
+        report["total"] = sum(report.values())
+        return report
+
     def get_stats(self) -> None:
         """Display comprehensive store statistics."""
+        if not self._verbose:
+            return
+        stats = self.stats()
         print(
             "📊Statistics:\n"
-            + f"\t🎮Number of games: {len(self._all_copies)}\n"
-            + f"\t🆔Unique games: {len(self._by_id)}\n"
-            + f"\t‍💻Unique developers: {len(self._by_developer)}\n"
-            + f"\t📅Unique release years: {len(self._by_release_year)}\n"
-            + f"\t🎭Unique genres: {len(self._by_genre)}\n"
-            + f"\t💰Profit: {self._profit} rub\n"
-            + f"\t✅Sold games: {self._sold_games}\n"
-            + f"\t↩️Returned games: {self._return_games}"
+            + f"\t🎮Number of games: {stats['games']}\n"
+            + f"\t🆔Unique games: {stats['unique_games']}\n"
+            + f"\t‍💻Unique developers: {stats['unique_developers']}\n"
+            + f"\t📅Unique release years: {stats['unique_release_years']}\n"
+            + f"\t🎭Unique genres: {stats['unique_genres']}\n"
+            + f"\t💰Profit: {stats['profit']} rub\n"
+            + f"\t✅Sold games: {stats['sold_games']}\n"
+            + f"\t↩️Returned games: {stats['returned_games']}"
         )
 
+    def _builtin_index(self, name: str) -> GameDict:
+        """Return a built-in index that is still maintained.
+
+        Args:
+            name: Built-in index name.
+
+        Returns:
+            The index.
+
+        Raises:
+            ValueError: If the index was dropped.
+        """
+        if name not in self._indexes:
+            raise ValueError(f"Index {name} was dropped")
+        return self._indexes[name]
+
+    @property
+    def _by_developer(self) -> GameDict:
+        """Return the built-in developer index."""
+        return self._builtin_index("developer")
+
+    @property
+    def _by_release_year(self) -> GameDict:
+        """Return the built-in release year index."""
+        return self._builtin_index("release_year")
+
+    @property
+    def _by_genre(self) -> GameDict:
+        """Return the built-in genre index."""
+        return self._builtin_index("genre")
+
+    def indexes(self) -> list[str]:
+        """Return names of the maintained secondary indexes.
+
+        Returns:
+            Index names in registration order.
+        """
+        return list(self._indexes)
+
+    def add_index(self, name: str, key: Callable[[Game], Hashable] | None = None) -> None:
+        """Declare a secondary index maintained on every mutation.
+
+        The index is filled from the current inventory. Composite indexes are declared
+        with a key function returning a tuple, e.g. `lambda game: (game.developer, game.genre)`.
+        A dropped built-in index is restored by its name alone, since it keeps its own key.
+        Checkpointed simulations pickle the store, so their index keys must be
+        module-level functions rather than lambdas.
+
+        Args:
+            name: Name of the new index.
+            key: Function extracting the index key from a game; omitted for built-in indexes.
+
+        Raises:
+            ValueError: If an index with this name already exists, a custom index has no key
+                or a built-in index is given a different key.
+        """
+        if name in self._indexes:
+            raise ValueError(f"Index {name} already exists")
+        if name in BUILTIN_INDEXES:
+            if key is not None and key is not BUILTIN_INDEX_KEYS[name]:
+                raise ValueError(f"Index {name} is built in and keeps its own key")
+            index: GameDict = BUILTIN_INDEXES[name]()
+        elif key is None:
+            raise ValueError(f"Index {name} needs a key function")
+        else:
+            index = DictByKey(key)
+        for game in self._all_copies:
+            index.add_game(game)
+        self._indexes[name] = index
+        self._index_list = tuple(self._indexes.values())
+
+    def drop_index(self, name: str) -> None:
+        """Stop maintaining a secondary index.
+
+        Every mutation gets cheaper by one index update. Searches on a dropped built-in
+        index fall back to scanning the unique titles; `add_index(name)` restores it.
+
+        Args:
+            name: Name of the index to drop.
+
+        Raises:
+            ValueError: If no index with this name exists.
+        """
+        if name not in self._indexes:
+            raise ValueError(f"Index {name} does not exist")
+        del self._indexes[name]
+        self._index_list = tuple(self._indexes.values())
+
+    def search(self, name: str, key: Hashable) -> GameCollection:
+        """Return all copies with a key in a secondary index.
+
+        Args:
+            name: Index name.
+            key: Key to look up, a tuple for composite indexes.
+
+        Returns:
+            GameCollection of matching copies, empty if none.
+
+        Raises:
+            ValueError: If the index does not exist and is not a built-in one.
+        """
+        if name in self._indexes:
+            return self._indexes[name].search(key)
+        if name not in BUILTIN_INDEXES:
+            raise ValueError(f"Index {name} does not exist")
+        key_func = BUILTIN_INDEX_KEYS[name]
+        found = GameCollection()
+        for game_id in self._by_id:
+            copies = self._by_id[game_id]
+            if key_func(copies[0]) == key:
+                for game in copies:
+                    found.add_game(game)
+        return found
+
+    def _count_keys(self, name: str) -> int:
+        """Return number of distinct keys of a built-in index, even if it was dropped.
+
+        Args:
+            name: Built-in index name.
+
+        Returns:
+            Count of distinct keys among games in stock.
+        """
+        if name in self._indexes:
+            return len(self._indexes[name])
+        key_func = BUILTIN_INDEX_KEYS[name]
+        return len({key_func(self._by_id[game_id][0]) for game_id in self._by_id})
+
     def search_by_genre(self, genre: str) -> bool:
         """Search for games by genre.
 
@@ -178,10 +799,9 @@ class GameStore:
         Returns:
             True if games found, False otherwise.
         """
-        result = GameCollection()
-        if genre in self._by_genre:
-            result = self._by_genre[genre]
-        self.print_search(result, "genre", genre)
+        result = self.search("genre", genre)
+        if self._verbose:
+            self.print_search(result, "genre", genre)
         return len(result) != 0
 
     def search_by_release_year(self, release_year: int) -> bool:
@@ -193,10 +813,9 @@ class GameStore:
         Returns:
             True if games found, False otherwise.
         """
-        result = GameCollection()
-        if release_year in self._by_release_year:
-            result = self._by_release_year[release_year]
-        self.print_search(result, "release year", release_year)
+        result = self.search("release_year", release_year)
+        if self._verbose:
+            self.print_search(result, "release year", release_year)
         return len(result) != 0
 
     def search_by_developer(self, developer: str) -> bool:
@@ -208,10 +827,9 @@ class GameStore:
         Returns:
             True if games found, False otherwise.
         """
-        result = GameCollection()
-        if developer in self._by_developer:
-            result = self._by_developer[developer]
-        self.print_search(result, "developer", developer)
+        result = self.search("developer", developer)
+        if self._verbose:
+            self.print_search(result, "developer", developer)
         return len(result) != 0
 
     @staticmethod
@@ -1,28 +1,66 @@
 from src.game import Game
 from src.game_collection import GameCollection
 
-GAMES_DATABASE = GameCollection(
-    [
-        # 0
-        Game("Control", "Remedy Entertainment", 2019, "Action", "CTL_RMD"),
-        # 1
-        Game("Quantum Break", "Remedy Entertainment", 2016, "Action", "QTM_RMD"),
-        # 2
-        Game("Alan Wake 2", "Remedy Entertainment", 2023, "Survival Horror", "AW2_RMD"),
-        # 3
-        Game("Uncharted 4: A Thief's End", "Naughty Dog", 2016, "Action-Adventure", "U4_NDG"),
-        # 4
-        Game("The Last of Us", "Naughty Dog", 2013, "Action-Adventure", "TLOU_ND"),
-        # 5
-        Game("Half-Life 2", "Valve", 2004, "FPS", "HL2_VLV"),
-        # 6
-        Game("Portal 2", "Valve", 2011, "Puzzle", "PRT2_VLV"),
-        # 7
-        Game("The Talos Principle", "Croteam", 2014, "Puzzle", "TLS_CRT"),
-        # 8
-        Game("Metro Exodus", "4A Games", 2019, "FPS", "MTX_4AG"),
-        Game("Amnesia: The Bunker", "Frictional Games", 2023, "Survival Horror", "AMB_FRG"),
-        Game("Need for Speed: Rivals", "Electronic Arts", 2013, "Racing", "NFS_EA"),
-        Game("GRID Legends", "Codemasters", 2022, "Racing", "GRD_CDM"),
-    ]
-)
+_games_database: GameCollection | None = None
+
+
+def get_games_database() -> GameCollection:
+    """Return the predefined game catalog, building it on first use.
+
+    Returns:
+        Collection with every game of the database.
+    """
+    global _games_database
+    if _games_database is None:
+        _games_database = _build_games_database()
+    return _games_database
+
+
+def __getattr__(name: str) -> GameCollection:
+    """Build `GAMES_DATABASE` lazily when the module attribute is first accessed.
+
+    Args:
+        name: Name of the requested module attribute.
+
+    Returns:
+        The game catalog for `GAMES_DATABASE`.
+
+    Raises:
+        AttributeError: For any other missing attribute.
+    """
+    if name == "GAMES_DATABASE":
+        return get_games_database()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _build_games_database() -> GameCollection:
+    """Create the predefined game catalog.
+
+    Returns:
+        Collection with every game of the database.
+    """
+    return GameCollection(
+        [
+            # 0
+            Game("Control", "Remedy Entertainment", 2019, "Action", "CTL_RMD"),
+            # 1
+            Game("Quantum Break", "Remedy Entertainment", 2016, "Action", "QTM_RMD"),
+            # 2
+            Game("Alan Wake 2", "Remedy Entertainment", 2023, "Survival Horror", "AW2_RMD"),
+            # 3
+            Game("Uncharted 4: A Thief's End", "Naughty Dog", 2016, "Action-Adventure", "U4_NDG"),
+            # 4
+            Game("The Last of Us", "Naughty Dog", 2013, "Action-Adventure", "TLOU_ND"),
+            # 5
+            Game("Half-Life 2", "Valve", 2004, "FPS", "HL2_VLV"),
+            # 6
+            Game("Portal 2", "Valve", 2011, "Puzzle", "PRT2_VLV"),
+            # 7
+            Game("The Talos Principle", "Croteam", 2014, "Puzzle", "TLS_CRT"),
+            # 8
+            Game("Metro Exodus", "4A Games", 2019, "FPS", "MTX_4AG"),
+            Game("Amnesia: The Bunker", "Frictional Games", 2023, "Survival Horror", "AMB_FRG"),
+            Game("Need for Speed: Rivals", "Electronic Arts", 2013, "Racing", "NFS_EA"),
+            Game("GRID Legends", "Codemasters", 2022, "Racing", "GRD_CDM"),
+        ]
+    )
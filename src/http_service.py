@@ -0,0 +1,549 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from random import Random
+from typing import Any
+from typing import Iterable
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+
+from src.game import Game
+from src.game_store import GameStore
+from src.games_db import get_games_database
+
+MAX_BODY_SIZE = 1 << 20
+
+MAX_HEADERS = 100
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+
+ROUTES = {
+    ("POST", "/add"): "add",
+    ("POST", "/buy"): "buy",
+    ("POST", "/return"): "return",
+    ("GET", "/search"): "search",
+    ("GET", "/stats"): "stats",
+}
+
+READ_OPERATIONS = {"search", "stats"}
+
+LOAD_MIX = {"add": 0.3, "buy": 0.4, "return": 0.1, "search": 0.15, "stats": 0.05}
+
+SEARCH_INDEXES = ("developer", "release_year", "genre")
+
+MAX_PRICE = (1 << 63) - 1
+
+MAX_COPIES = 10_000
+
+
+async def read_message(reader: asyncio.StreamReader) -> tuple[str, dict[str, str], bytes] | None:
+    """Read one HTTP/1.1 request or response with a Content-Length body.
+
+    Args:
+        reader: Stream of the connection.
+
+    Returns:
+        Start line, lowercase header names mapped to values, and body; None if the
+        peer closed the connection before a new message.
+
+    Raises:
+        ValueError: If the message is malformed or too large.
+    """
+    start_line = await reader.readline()
+    if not start_line:
+        return None
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) == MAX_HEADERS:
+            raise ValueError("Too many headers")
+        name, separator, value = line.decode("latin-1").partition(":")
+        if not separator:
+            raise ValueError("Malformed header")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", "0"))
+    if not 0 <= length <= MAX_BODY_SIZE:
+        raise ValueError("Invalid body size")
+    body = await reader.readexactly(length) if length else b""
+    return start_line.decode("latin-1").rstrip("\r\n"), headers, body
+
+
+def _game_fields(game: Game) -> dict[str, Any]:
+    """Return the JSON representation of a game."""
+    return {
+        "game_id": game.game_id,
+        "title": game.title,
+        "developer": game.developer,
+        "release_year": game.release_year,
+        "genre": game.genre,
+    }
+
+
+class StoreService:
+    """HTTP JSON front end of a GameStore.
+
+    Every connection is kept alive until the client closes it or asks to. Parsed
+    requests go into one queue; a single batch task drains everything queued, applies
+    it to the store in arrival order in one go, and answers identical reads of a batch
+    once as long as no write comes between them. The store is used from one task
+    only, so it needs no locks, and under load many requests share a loop iteration.
+
+    Endpoints:
+        POST /add {"game_id", "price", "copies"=1}
+        POST /buy {"game_id", "balance"} -> {"ok", "sale_id"}
+        POST /return {"game_id", "sale_id"=null} -> {"ok"}
+        GET /search?index=<name>&key=<key> -> {"games": [{...game fields, "copies"}]}
+        GET /stats -> store statistics
+    """
+
+    def __init__(self, store: GameStore, catalog: Iterable[Game] | None = None, max_batch: int = 1024) -> None:
+        """Initialize service.
+
+        Args:
+            store: Store to serve; a quiet store avoids printing per request.
+            catalog: Games that can be added by game_id, the predefined catalog if omitted.
+            max_batch: Largest number of requests applied in one batch.
+        """
+        self._store = store
+        self._games = {game.game_id: game for game in (catalog if catalog is not None else get_games_database())}
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[tuple[str, tuple, asyncio.Future]] = asyncio.Queue()
+        self._server: asyncio.Server | None = None
+        self._batcher: asyncio.Task | None = None
+        self.requests = 0
+        self.batches = 0
+
+    def __repr__(self) -> str:
+        """Return summary of the service.
+
+        Returns:
+            String with the numbers of served requests and batches.
+        """
+        return f"StoreService: {self.requests} requests in {self.batches} batches"
+
+    @property
+    def port(self) -> int:
+        """Return port the service listens on, 0 if not started."""
+        return self._server.sockets[0].getsockname()[1] if self._server is not None else 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start listening and the batch task.
+
+        Args:
+            host: Address to bind.
+            port: Port to bind, any free port if 0.
+        """
+        self._batcher = asyncio.create_task(self._run_batches())
+        self._server = await asyncio.start_server(self._serve, host, port)
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled.
+
+        Raises:
+            ValueError: If the service was not started.
+        """
+        server = self._server
+        if server is None:
+            raise ValueError("Service is not started")
+        async with server:
+            await server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and the batch task."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer requests of one connection until it closes."""
+        try:
+            while True:
+                try:
+                    message = await read_message(reader)
+                except (ValueError, asyncio.IncompleteReadError):
+                    self._respond(writer, 400, {"error": "malformed request"}, False)
+                    break
+                if message is None:
+                    break
+                start_line, headers, body = message
+                parts = start_line.split(" ")
+                if len(parts) != 3:
+                    self._respond(writer, 400, {"error": "malformed request line"}, False)
+                    break
+                method, target, version = parts
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                try:
+                    operation, arguments = self._parse(method, target, body)
+                except KeyError as error:
+                    self._respond(writer, 404, {"error": error.args[0]}, keep_alive)
+                except (ValueError, TypeError) as error:
+                    self._respond(writer, 400, {"error": str(error)}, keep_alive)
+                else:
+                    future: asyncio.Future[tuple[int, dict[str, Any]]] = asyncio.get_running_loop().create_future()
+                    self._queue.put_nowait((operation, arguments, future))
+                    status, payload = await future
+                    self._respond(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _respond(writer: asyncio.StreamWriter, status: int, payload: dict[str, Any], keep_alive: bool) -> None:
+        """Write a JSON response."""
+        body = json.dumps(payload).encode()
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+            ).encode()
+            + body
+        )
+
+    def _game(self, game_id: Any) -> Game:
+        """Return a catalog game by id.
+
+        Raises:
+            KeyError: If the game is not in the catalog.
+        """
+        if game_id not in self._games:
+            raise KeyError(f"Game {game_id} does not exist")
+        return self._games[game_id]
+
+    def _parse(self, method: str, target: str, body: bytes) -> tuple[str, tuple]:
+        """Validate a request and turn it into a store operation.
+
+        Args:
+            method: HTTP method.
+            target: Request target with the query string.
+            body: JSON body of POST requests.
+
+        Returns:
+            Operation name and its arguments.
+
+        Raises:
+            KeyError: If the route or the game does not exist.
+            ValueError: If the body or the query is invalid.
+            TypeError: If a field has a wrong type.
+        """
+        url = urlsplit(target)
+        operation = ROUTES.get((method, url.path))
+        if operation is None:
+            raise KeyError(f"No route {method} {url.path}")
+        if operation == "stats":
+            return operation, ()
+        if operation == "search":
+            query = dict(parse_qsl(url.query))
+            index = query.get("index")
+            if index not in SEARCH_INDEXES or "key" not in query:
+                raise ValueError("Query needs index (developer, release_year or genre) and key")
+            return operation, (index, int(query["key"]) if index == "release_year" else query["key"])
+
+        fields = json.loads(body or b"{}")
+        if not isinstance(fields, dict):
+            raise TypeError("Body must be a JSON object")
+        game = self._game(fields.get("game_id"))
+        match operation:
+            case "add":
+                price, copies = _integer(fields, "price"), _integer(fields, "copies", 1)
+                if not 0 < price <= MAX_PRICE:
+                    raise ValueError(f"price must be between 1 and {MAX_PRICE}")
+                if not 0 < copies <= MAX_COPIES:
+                    raise ValueError(f"copies must be between 1 and {MAX_COPIES}")
+                return operation, (game, price, copies)
+            case "buy":
+                return operation, (game, _integer(fields, "balance"))
+        sale_id = fields.get("sale_id")
+        return operation, (game, _integer(fields, "sale_id") if sale_id is not None else None)
+
+    async def _run_batches(self) -> None:
+        """Apply queued requests to the store, everything queued at a time."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            self._apply(batch)
+
+    def _apply(self, batch: list[tuple[str, tuple, asyncio.Future]]) -> None:
+        """Run a batch of operations in order and resolve their futures with (status, payload).
+
+        A failing operation is answered with an error and does not stop the batch.
+        """
+        reads: dict[tuple[str, tuple], tuple[int, dict[str, Any]]] = {}
+        for operation, arguments, future in batch:
+            if operation in READ_OPERATIONS:
+                result = reads.get((operation, arguments))
+                if result is None:
+                    result = reads[(operation, arguments)] = self._guarded(operation, arguments)
+            else:
+                reads.clear()
+                result = self._guarded(operation, arguments)
+            if not future.done():
+                future.set_result(result)
+        self.requests += len(batch)
+        self.batches += 1
+
+    def _guarded(self, operation: str, arguments: tuple) -> tuple[int, dict[str, Any]]:
+        """Run one operation, turning its exceptions into error responses.
+
+        Args:
+            operation: Operation name from ROUTES.
+            arguments: Arguments produced by `_parse`.
+
+        Returns:
+            HTTP status and JSON payload of the response.
+        """
+        try:
+            return 200, self._execute(operation, arguments)
+        except (ValueError, TypeError, ArithmeticError) as error:
+            return 400, {"error": str(error)}
+        except Exception as error:
+            return 500, {"error": f"{type(error).__name__}: {error}"}
+
+    def _execute(self, operation: str, arguments: tuple) -> dict[str, Any]:
+        """Run one operation on the store.
+
+        Args:
+            operation: Operation name from ROUTES.
+            arguments: Arguments produced by `_parse`.
+
+        Returns:
+            JSON payload of the response.
+        """
+        store = self._store
+        match operation:
+            case "add":
+                game, price, copies = arguments
+                for _ in range(copies):
+                    store.add_game(game, price)
+                return {"ok": True}
+            case "buy":
+                game, balance = arguments
+                sold = store.buy_game(game, balance)
+                return {"ok": sold, "sale_id": store.last_sale_id if sold else None}
+            case "return":
+                game, sale_id = arguments
+                return {"ok": store.return_game(game, sale_id)}
+            case "search":
+                found: dict[str, list] = {}
+                for game in store.search(*arguments):
+                    found.setdefault(game.game_id, [game, 0])[1] += 1
+                return {"games": [{**_game_fields(game), "copies": count} for game, count in found.values()]}
+        return store.stats()
+
+
+def _integer(fields: dict[str, Any], name: str, default: int | None = None) -> int:
+    """Return an integer field of a request body.
+
+    Args:
+        fields: Decoded JSON body.
+        name: Field name.
+        default: Value of a missing field, None if the field is required.
+
+    Returns:
+        Field value.
+
+    Raises:
+        TypeError: If the field is missing or not an integer; JSON booleans are rejected.
+    """
+    value = fields.get(name, default)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError(f"{name} must be an integer")
+    return value
+
+
+def _percentile(latencies: list[float], q: float) -> float:
+    """Return the nearest-rank percentile of sorted latencies, 0 if empty."""
+    if not latencies:
+        return 0.0
+    return latencies[min(len(latencies) - 1, max(0, round(q * len(latencies)) - 1))]
+
+
+async def _client(
+    host: str,
+    port: int,
+    requests: int,
+    games: list[Game],
+    rng: Random,
+    latencies: list[float],
+) -> int:
+    """Send requests over one keep-alive connection, one at a time.
+
+    Returns:
+        Number of responses with a status other than 200.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    operations = list(LOAD_MIX)
+    weights = list(LOAD_MIX.values())
+    errors = 0
+    sales: list[tuple[str, int]] = []
+    try:
+        for _ in range(requests):
+            operation = rng.choices(operations, weights)[0]
+            game = rng.choice(games)
+            if operation == "search":
+                index = rng.choice(SEARCH_INDEXES)
+                query = urlencode({"index": index, "key": getattr(game, index)})
+                request = f"GET /search?{query} HTTP/1.1\r\nHost: {host}\r\n\r\n"
+            elif operation == "stats":
+                request = f"GET /stats HTTP/1.1\r\nHost: {host}\r\n\r\n"
+            else:
+                if operation == "add":
+                    fields: dict[str, Any] = {"game_id": game.game_id, "price": rng.randint(500, 3500)}
+                elif operation == "buy":
+                    fields = {"game_id": game.game_id, "balance": rng.randint(1000, 7000)}
+                elif sales:
+                    game_id, sale_id = sales.pop(rng.randrange(len(sales)))
+                    fields = {"game_id": game_id, "sale_id": sale_id}
+                else:
+                    fields = {"game_id": game.game_id}
+                body = json.dumps(fields)
+                request = (
+                    f"POST /{operation} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n{body}"
+                )
+            started = time.perf_counter()
+            writer.write(request.encode())
+            message = await read_message(reader)
+            latencies.append(time.perf_counter() - started)
+            if message is None:
+                raise ConnectionError("Service closed the connection")
+            status_line, _, response = message
+            if status_line.split(" ")[1] != "200":
+                errors += 1
+            elif operation == "buy":
+                result = json.loads(response)
+                if result["ok"]:
+                    sales.append((fields["game_id"], result["sale_id"]))
+    finally:
+        writer.close()
+    return errors
+
+
+async def load_test(
+    host: str,
+    port: int,
+    connections: int = 32,
+    requests: int = 10_000,
+    catalog: Iterable[Game] | None = None,
+    random_seed: int = 0,
+) -> dict[str, float]:
+    """Drive a running service with concurrent keep-alive clients.
+
+    Each client sends requests drawn from LOAD_MIX one after another; returns use
+    purchase ids the client received earlier.
+
+    Args:
+        host: Service address.
+        port: Service port.
+        connections: Number of concurrent connections.
+        requests: Total number of requests, split evenly between connections.
+        catalog: Games requests refer to, the predefined catalog if omitted.
+        random_seed: Seed of the request generators.
+
+    Returns:
+        Dictionary with "requests", "errors", "seconds", "throughput" (requests per
+        second) and latency percentiles "p50_ms" and "p99_ms".
+    """
+    games = list(catalog if catalog is not None else get_games_database())
+    shares = [requests // connections + (number < requests % connections) for number in range(connections)]
+    latencies: list[float] = []
+    started = time.perf_counter()
+    errors = await asyncio.gather(
+        *(
+            _client(host, port, share, games, Random(random_seed + number), latencies)
+            for number, share in enumerate(shares)
+            if share
+        )
+    )
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "seconds": round(elapsed, 6),
+        "throughput": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(_percentile(latencies, 0.5) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+def print_report(report: dict[str, float]) -> None:
+    """Display a load test report.
+
+    Args:
+        report: Result of `load_test`.
+    """
+    print(
+        f"🚀Load test: {report['requests']} requests in {report['seconds']:.3f} s\n"
+        + f"\t📈Throughput: {report['throughput']:.0f} req/s\n"
+        + f"\t⏱️Latency: p50 {report['p50_ms']:.3f} ms, p99 {report['p99_ms']:.3f} ms\n"
+        + f"\t❌Errors: {report['errors']}"
+    )
+
+
+async def _serve(host: str, port: int, copies: int) -> None:
+    """Serve a store filled with copies of the predefined catalog until interrupted."""
+    store = GameStore(verbose=False)
+    for game in get_games_database():
+        for _ in range(copies):
+            store.add_game(game, 1000)
+    service = StoreService(store)
+    await service.start(host, port)
+    print(f"🌐Serving {store} on http://{host}:{service.port}")
+    await service.serve_forever()
+
+
+def main(argv: list[str]) -> int:
+    """Run the service or the load generator from the command line.
+
+    Args:
+        argv: Command-line arguments without the program name.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.http_service", description="Game store HTTP JSON service.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="serve a store filled with the predefined catalog")
+    serve.add_argument("--host", default="127.0.0.1", help="address to bind")
+    serve.add_argument("--port", type=int, default=8080, help="port to bind")
+    serve.add_argument("--copies", type=int, default=10, help="initial copies per catalog game")
+    load = commands.add_parser("load", help="load-test a running service")
+    load.add_argument("--host", default="127.0.0.1", help="service address")
+    load.add_argument("--port", type=int, default=8080, help="service port")
+    load.add_argument("-c", "--connections", type=int, default=32, help="concurrent connections")
+    load.add_argument("-n", "--requests", type=int, default=10_000, help="total requests")
+    options = parser.parse_args(argv)
+
+    if options.command == "serve":
+        try:
+            asyncio.run(_serve(options.host, options.port, options.copies))
+        except KeyboardInterrupt:
+            pass
+    else:
+        print_report(asyncio.run(load_test(options.host, options.port, options.connections, options.requests)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,201 @@
+import functools
+
+from time import perf_counter_ns
+from typing import Any
+from typing import Callable
+
+from src.game_collection import GameCollection
+from src.game_dict import GameDict
+from src.game_store import GameStore
+
+INSTRUMENTED_CLASSES: tuple[type, ...] = (GameStore, GameDict, GameCollection)
+
+INSTRUMENTED_DUNDERS = {"__contains__", "__getitem__", "__iter__", "__len__"}
+
+HISTOGRAM_BUCKETS = 48
+
+
+class LatencyHistogram:
+    """Histogram of call latencies with power-of-two nanosecond buckets.
+
+    Bucket `i` holds latencies below `2 ** i` nanoseconds, so recording is a single
+    `int.bit_length()` call and quantiles are accurate to a factor of two.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._counts: list[int] = [0] * HISTOGRAM_BUCKETS
+        self.count: int = 0
+        self.total_ns: int = 0
+
+    def clear(self) -> None:
+        """Drop all recorded samples."""
+        self._counts = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+
+    def record(self, elapsed_ns: int) -> None:
+        """Add a single latency sample.
+
+        Args:
+            elapsed_ns: Call duration in nanoseconds.
+        """
+        self._counts[min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+
+    def quantile(self, q: float) -> int:
+        """Estimate a latency quantile.
+
+        Args:
+            q: Quantile between 0 and 1.
+
+        Returns:
+            Upper bound in nanoseconds of the bucket containing the quantile, 0 if empty.
+        """
+        if self.count == 0:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for bucket, amount in enumerate(self._counts):
+            seen += amount
+            if amount and seen >= rank:
+                return 1 << bucket
+        return 1 << (HISTOGRAM_BUCKETS - 1)
+
+    def as_dict(self) -> dict[str, int]:
+        """Return call count, total time and p50/p99 latencies.
+
+        Returns:
+            Dictionary with `calls`, `total_ns`, `p50_ns` and `p99_ns`.
+        """
+        return {
+            "calls": self.count,
+            "total_ns": self.total_ns,
+            "p50_ns": self.quantile(0.5),
+            "p99_ns": self.quantile(0.99),
+        }
+
+
+_originals: dict[tuple[type, str], Any] = {}
+_histograms: dict[str, LatencyHistogram] = {}
+
+
+def _timed(func: Callable[..., Any], histogram: LatencyHistogram) -> Callable[..., Any]:
+    """Wrap a function so every call is recorded into a histogram.
+
+    Args:
+        func: Function to time.
+        histogram: Histogram receiving the latencies.
+
+    Returns:
+        Timing wrapper around `func`.
+    """
+    record = histogram.record
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(perf_counter_ns() - start)
+
+    return wrapper
+
+
+def _instrumented_names(cls: type) -> list[str]:
+    """List the methods of a class that get instrumented.
+
+    Args:
+        cls: Class to inspect.
+
+    Returns:
+        Public methods and selected dunder methods defined directly on the class.
+    """
+    names = []
+    for name, attr in vars(cls).items():
+        if name.startswith("_") and name not in INSTRUMENTED_DUNDERS:
+            continue
+        if callable(attr) or isinstance(attr, staticmethod):
+            names.append(name)
+    return names
+
+
+def is_enabled() -> bool:
+    """Return whether instrumentation wrappers are installed.
+
+    Returns:
+        True if methods are currently instrumented.
+    """
+    return bool(_originals)
+
+
+def enable(classes: tuple[type, ...] = INSTRUMENTED_CLASSES) -> None:
+    """Install timing wrappers on the methods of the given classes.
+
+    Nothing is wrapped until this is called, so disabled instrumentation costs nothing.
+
+    Args:
+        classes: Classes whose methods should be instrumented.
+    """
+    for cls in classes:
+        for name in _instrumented_names(cls):
+            if (cls, name) in _originals:
+                continue
+            attr = vars(cls)[name]
+            histogram = _histograms.setdefault(f"{cls.__name__}.{name}", LatencyHistogram())
+            _originals[(cls, name)] = attr
+            if isinstance(attr, staticmethod):
+                setattr(cls, name, staticmethod(_timed(attr.__func__, histogram)))
+            else:
+                setattr(cls, name, _timed(attr, histogram))
+
+
+def disable() -> None:
+    """Restore the original methods; recorded statistics are kept."""
+    for (cls, name), attr in _originals.items():
+        setattr(cls, name, attr)
+    _originals.clear()
+
+
+def reset() -> None:
+    """Drop all recorded statistics."""
+    for histogram in _histograms.values():
+        histogram.clear()
+
+
+def snapshot() -> dict[str, dict[str, int]]:
+    """Return recorded statistics of every called method.
+
+    Returns:
+        Mapping of `Class.method` to its call count, total time and p50/p99 latencies.
+    """
+    return {name: histogram.as_dict() for name, histogram in sorted(_histograms.items()) if histogram.count}
+
+
+def to_prometheus() -> str:
+    """Render recorded statistics in the Prometheus text exposition format.
+
+    Returns:
+        Text with a call counter and a latency summary per method.
+    """
+    lines = [
+        "# HELP game_store_method_calls_total Number of calls per method.",
+        "# TYPE game_store_method_calls_total counter",
+    ]
+    stats = snapshot()
+    for name, values in stats.items():
+        lines.append(f'game_store_method_calls_total{{method="{name}"}} {values["calls"]}')
+    lines += [
+        "# HELP game_store_method_latency_seconds Method call latency.",
+        "# TYPE game_store_method_latency_seconds summary",
+    ]
+    for name, values in stats.items():
+        for quantile, key in (("0.5", "p50_ns"), ("0.99", "p99_ns")):
+            lines.append(
+                f'game_store_method_latency_seconds{{method="{name}",quantile="{quantile}"}} {values[key] / 1e9:.9f}'
+            )
+        lines.append(f'game_store_method_latency_seconds_sum{{method="{name}"}} {values["total_ns"] / 1e9:.9f}')
+        lines.append(f'game_store_method_latency_seconds_count{{method="{name}"}} {values["calls"]}')
+    return "\n".join(lines) + "\n"
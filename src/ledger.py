@@ -0,0 +1,119 @@
+from array import array
+from typing import NamedTuple
+
+
+class Sale(NamedTuple):
+    """Single sale recorded in a ledger.
+
+    Attributes:
+        sale_id: Purchase id, the position of the sale in the ledger.
+        game_id: Identifier of the sold game.
+        step: Store clock step of the sale.
+        price: Price paid in rubles.
+        returned: Whether the copy was returned.
+    """
+
+    sale_id: int
+    game_id: str
+    step: int
+    price: int
+    returned: bool
+
+
+class SalesLedger:
+    """Append-only ledger of sales stored in parallel compact arrays.
+
+    Purchase ids are consecutive from the first id of the ledger, so a sale is found in
+    O(1) by id. Sale ids of each game are kept in step order. The ledger is a record
+    only; returns are validated by the store against its open sales.
+    """
+
+    def __init__(self, first_id: int = 0) -> None:
+        """Initialize an empty ledger.
+
+        Args:
+            first_id: Purchase id of the first recorded sale.
+        """
+        self._first_id = first_id
+        self._game_ids: list[str] = []
+        self._steps: array = array("q")
+        self._prices: array = array("q")
+        self._returned = bytearray()
+        self._by_game: dict[str, array] = {}
+
+    def __len__(self) -> int:
+        """Return number of recorded sales.
+
+        Returns:
+            Count of sales, including returned ones.
+        """
+        return len(self._game_ids)
+
+    def __repr__(self) -> str:
+        """Return summary of the ledger.
+
+        Returns:
+            String with the numbers of sales and returns.
+        """
+        return f"SalesLedger: {len(self)} sales ({self._returned.count(1)} returned)"
+
+    def record(self, game_id: str, step: int, price: int) -> int:
+        """Append a sale.
+
+        Args:
+            game_id: Identifier of the sold game.
+            step: Store clock step of the sale.
+            price: Price paid in rubles.
+
+        Returns:
+            Purchase id of the new sale.
+        """
+        sale_id = self._first_id + len(self._game_ids)
+        self._game_ids.append(game_id)
+        self._steps.append(step)
+        self._prices.append(price)
+        self._returned.append(0)
+        sale_ids = self._by_game.get(game_id)
+        if sale_ids is None:
+            sale_ids = self._by_game[game_id] = array("q")
+        sale_ids.append(sale_id)
+        return sale_id
+
+    def get(self, sale_id: int) -> Sale | None:
+        """Return a sale by purchase id.
+
+        Args:
+            sale_id: Purchase id.
+
+        Returns:
+            The sale, None if no sale has this id.
+        """
+        position = sale_id - self._first_id
+        if not 0 <= position < len(self._game_ids):
+            return None
+        return Sale(
+            sale_id,
+            self._game_ids[position],
+            self._steps[position],
+            self._prices[position],
+            bool(self._returned[position]),
+        )
+
+    def sales_of(self, game_id: str) -> list[int]:
+        """Return purchase ids of every sale of a game.
+
+        Args:
+            game_id: Game identifier.
+
+        Returns:
+            Purchase ids in chronological order.
+        """
+        return list(self._by_game.get(game_id, ()))
+
+    def mark_returned(self, sale_id: int) -> None:
+        """Mark a sale as returned.
+
+        Args:
+            sale_id: Purchase id of a recorded sale.
+        """
+        self._returned[sale_id - self._first_id] = 1
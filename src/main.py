@@ -1,6 +1,187 @@
-from typing import List
+import contextlib
+import os
+import sys
+import time
 
-from src.simulation import simulate
+
+def parse_sm_args(args: list[str]) -> tuple[int, int, int | None] | None:
+    """Parse the arguments of an `sm` command.
+
+    Args:
+        args: Command words without the leading `sm`.
+
+    Returns:
+        Tuple of start games amount, steps and optional seed, or None if invalid.
+    """
+    if len(args) not in [2, 3]:
+        return None
+
+    seed: int | None = None
+    try:
+        start: int = int(args[0])
+        steps: int = int(args[1])
+    except ValueError:
+        return None
+
+    if len(args) == 3:
+        try:
+            seed = int(args[2])
+        except ValueError:
+            return None
+    return start, steps, seed
+
+
+def run_simulation(
+    index: int,
+    run: tuple[int, int, int | None],
+    output_dir: str | None = None,
+    quiet: bool = False,
+) -> dict:
+    """Run a single simulation for batch mode.
+
+    Per-step output goes to `run_<index>.log` in the output directory; without one it is discarded.
+
+    Args:
+        index: Position of the run in the batch.
+        run: Start games amount, steps and optional seed.
+        output_dir: Optional directory for per-run output files.
+        quiet: Whether to suppress per-step printing entirely.
+
+    Returns:
+        Summary with the run parameters, final statistics and elapsed seconds.
+    """
+    from src.simulation import simulate
+
+    start, steps, seed = run
+    started = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        path = os.path.join(output_dir, f"run_{index}.log") if output_dir is not None else os.devnull
+        stream = stack.enter_context(open(path, "w", encoding="utf-8"))
+        stack.enter_context(contextlib.redirect_stdout(stream))
+        store = simulate(start, steps, seed, verbose=not quiet)
+    return {
+        "run": index,
+        "start": start,
+        "steps": steps,
+        "seed": seed,
+        "stats": store.stats(),
+        "elapsed": round(time.perf_counter() - started, 6),
+    }
+
+
+def read_runs(path: str) -> list[tuple[int, int, int | None]]:
+    """Read run specifications from a file, one `[sm] <start> <steps> [seed]` per line.
+
+    Empty lines and lines starting with `#` are skipped.
+
+    Args:
+        path: Path of the run specification file.
+
+    Returns:
+        List of parsed runs.
+
+    Raises:
+        ValueError: If a line is not a valid run specification.
+    """
+    runs = []
+    with open(path, encoding="utf-8") as stream:
+        for number, line in enumerate(stream, 1):
+            words = line.split()
+            if not words or words[0].startswith("#"):
+                continue
+            if words[0] == "sm":
+                words = words[1:]
+            run = parse_sm_args(words)
+            if run is None:
+                raise ValueError(f"invalid run specification on line {number}")
+            runs.append(run)
+    return runs
+
+
+def split_runs(words: list[str]) -> list[tuple[int, int, int | None]]:
+    """Split command-line words into `sm` runs.
+
+    Args:
+        words: Words such as `sm 10 100 1 sm 5 50`.
+
+    Returns:
+        List of parsed runs.
+
+    Raises:
+        ValueError: If the words are not a sequence of valid `sm` commands.
+    """
+    runs: list[tuple[int, int, int | None]] = []
+    if words and words[0] != "sm":
+        raise ValueError("unknown command")
+    groups: list[list[str]] = []
+    for word in words:
+        if word == "sm":
+            groups.append([])
+        else:
+            groups[-1].append(word)
+    for group in groups:
+        run = parse_sm_args(group)
+        if run is None:
+            raise ValueError("invalid arguments")
+        runs.append(run)
+    return runs
+
+
+def batch(argv: list[str]) -> int:
+    """Run simulations given on the command line or in a file, in a process pool.
+
+    Args:
+        argv: Command-line arguments without the program name.
+
+    Returns:
+        Process exit code.
+    """
+    import argparse
+    import json
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    parser = argparse.ArgumentParser(prog="python -m src.main", description="Run game store simulations in batch.")
+    parser.add_argument("runs", nargs="*", help="sm <start games amount> <steps> [seed], may be repeated")
+    parser.add_argument("-f", "--file", help="file with one run specification per line")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("-o", "--output-dir", help="directory for per-run output files")
+    parser.add_argument("-s", "--summary", help="path of the JSON summary, '-' for stdout")
+    parser.add_argument("-q", "--quiet", action="store_true", help="suppress per-step printing")
+    options = parser.parse_intermixed_args(argv)
+
+    try:
+        runs = split_runs(options.runs)
+        if options.file is not None:
+            runs += read_runs(options.file)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    if not runs:
+        parser.error("no runs given")
+    if options.output_dir is not None:
+        os.makedirs(options.output_dir, exist_ok=True)
+
+    jobs = max(1, min(options.jobs, len(runs)))
+    arguments = [(index, run, options.output_dir, options.quiet) for index, run in enumerate(runs)]
+    if jobs == 1:
+        results = [run_simulation(*args) for args in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(run_simulation, *zip(*arguments)))
+
+    if options.summary == "-":
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            stats = result["stats"]
+            print(
+                f"✅run {result['run']} (sm {result['start']} {result['steps']} {result['seed']}): "
+                f"profit {stats['profit']} rub, sold {stats['sold_games']}, {result['elapsed']:.3f} s"
+            )
+        if options.summary is not None:
+            with open(options.summary, "w", encoding="utf-8") as stream:
+                json.dump(results, stream, indent=2)
+    return 0
 
 
 def main() -> None:
@@ -13,31 +194,20 @@ def main() -> None:
         print("⏹️To close program, enter: \n\tquit\n")
 
         user_input: str = input("command: ").strip()
-        args: List[str] = user_input.split()
+        args: list[str] = user_input.split()
 
         if not args:
             print("empty command\n")
             continue
 
         if args[0] == "sm":
-            if len(args) not in [3, 4]:
-                print("invalid arguments\n")
-                continue
-
-            seed: int | None = None
-            try:
-                start: int = int(args[1])
-                steps: int = int(args[2])
-            except ValueError:
+            run = parse_sm_args(args[1:])
+            if run is None:
                 print("invalid arguments\n")
                 continue
+            start, steps, seed = run
 
-            if len(args) == 4:
-                try:
-                    seed = int(args[3])
-                except ValueError:
-                    print("invalid arguments\n")
-                    continue
+            from src.simulation import simulate
 
             print("\n")
             simulate(start, steps, seed)
@@ -50,4 +220,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(batch(sys.argv[1:]))
     main()
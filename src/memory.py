@@ -0,0 +1,56 @@
+import sys
+
+from types import BuiltinFunctionType
+from types import FunctionType
+from types import MethodType
+from types import ModuleType
+from typing import Any
+
+SKIPPED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def _slots(cls: type) -> list[str]:
+    """Return every slot name declared along the class hierarchy."""
+    names: list[str] = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return names
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """Return bytes held by an object and everything it references.
+
+    Objects already in `seen` are skipped and every visited object is added to it, so
+    sharing one set across calls attributes each shared object to the first structure
+    that reaches it. Objects in `seen` must stay alive while it is used, since ids of
+    freed objects are reused. Classes, modules and functions are not counted.
+
+    Args:
+        obj: Root object.
+        seen: Ids of objects already accounted for.
+
+    Returns:
+        Total size in bytes.
+    """
+    seen = seen if seen is not None else set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, SKIPPED_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, bytearray, int, float, memoryview)):
+            if hasattr(current, "__dict__"):
+                stack.append(vars(current))
+            for name in _slots(type(current)):
+                if hasattr(current, name):
+                    stack.append(getattr(current, name))
+    return total
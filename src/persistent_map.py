@@ -0,0 +1,275 @@
+from typing import Any
+from typing import Hashable
+from typing import Iterator
+
+BITS = 5
+
+WIDTH = 1 << BITS
+
+MASK = WIDTH - 1
+
+_MISSING = object()
+
+
+class _Node:
+    """Bitmap-indexed trie node with at most WIDTH entries.
+
+    Each entry is either a (key, value) pair or a child node.
+    """
+
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: tuple) -> None:
+        """Initialize node.
+
+        Args:
+            bitmap: Bit `i` is set when the node has an entry for hash fragment `i`.
+            entries: Entries of the set bits in ascending bit order.
+        """
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _Collision:
+    """Leaf holding several pairs whose keys share the full hash."""
+
+    __slots__ = ("key_hash", "pairs")
+
+    def __init__(self, key_hash: int, pairs: tuple) -> None:
+        """Initialize collision leaf.
+
+        Args:
+            key_hash: Hash shared by all keys.
+            pairs: Tuple of (key, value) pairs.
+        """
+        self.key_hash = key_hash
+        self.pairs = pairs
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+def _fragment(key_hash: int, shift: int) -> int:
+    """Return the bit of the node bitmap a hash maps to at a trie level."""
+    return 1 << ((key_hash >> shift) & MASK)
+
+
+def _position(bitmap: int, bit: int) -> int:
+    """Return the entry index of a bitmap bit."""
+    return (bitmap & (bit - 1)).bit_count()
+
+
+def _merge(shift: int, first: tuple, first_hash: int, second: tuple, second_hash: int) -> Any:
+    """Build the smallest subtree holding two pairs with different keys."""
+    if first_hash == second_hash or shift >= 64:
+        return _Collision(first_hash, (first, second))
+    first_bit = _fragment(first_hash, shift)
+    second_bit = _fragment(second_hash, shift)
+    if first_bit == second_bit:
+        return _Node(first_bit, (_merge(shift + BITS, first, first_hash, second, second_hash),))
+    if first_bit < second_bit:
+        return _Node(first_bit | second_bit, (first, second))
+    return _Node(first_bit | second_bit, (second, first))
+
+
+def _get(node: Any, key: Hashable, key_hash: int, default: Any) -> Any:
+    """Look up a key in a subtree."""
+    shift = 0
+    while True:
+        if isinstance(node, _Collision):
+            for pair_key, value in node.pairs:
+                if pair_key == key:
+                    return value
+            return default
+        bit = _fragment(key_hash, shift)
+        if not node.bitmap & bit:
+            return default
+        entry = node.entries[_position(node.bitmap, bit)]
+        if isinstance(entry, tuple):
+            return entry[1] if entry[0] == key else default
+        node = entry
+        shift += BITS
+
+
+def _set(node: Any, shift: int, key: Hashable, key_hash: int, value: Any) -> tuple[Any, bool]:
+    """Return a copy of a subtree with a key set, and whether the key is new."""
+    if isinstance(node, _Collision):
+        pairs = tuple(pair for pair in node.pairs if pair[0] != key)
+        return _Collision(key_hash, pairs + ((key, value),)), len(pairs) == len(node.pairs)
+    bit = _fragment(key_hash, shift)
+    index = _position(node.bitmap, bit)
+    entries = node.entries
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit, entries[:index] + ((key, value),) + entries[index:]), True
+    entry = entries[index]
+    if isinstance(entry, tuple):
+        if entry[0] == key:
+            replacement: Any = (key, value)
+            added = False
+        else:
+            replacement = _merge(shift + BITS, entry, hash(entry[0]), (key, value), key_hash)
+            added = True
+    else:
+        replacement, added = _set(entry, shift + BITS, key, key_hash, value)
+    return _Node(node.bitmap, entries[:index] + (replacement,) + entries[index + 1 :]), added
+
+
+def _delete(node: Any, shift: int, key: Hashable, key_hash: int) -> Any:
+    """Return a copy of a subtree without a key, None if it becomes empty, or the node itself if absent."""
+    if isinstance(node, _Collision):
+        pairs = tuple(pair for pair in node.pairs if pair[0] != key)
+        if len(pairs) == len(node.pairs):
+            return node
+        return pairs[0] if len(pairs) == 1 else _Collision(key_hash, pairs)
+    bit = _fragment(key_hash, shift)
+    if not node.bitmap & bit:
+        return node
+    index = _position(node.bitmap, bit)
+    entries = node.entries
+    entry = entries[index]
+    if isinstance(entry, tuple):
+        if entry[0] != key:
+            return node
+        replacement = None
+    else:
+        replacement = _delete(entry, shift + BITS, key, key_hash)
+        if replacement is entry:
+            return node
+        if (
+            isinstance(replacement, _Node)
+            and len(replacement.entries) == 1
+            and isinstance(replacement.entries[0], tuple)
+        ):
+            replacement = replacement.entries[0]
+    if replacement is None:
+        if len(entries) == 1:
+            return None
+        return _Node(node.bitmap & ~bit, entries[:index] + entries[index + 1 :])
+    return _Node(node.bitmap, entries[:index] + (replacement,) + entries[index + 1 :])
+
+
+def _items(node: Any) -> Iterator[tuple]:
+    """Yield every (key, value) pair of a subtree."""
+    if isinstance(node, _Collision):
+        yield from node.pairs
+        return
+    for entry in node.entries:
+        if isinstance(entry, tuple):
+            yield entry
+        else:
+            yield from _items(entry)
+
+
+class PersistentMap:
+    """Immutable hash map with structural sharing (hash array mapped trie).
+
+    `set` and `delete` return a new map in O(log32 n) and share every untouched node
+    with the original, so keeping old versions around is cheap.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, root: Any = _EMPTY_NODE, size: int = 0) -> None:
+        """Initialize map; use `PersistentMap()` for an empty map.
+
+        Args:
+            root: Root trie node.
+            size: Number of keys in the trie.
+        """
+        self._root = root
+        self._size = size
+
+    def __len__(self) -> int:
+        """Return number of keys in the map.
+
+        Returns:
+            Count of keys.
+        """
+        return self._size
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if key exists in the map.
+
+        Args:
+            key: Key to check for existence.
+
+        Returns:
+            True if key exists, False otherwise.
+        """
+        return _get(self._root, key, hash(key), _MISSING) is not _MISSING
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """Return value stored for a key.
+
+        Args:
+            key: Key to look up.
+
+        Returns:
+            Value for the key.
+
+        Raises:
+            KeyError: If key is missing.
+        """
+        value = _get(self._root, key, hash(key), _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Return iterator over keys.
+
+        Returns:
+            Iterator for keys in the map.
+        """
+        return (key for key, _ in _items(self._root))
+
+    def __repr__(self) -> str:
+        """Return string representation of the map."""
+        return f"PersistentMap({dict(self.items())})"
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return value for a key or a default.
+
+        Args:
+            key: Key to look up.
+            default: Value returned for a missing key.
+
+        Returns:
+            Value for the key, or default.
+        """
+        return _get(self._root, key, hash(key), default)
+
+    def items(self) -> Iterator[tuple]:
+        """Return iterator over (key, value) pairs.
+
+        Returns:
+            Iterator for pairs in the map.
+        """
+        return _items(self._root)
+
+    def set(self, key: Hashable, value: Any) -> "PersistentMap":
+        """Return a new map with a key set to a value.
+
+        Args:
+            key: Key to set.
+            value: Value to store.
+
+        Returns:
+            New map sharing unchanged nodes with this one.
+        """
+        root, added = _set(self._root, 0, key, hash(key), value)
+        return PersistentMap(root, self._size + added)
+
+    def delete(self, key: Hashable) -> "PersistentMap":
+        """Return a new map without a key.
+
+        Args:
+            key: Key to remove.
+
+        Returns:
+            New map without the key, or this map if the key is missing.
+        """
+        root = _delete(self._root, 0, key, hash(key))
+        if root is self._root:
+            return self
+        return PersistentMap(root if root is not None else _EMPTY_NODE, self._size - 1)
@@ -0,0 +1,245 @@
+import operator
+
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+
+INT64_MIN = -(1 << 63)
+
+INT64_MAX = (1 << 63) - 1
+
+
+def fits_int64(value: int) -> bool:
+    """Check if a value is an integer that an int64 array can store.
+
+    Args:
+        value: Value to check.
+
+    Returns:
+        True if the value is integral and within the int64 range, False otherwise.
+    """
+    try:
+        return INT64_MIN <= operator.index(value) <= INT64_MAX
+    except TypeError:
+        return False
+
+
+class TimeSeries:
+    """Append-only series of (step, value) points with prefix sums.
+
+    Steps must be appended in non-decreasing order, so lookups by step are binary
+    searches and sums over any step range take two lookups.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty series."""
+        self.steps: array = array("q")
+        self.values: array = array("q")
+        self._totals: array = array("q", [0])
+
+    def __len__(self) -> int:
+        """Return number of points in the series.
+
+        Returns:
+            Count of appended points.
+        """
+        return len(self.steps)
+
+    def append(self, step: int, value: int) -> None:
+        """Append a point.
+
+        Args:
+            step: Step of the point, not smaller than the last appended step.
+            value: Value of the point.
+
+        Raises:
+            ValueError: If the step is earlier than the last appended step, or the step,
+                the value or the running total does not fit in int64.
+        """
+        total = self._next_total(step, value)
+        self.steps.append(step)
+        self.values.append(value)
+        self._totals.append(total)
+
+    def check(self, step: int, value: int) -> None:
+        """Check a point can be appended, so several series can be updated all or nothing.
+
+        Args:
+            step: Step of the point.
+            value: Value of the point.
+
+        Raises:
+            ValueError: If `append` would reject the point.
+        """
+        self._next_total(step, value)
+
+    def _next_total(self, step: int, value: int) -> int:
+        """Validate a point before anything is appended and return the running total after it."""
+        if self.steps and step < self.steps[-1]:
+            raise ValueError("Time series steps must not decrease")
+        if not (fits_int64(step) and fits_int64(value) and fits_int64(total := self._totals[-1] + value)):
+            raise ValueError("Time series points must fit in int64")
+        return total
+
+    def value_at(self, step: int) -> int | None:
+        """Return the last value recorded at or before a step.
+
+        Args:
+            step: Step to look up.
+
+        Returns:
+            Value of the latest point not after the step, None if there is none.
+        """
+        position = bisect_right(self.steps, step)
+        return self.values[position - 1] if position else None
+
+    def total(self, start: int, stop: int) -> int:
+        """Return sum of values with steps in `[start, stop)`.
+
+        Args:
+            start: First step of the range.
+            stop: Step after the end of the range.
+
+        Returns:
+            Sum of values in the range.
+        """
+        return self._totals[bisect_left(self.steps, stop)] - self._totals[bisect_left(self.steps, start)]
+
+    def totals_per_window(self, window: int, start: int, stop: int) -> list[int]:
+        """Return sums of values over consecutive windows.
+
+        Args:
+            window: Number of steps per window.
+            start: First step of the first window.
+            stop: Step after the end of the last window.
+
+        Returns:
+            Sum per window; the last window may be shorter.
+
+        Raises:
+            ValueError: If the window is not positive.
+        """
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        steps = self.steps
+        totals = self._totals
+        bounds = [totals[bisect_left(steps, edge)] for edge in range(start, stop, window)]
+        bounds.append(totals[bisect_left(steps, stop)])
+        return [bounds[index + 1] - bounds[index] for index in range(len(bounds) - 1)]
+
+
+class PriceHistory:
+    """Append-only history of price changes and revenue per game_id.
+
+    Revenue records sales as positive amounts and refunds as negative ones. Besides the
+    per-game series, a store-wide revenue series answers windowed queries over all games.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        self._prices: dict[str, TimeSeries] = {}
+        self._revenue: dict[str, TimeSeries] = {}
+        self._store_revenue = TimeSeries()
+
+    def __repr__(self) -> str:
+        """Return summary of the history.
+
+        Returns:
+            String with the number of tracked games and revenue events.
+        """
+        return f"PriceHistory: {len(self._prices)} games, {len(self._store_revenue)} revenue events"
+
+    def record_price(self, game_id: str, step: int, price: int) -> None:
+        """Record the price of a game, skipping unchanged prices.
+
+        Args:
+            game_id: Game identifier.
+            step: Step of the change.
+            price: New price in rubles.
+
+        Raises:
+            ValueError: If the step is earlier than the last change or the price does not
+                fit in int64; nothing is recorded.
+        """
+        series = self._prices.get(game_id)
+        if series is None:
+            series = TimeSeries()
+            series.append(step, price)
+            self._prices[game_id] = series
+        elif series.values[-1] != price:
+            series.append(step, price)
+
+    def record_revenue(self, game_id: str, step: int, amount: int) -> None:
+        """Record a sale (positive amount) or a refund (negative amount).
+
+        Args:
+            game_id: Game identifier.
+            step: Step of the sale or refund.
+            amount: Revenue in rubles.
+
+        Raises:
+            ValueError: If the step is earlier than the last event or a value or total does
+                not fit in int64; nothing is recorded.
+        """
+        series = self._revenue.get(game_id)
+        if series is None:
+            series = TimeSeries()
+        series.check(step, amount)
+        self._store_revenue.check(step, amount)
+        series.append(step, amount)
+        self._store_revenue.append(step, amount)
+        self._revenue[game_id] = series
+
+    def price_at(self, game_id: str, step: int) -> int | None:
+        """Return price of a game at a step.
+
+        Args:
+            game_id: Game identifier.
+            step: Step to look up.
+
+        Returns:
+            Latest price set at or before the step, None if none was set yet.
+        """
+        series = self._prices.get(game_id)
+        return series.value_at(step) if series is not None else None
+
+    def price_changes(self, game_id: str) -> list[tuple[int, int]]:
+        """Return every recorded price change of a game.
+
+        Args:
+            game_id: Game identifier.
+
+        Returns:
+            List of (step, price) in chronological order.
+        """
+        series = self._prices.get(game_id)
+        return list(zip(series.steps, series.values)) if series is not None else []
+
+    def revenue(self, start: int, stop: int, game_id: str | None = None) -> int:
+        """Return revenue over steps `[start, stop)`.
+
+        Args:
+            start: First step of the range.
+            stop: Step after the end of the range.
+            game_id: Optional game to restrict to, the whole store if omitted.
+
+        Returns:
+            Sales minus refunds in rubles.
+        """
+        series = self._store_revenue if game_id is None else self._revenue.get(game_id)
+        return series.total(start, stop) if series is not None else 0
+
+    def revenue_per_window(self, window: int, start: int, stop: int, game_id: str | None = None) -> list[int]:
+        """Return revenue over consecutive windows of steps.
+
+        Args:
+            window: Number of steps per window.
+            start: First step of the first window.
+            stop: Step after the end of the last window.
+            game_id: Optional game to restrict to, the whole store if omitted.
+
+        Returns:
+            Revenue per window; the last window may be shorter.
+        """
+        series = self._store_revenue if game_id is None else self._revenue.get(game_id, TimeSeries())
+        return series.totals_per_window(window, start, stop)
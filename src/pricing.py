@@ -0,0 +1,139 @@
+from array import array
+
+import numpy as np
+
+from src.game_store import GameStore
+
+
+class PricingEngine:
+    """Dynamic pricing of every in-stock title in one vectorized pass.
+
+    Each title keeps the list price it had when the store columns first saw it. A repricing
+    pass multiplies it by three factors computed with NumPy over all titles at once:
+    demand (sales per step since the previous pass, relative to the average title),
+    scarcity (copies in stock relative to the median title) and age (discount per year
+    since release). Only changed prices are written back to the store.
+    """
+
+    def __init__(
+        self,
+        interval: int = 100,
+        demand_weight: float = 0.2,
+        scarcity_weight: float = 0.1,
+        yearly_discount: float = 0.03,
+        min_age_factor: float = 0.4,
+        current_year: int = 2025,
+        rounding: int = 10,
+        price_bounds: tuple[int, int] = (100, 10_000),
+    ) -> None:
+        """Initialize pricing policy.
+
+        Args:
+            interval: Number of simulation steps between passes.
+            demand_weight: Largest relative change caused by demand.
+            scarcity_weight: Largest relative change caused by stock level.
+            yearly_discount: Relative discount per year since release.
+            min_age_factor: Smallest age factor, however old the game.
+            current_year: Year ages are counted to.
+            rounding: Prices are rounded to a multiple of this many rubles.
+            price_bounds: Lowest and highest allowed price.
+
+        Raises:
+            ValueError: If interval or rounding is not positive, or bounds are reversed.
+        """
+        if interval <= 0 or rounding <= 0:
+            raise ValueError("Interval and rounding must be positive")
+        if price_bounds[0] > price_bounds[1]:
+            raise ValueError("Lowest price is above highest price")
+        self.interval = interval
+        self.demand_weight = demand_weight
+        self.scarcity_weight = scarcity_weight
+        self.yearly_discount = yearly_discount
+        self.min_age_factor = min_age_factor
+        self.current_year = current_year
+        self.rounding = rounding
+        self.price_bounds = price_bounds
+        self._last_sold = np.zeros(0, np.int64)
+        self._last_step: int | None = None
+
+    def __repr__(self) -> str:
+        """Return string representation of the engine."""
+        return f"PricingEngine(every {self.interval} steps, {len(self._last_sold)} titles seen)"
+
+    def compute(
+        self,
+        list_prices: np.ndarray,
+        velocity: np.ndarray,
+        stock: np.ndarray,
+        release_years: np.ndarray,
+    ) -> np.ndarray:
+        """Return new prices for titles described by parallel arrays.
+
+        Args:
+            list_prices: List price per title.
+            velocity: Copies sold per step per title.
+            stock: Copies in stock per title.
+            release_years: Release year per title.
+
+        Returns:
+            Integer array of new prices.
+        """
+        demand = 1 + self.demand_weight * np.tanh(velocity / (velocity.mean() + 1e-9) - 1)
+        scarcity = 1 - self.scarcity_weight * np.tanh(np.log(stock / np.median(stock)))
+        years_old = np.maximum(self.current_year - release_years, 0)
+        age = np.maximum(1 - self.yearly_discount * years_old, self.min_age_factor)
+        prices = np.rint(list_prices * demand * scarcity * age / self.rounding) * self.rounding
+        return np.clip(prices, *self.price_bounds).astype(np.int64)
+
+    def attach(self, store: GameStore) -> None:
+        """Start the per-title columns the engine reads from a store.
+
+        The store counts sales only once its columns are started, so attach the engine
+        before the sales that should drive demand; `reprice` attaches it on its first
+        pass otherwise. An engine reprices a single store, whose column rows it tracks.
+
+        Args:
+            store: Store to reprice later.
+        """
+        store.title_columns()
+
+    def reprice(self, store: GameStore) -> int:
+        """Recompute prices of every title in stock and write the changed ones to the store.
+
+        The store keeps list price, net sales, stock, release year and current price of
+        every title in int64 columns (`GameStore.title_columns`), so a pass copies whole
+        columns into NumPy and touches Python objects only for the changed titles.
+
+        Args:
+            store: Store to reprice.
+
+        Returns:
+            Number of titles whose price changed.
+        """
+        columns = store.title_columns()
+        stock = _column(columns.stock)
+        sold = _column(columns.sold)
+        last_sold = np.zeros(len(sold), np.int64)
+        last_sold[: len(self._last_sold)] = self._last_sold
+        elapsed = max(store.step - self._last_step, 1) if self._last_step is not None else max(store.step, 1)
+        self._last_sold = sold
+        self._last_step = store.step
+        rows = np.flatnonzero(stock > 0)
+        if not len(rows):
+            return 0
+
+        prices = self.compute(
+            _column(columns.list_price)[rows],
+            np.maximum(sold[rows] - last_sold[rows], 0) / elapsed,
+            stock[rows],
+            _column(columns.release_year)[rows],
+        )
+        changed = np.flatnonzero(prices != _column(columns.price)[rows])
+        games = columns.games
+        store.set_prices([games[row] for row in rows[changed].tolist()], prices[changed].tolist())
+        return len(changed)
+
+
+def _column(values: array) -> np.ndarray:
+    """Copy an int64 store column into a NumPy array, leaving the column free to grow."""
+    return np.frombuffer(values, np.int64).copy()
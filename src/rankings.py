@@ -0,0 +1,203 @@
+from typing import Iterable
+
+from src.game import Game
+
+
+class _Bucket:
+    """Node of the bucket list holding every title with the same count."""
+
+    __slots__ = ("count", "games", "lower", "higher")
+
+    def __init__(self, count: int, lower: "_Bucket | None" = None, higher: "_Bucket | None" = None) -> None:
+        """Initialize an empty bucket linked between two neighbours.
+
+        Args:
+            count: Count shared by the titles in the bucket.
+            lower: Neighbour with the next smaller count; the bucket itself if omitted.
+            higher: Neighbour with the next larger count; the bucket itself if omitted.
+        """
+        self.count = count
+        self.games: dict[str, Game] = {}
+        self.lower: _Bucket = self if lower is None else lower
+        self.higher: _Bucket = self if higher is None else higher
+
+
+class CountRanking:
+    """Titles ranked by a count that changes by one at a time.
+
+    Titles with equal counts share a bucket, and buckets form a list sorted by count,
+    so incrementing or decrementing a count moves the title to a neighbouring bucket
+    in O(1), and the n highest or lowest titles are read in O(n) without sorting.
+    Titles whose count drops to zero leave the ranking.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty ranking."""
+        self._clear()
+
+    def _clear(self) -> None:
+        """Reset the ranking to the head and tail sentinels with no titles between them."""
+        self._head = _Bucket(0)
+        self._tail = _Bucket(0, self._head)
+        self._head.higher = self._tail
+        self._buckets: dict[str, _Bucket] = {}
+
+    def __len__(self) -> int:
+        """Return number of ranked titles.
+
+        Returns:
+            Count of titles with a non-zero count.
+        """
+        return len(self._buckets)
+
+    def __contains__(self, game_id: str) -> bool:
+        """Check if a title is ranked.
+
+        Args:
+            game_id: Game identifier.
+
+        Returns:
+            True if the title has a non-zero count, False otherwise.
+        """
+        return game_id in self._buckets
+
+    def __getstate__(self) -> list[tuple[int, list[Game]]]:
+        """Return buckets as a flat list, so pickling does not recurse along the bucket list.
+
+        Returns:
+            (count, games) pairs in bucket order, games in their order within the bucket.
+        """
+        state = []
+        bucket = self._head.higher
+        while bucket is not self._tail:
+            state.append((bucket.count, list(bucket.games.values())))
+            bucket = bucket.higher
+        return state
+
+    def __setstate__(self, state: list[tuple[int, list[Game]]]) -> None:
+        """Rebuild the bucket list from `__getstate__` output.
+
+        Args:
+            state: (count, games) pairs in bucket order.
+        """
+        self._clear()
+        for count, games in state:
+            bucket = _Bucket(count, self._tail.lower, self._tail)
+            self._tail.lower.higher = bucket
+            self._tail.lower = bucket
+            for game in games:
+                bucket.games[game.game_id] = game
+                self._buckets[game.game_id] = bucket
+
+    @classmethod
+    def from_counts(cls, counts: Iterable[tuple[Game, int]]) -> "CountRanking":
+        """Build a ranking from known counts in one pass over the sorted counts.
+
+        Args:
+            counts: (Game, count) pairs with distinct game_id values; zero counts are skipped.
+
+        Returns:
+            Ranking holding every title with a positive count.
+        """
+        groups: dict[int, list[Game]] = {}
+        for game, count in counts:
+            if count > 0:
+                groups.setdefault(count, []).append(game)
+        ranking = cls.__new__(cls)
+        ranking.__setstate__(sorted(groups.items()))
+        return ranking
+
+    def count(self, game_id: str) -> int:
+        """Return count of a title.
+
+        Args:
+            game_id: Game identifier.
+
+        Returns:
+            Current count, 0 if the title is not ranked.
+        """
+        bucket = self._buckets.get(game_id)
+        return bucket.count if bucket is not None else 0
+
+    def increment(self, game: Game) -> None:
+        """Increase count of a title by one.
+
+        Args:
+            game: Game whose count grows.
+        """
+        game_id = game.game_id
+        bucket = self._buckets.get(game_id, self._head)
+        target = bucket.higher
+        if target is self._tail or target.count != bucket.count + 1:
+            target = _Bucket(bucket.count + 1, bucket, target)
+            bucket.higher.lower = target
+            bucket.higher = target
+        target.games[game_id] = game
+        self._buckets[game_id] = target
+        if bucket is not self._head:
+            self._leave(bucket, game_id)
+
+    def decrement(self, game: Game) -> None:
+        """Decrease count of a title by one, removing it from the ranking at zero.
+
+        Args:
+            game: Game whose count shrinks.
+
+        Raises:
+            ValueError: If the title is not ranked.
+        """
+        game_id = game.game_id
+        bucket = self._buckets.get(game_id)
+        if bucket is None:
+            raise ValueError("Game is not ranked")
+        if bucket.count == 1:
+            del self._buckets[game_id]
+        else:
+            target = bucket.lower
+            if target is self._head or target.count != bucket.count - 1:
+                target = _Bucket(bucket.count - 1, target, bucket)
+                bucket.lower.higher = target
+                bucket.lower = target
+            target.games[game_id] = game
+            self._buckets[game_id] = target
+        self._leave(bucket, game_id)
+
+    def highest(self, n: int) -> list[tuple[Game, int]]:
+        """Return titles with the largest counts.
+
+        Args:
+            n: Maximum number of titles.
+
+        Returns:
+            Up to n (Game, count) pairs, largest count first.
+        """
+        return self._collect(self._tail.lower, "lower", n)
+
+    def lowest(self, n: int) -> list[tuple[Game, int]]:
+        """Return titles with the smallest counts.
+
+        Args:
+            n: Maximum number of titles.
+
+        Returns:
+            Up to n (Game, count) pairs, smallest count first.
+        """
+        return self._collect(self._head.higher, "higher", n)
+
+    def _leave(self, bucket: _Bucket, game_id: str) -> None:
+        """Remove a title from a bucket and unlink the bucket if it becomes empty."""
+        del bucket.games[game_id]
+        if not bucket.games:
+            bucket.lower.higher = bucket.higher
+            bucket.higher.lower = bucket.lower
+
+    def _collect(self, bucket: _Bucket, direction: str, n: int) -> list[tuple[Game, int]]:
+        """Walk buckets from one end of the list and gather up to n titles."""
+        found: list[tuple[Game, int]] = []
+        while bucket is not self._head and bucket is not self._tail and len(found) < n:
+            for game in bucket.games.values():
+                if len(found) == n:
+                    break
+                found.append((game, bucket.count))
+            bucket = getattr(bucket, direction)
+        return found
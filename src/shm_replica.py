@@ -0,0 +1,402 @@
+import struct
+import sys
+import time
+
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+from typing import Callable
+from typing import Hashable
+from typing import TypeVar
+
+from src.game import Game
+from src.game_dict import BUILTIN_INDEX_KEYS
+from src.game_store import GameStore
+
+REPLICA_MAGIC = b"GSRP"
+
+REPLICA_VERSION = 2
+
+SEGMENT_HEADER = struct.Struct("<4sHxxQQ")
+
+SEQUENCE_OFFSET = 8
+
+PAYLOAD_HEADER = struct.Struct("<IIIIII")
+
+TITLE = struct.Struct("<IIIIIIIIiqq")
+
+INDEX_NAMES = ("developer", "release_year", "genre")
+
+READ_TIMEOUT = 1.0
+
+T = TypeVar("T")
+
+_created: set[str] = set()
+
+
+def _sort_key(value: Hashable) -> tuple[int, bytes]:
+    """Return the key replicas are ordered by: the value for years, UTF-8 bytes for strings."""
+    if isinstance(value, int):
+        return value, b""
+    return 0, str(value).encode()
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    """Return the memory of an attached segment.
+
+    Args:
+        shm: Segment to read.
+
+    Returns:
+        Segment buffer.
+
+    Raises:
+        ValueError: If the segment was closed.
+    """
+    buffer = shm.buf
+    if buffer is None:
+        raise ValueError("Replica segment is closed")
+    return buffer
+
+
+def build_payload(store: GameStore) -> bytes:
+    """Encode the titles, prices and built-in indexes of a store.
+
+    Layout: a header with the title count and section offsets, title records sorted by
+    game_id, one array of title positions per index sorted by key, and a string blob.
+    Readers binary-search the sections in place.
+
+    Args:
+        store: Store to encode.
+
+    Returns:
+        Encoded replica payload.
+    """
+    strings = bytearray()
+    string_refs: dict[str, tuple[int, int]] = {}
+
+    def ref(text: str) -> tuple[int, int]:
+        if text not in string_refs:
+            data = text.encode()
+            string_refs[text] = (len(strings), len(data))
+            strings.extend(data)
+        return string_refs[text]
+
+    games = sorted((store._by_id[game_id][0] for game_id in store._by_id), key=lambda game: game.game_id.encode())
+    titles = bytearray()
+    for game in games:
+        titles += TITLE.pack(
+            *ref(game.game_id),
+            *ref(game.title),
+            *ref(game.developer),
+            *ref(game.genre),
+            game.release_year,
+            len(store._by_id[game.game_id]),
+            store._prices[game],
+        )
+    sections = []
+    for name in INDEX_NAMES:
+        key_func = BUILTIN_INDEX_KEYS[name]
+        order = sorted(range(len(games)), key=lambda position: _sort_key(key_func(games[position])))
+        sections.append(struct.pack(f"<{len(order)}I", *order))
+
+    offset = PAYLOAD_HEADER.size + len(titles)
+    offsets = []
+    for section in sections:
+        offsets.append(offset)
+        offset += len(section)
+    header = PAYLOAD_HEADER.pack(len(games), PAYLOAD_HEADER.size, *offsets, offset)
+    return b"".join([header, titles, *sections, strings])
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without leaving it to this process's resource tracker.
+
+    Before Python 3.13 every attach registers the segment, and the tracker of a reader
+    process would destroy it when the reader exits, so the registration is withdrawn.
+    A segment created by a writer in this process stays registered for the writer.
+
+    Args:
+        name: Segment name.
+
+    Returns:
+        Attached segment.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    shm = shared_memory.SharedMemory(name=name)
+    if shm._name not in _created:  # type: ignore[attr-defined]
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+class ReplicaWriter:
+    """Publishes a store into a shared memory segment for reader processes.
+
+    The segment holds a sequence number and one payload. Publishing makes the sequence
+    odd, copies the new payload in and makes it even again (a seqlock), so readers
+    never lock and retry only when they overlap a publish.
+    """
+
+    def __init__(self, store: GameStore, capacity: int = 1 << 24, name: str | None = None) -> None:
+        """Create the shared memory segment.
+
+        Args:
+            store: Store to publish.
+            capacity: Segment size in bytes, header included.
+            name: Optional segment name, generated if omitted.
+        """
+        self._store = store
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=capacity)
+        _created.add(self._shm._name)  # type: ignore[attr-defined]
+        self._sequence = 0
+        SEGMENT_HEADER.pack_into(_buffer(self._shm), 0, REPLICA_MAGIC, REPLICA_VERSION, self._sequence, 0)
+
+    @property
+    def name(self) -> str:
+        """Return name readers attach to."""
+        return self._shm.name
+
+    def publish(self) -> int:
+        """Copy the current store contents into the segment.
+
+        Returns:
+            Version of the published replica, starting at 1.
+
+        Raises:
+            ValueError: If the payload does not fit into the segment.
+        """
+        payload = build_payload(self._store)
+        if SEGMENT_HEADER.size + len(payload) > self._shm.size:
+            raise ValueError("Replica segment is too small")
+        buffer = _buffer(self._shm)
+        self._sequence += 1
+        struct.pack_into("<Q", buffer, SEQUENCE_OFFSET, self._sequence)
+        struct.pack_into("<Q", buffer, SEQUENCE_OFFSET + 8, len(payload))
+        buffer[SEGMENT_HEADER.size : SEGMENT_HEADER.size + len(payload)] = payload
+        self._sequence += 1
+        struct.pack_into("<Q", buffer, SEQUENCE_OFFSET, self._sequence)
+        return self._sequence // 2
+
+    def close(self, unlink: bool = True) -> None:
+        """Detach from the segment.
+
+        Args:
+            unlink: Whether to destroy the segment as well.
+        """
+        self._shm.close()
+        if unlink:
+            _created.discard(self._shm._name)  # type: ignore[attr-defined]
+            self._shm.unlink()
+
+
+class ReplicaReader:
+    """Read-only view of a store published by a ReplicaWriter, possibly in another process.
+
+    Queries read the shared segment in place with binary search; only the returned
+    games are decoded. A query overlapping a publish is retried on the new payload
+    until the read timeout, so a writer that died mid-publish does not hang readers.
+    """
+
+    def __init__(self, name: str, timeout: float = READ_TIMEOUT) -> None:
+        """Attach to a published segment.
+
+        Args:
+            name: Segment name from `ReplicaWriter.name`.
+            timeout: Seconds a query keeps retrying while publishes overlap it.
+
+        Raises:
+            ValueError: If the segment is not a store replica.
+        """
+        self._shm = _attach(name)
+        self._timeout = timeout
+        magic, version, _, _ = SEGMENT_HEADER.unpack_from(_buffer(self._shm), 0)
+        if magic != REPLICA_MAGIC or version != REPLICA_VERSION:
+            self._shm.close()
+            raise ValueError("Not a store replica")
+
+    @property
+    def version(self) -> int:
+        """Return version of the last completed publish, 0 if none."""
+        return self._sequence() // 2
+
+    def search(self, index: str, key: str | int) -> list[Game]:
+        """Return distinct games with a key in a built-in index.
+
+        Args:
+            index: Index name: "developer", "release_year" or "genre".
+            key: Key to search for.
+
+        Returns:
+            Games found, empty if none.
+
+        Raises:
+            ValueError: If the index is unknown.
+        """
+        if index not in INDEX_NAMES:
+            raise ValueError(f"Index {index} does not exist")
+        field = INDEX_NAMES.index(index)
+        return self._read(lambda buffer, base: self._search(buffer, base, field, _sort_key(key)))
+
+    def search_by_genre(self, genre: str) -> list[Game]:
+        """Return distinct games of a genre.
+
+        Args:
+            genre: Genre to search for.
+
+        Returns:
+            Games found, empty if none.
+        """
+        return self.search("genre", genre)
+
+    def search_by_release_year(self, release_year: int) -> list[Game]:
+        """Return distinct games released in a year.
+
+        Args:
+            release_year: Year to search for.
+
+        Returns:
+            Games found, empty if none.
+        """
+        return self.search("release_year", release_year)
+
+    def search_by_developer(self, developer: str) -> list[Game]:
+        """Return distinct games of a developer.
+
+        Args:
+            developer: Developer name to search for.
+
+        Returns:
+            Games found, empty if none.
+        """
+        return self.search("developer", developer)
+
+    def copies(self, game_id: str) -> int:
+        """Return number of copies of a title in stock.
+
+        Args:
+            game_id: Game identifier.
+
+        Returns:
+            Copies in stock, 0 if absent.
+        """
+        record = self._read(lambda buffer, base: self._find(buffer, base, game_id.encode()))
+        return record[9] if record is not None else 0
+
+    def price(self, game_id: str) -> int | None:
+        """Return price of a title.
+
+        Args:
+            game_id: Game identifier.
+
+        Returns:
+            Price in rubles, None if the title is out of stock.
+        """
+        record = self._read(lambda buffer, base: self._find(buffer, base, game_id.encode()))
+        return record[10] if record is not None else None
+
+    def close(self) -> None:
+        """Detach from the segment."""
+        self._shm.close()
+
+    def _sequence(self) -> int:
+        """Return the current publish sequence number."""
+        return struct.unpack_from("<Q", _buffer(self._shm), SEQUENCE_OFFSET)[0]
+
+    def _read(self, query: Callable[[memoryview, int], T]) -> T:
+        """Run a query on a consistent payload, retrying while a publish overlaps it.
+
+        While a publish is in progress the reader yields its time slice instead of
+        spinning, and errors raised by decoding a torn payload are retried as well.
+
+        Args:
+            query: Function of the segment buffer and the payload offset.
+
+        Returns:
+            Result of the query on an unchanged payload.
+
+        Raises:
+            TimeoutError: If no publish-free read succeeded within the read timeout, e.g.
+                because the writer died in the middle of a publish.
+        """
+        buffer = _buffer(self._shm)
+        deadline = None
+        while True:
+            before = self._sequence()
+            if not before & 1:
+                try:
+                    result = query(buffer, SEGMENT_HEADER.size)
+                except (struct.error, IndexError, TypeError, ValueError, UnicodeDecodeError):
+                    if self._sequence() == before:
+                        raise
+                else:
+                    if self._sequence() == before:
+                        return result
+            if deadline is None:
+                deadline = time.monotonic() + self._timeout
+            elif time.monotonic() > deadline:
+                raise TimeoutError("Replica publish did not finish")
+            time.sleep(0)
+
+    @staticmethod
+    def _text(buffer: memoryview, strings: int, offset: int, length: int) -> bytes:
+        """Return raw bytes of a string from the blob."""
+        return bytes(buffer[strings + offset : strings + offset + length])
+
+    def _key(self, buffer: memoryview, base: int, record: tuple, field: int) -> tuple[int, bytes]:
+        """Return the sort key of a title record for an index field, shaped like `_sort_key`."""
+        if field == 1:
+            return record[8], b""
+        strings = base + PAYLOAD_HEADER.unpack_from(buffer, base)[5]
+        position = 4 if field == 0 else 6
+        return 0, self._text(buffer, strings, record[position], record[position + 1])
+
+    def _record(self, buffer: memoryview, base: int, position: int) -> tuple:
+        """Return the title record at a position of the title table."""
+        titles = base + PAYLOAD_HEADER.unpack_from(buffer, base)[1]
+        return TITLE.unpack_from(buffer, titles + position * TITLE.size)
+
+    def _game(self, buffer: memoryview, base: int, record: tuple) -> Game:
+        """Decode the Game of a title record."""
+        strings = base + PAYLOAD_HEADER.unpack_from(buffer, base)[5]
+        game_id, title, developer, genre = (
+            self._text(buffer, strings, record[position], record[position + 1]).decode() for position in (0, 2, 4, 6)
+        )
+        return Game(title, developer, record[8], genre, game_id)
+
+    def _find(self, buffer: memoryview, base: int, game_id: bytes) -> tuple | None:
+        """Binary-search the title table for a game_id."""
+        count, _, _, _, _, strings = PAYLOAD_HEADER.unpack_from(buffer, base)
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            record = self._record(buffer, base, middle)
+            current = self._text(buffer, base + strings, record[0], record[1])
+            if current == game_id:
+                return record
+            if current < game_id:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def _search(self, buffer: memoryview, base: int, field: int, key: tuple[int, bytes]) -> list[Game]:
+        """Binary-search an index section for the first title with a key and collect matches."""
+        header = PAYLOAD_HEADER.unpack_from(buffer, base)
+        count = header[0]
+        section = base + header[2 + field]
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            (position,) = struct.unpack_from("<I", buffer, section + 4 * middle)
+            if self._key(buffer, base, self._record(buffer, base, position), field) < key:
+                low = middle + 1
+            else:
+                high = middle
+        found = []
+        for index in range(low, count):
+            (position,) = struct.unpack_from("<I", buffer, section + 4 * index)
+            record = self._record(buffer, base, position)
+            if self._key(buffer, base, record, field) != key:
+                break
+            found.append(self._game(buffer, base, record))
+        return found
@@ -1,15 +1,49 @@
 from random import choice
+from random import getstate
 from random import randint
 from random import seed
+from typing import TYPE_CHECKING
+from typing import NamedTuple
 
 from src.game import Game
 from src.game_store import GameStore
-from src.games_db import GAMES_DATABASE
+from src.games_db import get_games_database
 
 EVENTS_DATABASE = ["add", "remove", "buy", "stats", "search", "return"]
 
 SEARCH_TYPES = ["genre", "year", "developer"]
 
+if TYPE_CHECKING:
+    from src.checkpoint import Checkpointer
+    from src.pricing import PricingEngine
+    from src.trace import TraceWriter
+    from src.workload import Workload
+    from src.workload_spec import SpecSampler
+    from src.workload_spec import WorkloadSpec
+
+
+class Step(NamedTuple):
+    """Single simulation event with every value drawn for it.
+
+    Attributes:
+        event: Event name from EVENTS_DATABASE.
+        game: Game the event applies to, None for "stats".
+        price: Price for "add" events.
+        balance: Client balance for "buy" events.
+        days: Days since purchase drawn for "return" events.
+        search_type: Search criterion from SEARCH_TYPES for "search" events.
+
+    Returns refund the latest recorded sale of the game, so their price and days are not
+    applied; they are still drawn to keep the random sequence of seeded runs unchanged.
+    """
+
+    event: str
+    game: Game | None = None
+    price: int = 0
+    balance: int = 0
+    days: int = 0
+    search_type: str = ""
+
 
 def random_game() -> Game:
     """Select a random game from the database.
@@ -17,7 +51,7 @@ def random_game() -> Game:
     Returns:
         Random Game object from GAMES_DATABASE.
     """
-    return choice(GAMES_DATABASE)
+    return choice(get_games_database())
 
 
 def random_price() -> int:
@@ -47,52 +81,197 @@ def random_event() -> str:
     return choice(EVENTS_DATABASE)
 
 
-def simulate(start_games_amount: int, steps: int, random_seed: int | None = None) -> None:
+def random_step() -> Step:
+    """Draw a random simulation event together with its parameters.
+
+    Returns:
+        Step with the values the event needs, drawn in a fixed order.
+    """
+    event: str = random_event()
+
+    match event:
+        case "add":
+            return Step(event, random_game(), random_price())
+        case "remove":
+            return Step(event, random_game())
+        case "buy":
+            return Step(event, random_game(), balance=random_balance())
+        case "search":
+            search_type: str = choice(SEARCH_TYPES)
+            return Step(event, random_game(), search_type=search_type)
+        case "return":
+            days: int = randint(1, 60)
+            return Step(event, random_game(), random_price(), days=days)
+    return Step(event)
+
+
+def apply_step(store: GameStore, step: Step) -> None:
+    """Apply a simulation event to the store.
+
+    Args:
+        store: Store the event is applied to.
+        step: Event with its parameters.
+
+    Raises:
+        ValueError: If an event other than "stats" has no game.
+    """
+    if step.event == "stats":
+        store.get_stats()
+        return
+    game = step.game
+    if game is None:
+        raise ValueError(f"Event {step.event} requires a game")
+
+    match step.event:
+        case "add":
+            store.add_game(game, step.price)
+        case "remove":
+            store.remove_game(game)
+        case "buy":
+            store.buy_game(game, step.balance)
+        case "search":
+            match step.search_type:
+                case "genre":
+                    store.search_by_genre(game.genre)
+                case "year":
+                    store.search_by_release_year(game.release_year)
+                case "developer":
+                    store.search_by_developer(game.developer)
+        case "return":
+            store.return_game(game)
+
+
+def simulate(
+    start_games_amount: int,
+    steps: int,
+    random_seed: int | None = None,
+    recorder: "TraceWriter | None" = None,
+    workload: "Workload | None" = None,
+    spec: "WorkloadSpec | None" = None,
+    verbose: bool = True,
+    pricing: "PricingEngine | None" = None,
+    checkpoint: "Checkpointer | None" = None,
+) -> GameStore:
     """Run the main game store simulation.
 
     Args:
         start_games_amount: Initial number of games to add to store.
         steps: Number of simulation steps to execute.
         random_seed: Optional seed for random number generation.
+        recorder: Optional trace writer receiving every applied event.
+        workload: Optional pre-generated events used instead of drawing each step.
+        spec: Optional workload spec with weighted events, phases and skewed game popularity.
+        verbose: Whether the simulation and the store print their progress.
+        pricing: Optional pricing engine repricing the store every `pricing.interval` steps.
+        checkpoint: Optional checkpointer saving the run every `checkpoint.interval` steps
+            for `checkpoint.resume`.
+
+    Returns:
+        Store in its final state.
+
+    Raises:
+        ValueError: If the workload has fewer events than requested steps, both
+            a workload and a spec are given, or a checkpointed or repriced run has a recorder.
     """
+    if workload is not None and len(workload) < steps:
+        raise ValueError("Workload is shorter than requested steps")
+    if workload is not None and spec is not None:
+        raise ValueError("Pass either a workload or a workload spec")
+    if checkpoint is not None and recorder is not None:
+        raise ValueError("Checkpointed runs cannot be recorded")
+    if pricing is not None and recorder is not None:
+        raise ValueError("Repriced runs cannot be recorded")
     if random_seed is not None:
         seed(random_seed)
 
-    store: GameStore = GameStore()
-    print("🔃Preparing to simulate...\n")
+    sampler = spec.sampler(get_games_database()) if spec is not None else None
+    store: GameStore = GameStore(verbose)
+    if pricing is not None:
+        pricing.attach(store)
+    if verbose:
+        print("🔃Preparing to simulate...\n")
 
     for _ in range(start_games_amount):
-        store.add_game(random_game(), random_price())
-
-    print("\n🔃Starting simulation...")
-
-    for i in range(steps):
-        print(f"\n📋Step: {i + 1}/{steps}")
-        event: str = random_event()
-
-        match event:
-            case "add":
-                store.add_game(random_game(), random_price())
-            case "remove":
-                store.remove_game(random_game())
-            case "buy":
-                store.buy_game(random_game(), random_balance())
-            case "stats":
-                store.get_stats()
-            case "search":
-                search_type: str = choice(SEARCH_TYPES)
-                game_for_search: Game = random_game()
-
-                match search_type:
-                    case "genre":
-                        store.search_by_genre(game_for_search.genre)
-                    case "year":
-                        store.search_by_release_year(game_for_search.release_year)
-                    case "developer":
-                        store.search_by_developer(game_for_search.developer)
-            case "return":
-                days: int = randint(1, 60)
-                store.return_game(random_game(), random_price(), days)
-
-    print("\n✅Simulation complete\n")
+        game = sampler.random_game() if sampler is not None else random_game()
+        step = Step("add", game, random_price())
+        if recorder is not None:
+            recorder.record(step)
+        apply_step(store, step)
+
+    if verbose:
+        print("\n🔃Starting simulation...")
+
+    return run_steps(store, 0, steps, workload, sampler, recorder, verbose, pricing, checkpoint)
+
+
+def run_steps(
+    store: GameStore,
+    first: int,
+    steps: int,
+    workload: "Workload | None",
+    sampler: "SpecSampler | None",
+    recorder: "TraceWriter | None",
+    verbose: bool,
+    pricing: "PricingEngine | None",
+    checkpoint: "Checkpointer | None",
+) -> GameStore:
+    """Run the simulation loop from a given step to the end.
+
+    Args:
+        store: Store after the initial fill or restored from a checkpoint.
+        first: Index of the first step to run.
+        steps: Total number of simulation steps.
+        workload: Optional pre-generated events.
+        sampler: Optional sampler following a workload spec.
+        recorder: Optional trace writer.
+        verbose: Whether the simulation prints its progress.
+        pricing: Optional pricing engine.
+        checkpoint: Optional checkpointer; it checks the run can be pickled and saves the
+            workload and sampler once before the first step.
+
+    Returns:
+        Store in its final state.
+
+    Raises:
+        ValueError: If the run is checkpointed and the store or its inputs cannot be pickled.
+    """
+    if checkpoint is not None:
+        checkpoint.start(store, {"workload": workload, "sampler": sampler})
+    planned_steps = workload.steps(get_games_database(), first) if workload is not None else None
+    for i in range(first, steps):
+        store.tick()
+        if verbose:
+            print(f"\n📋Step: {i + 1}/{steps}")
+        if planned_steps is not None:
+            step = next(planned_steps)
+        elif sampler is not None:
+            step = sampler.step(i)
+        else:
+            step = random_step()
+        if recorder is not None:
+            recorder.record(step, store.step)
+        apply_step(store, step)
+        if pricing is not None and (i + 1) % pricing.interval == 0:
+            updated = pricing.reprice(store)
+            if verbose:
+                print(f"💹Prices updated: {updated}")
+        if checkpoint is not None and (i + 1) % checkpoint.interval == 0 and i + 1 < steps:
+            checkpoint.save(
+                {
+                    "store": store,
+                    "random_state": getstate(),
+                    "next_step": i + 1,
+                    "steps": steps,
+                    "verbose": verbose,
+                    "pricing": pricing,
+                }
+            )
+            if verbose:
+                print(f"💾Checkpoint saved after step {i + 1}")
+
+    if checkpoint is not None:
+        checkpoint.wait()
+    if verbose:
+        print("\n✅Simulation complete\n")
     store.get_stats()
+    return store
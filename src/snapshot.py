@@ -0,0 +1,311 @@
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+
+from src.game import Game
+from src.game_dict import BUILTIN_INDEX_KEYS
+from src.persistent_map import PersistentMap
+
+
+class StoreState:
+    """Immutable point-in-time contents of a store.
+
+    Attributes:
+        titles: Map of game_id to (Game, copies in stock).
+        indexes: Map of index name to a map of key to a map of game_id to Game.
+        prices: Map of game_id to current price.
+        copies: Total number of copies in stock.
+        profit: Store profit in rubles.
+        sold_games: Number of sold games.
+        returned_games: Number of returned games.
+    """
+
+    __slots__ = ("titles", "indexes", "prices", "copies", "profit", "sold_games", "returned_games")
+
+    def __init__(
+        self,
+        titles: PersistentMap,
+        indexes: dict[str, PersistentMap],
+        prices: PersistentMap,
+        copies: int,
+        profit: int,
+        sold_games: int,
+        returned_games: int,
+    ) -> None:
+        """Initialize state; never mutated afterwards.
+
+        Args:
+            titles: Map of game_id to (Game, copies in stock).
+            indexes: Map of index name to a map of key to a map of game_id to Game.
+            prices: Map of game_id to current price.
+            copies: Total number of copies in stock.
+            profit: Store profit in rubles.
+            sold_games: Number of sold games.
+            returned_games: Number of returned games.
+        """
+        self.titles = titles
+        self.indexes = indexes
+        self.prices = prices
+        self.copies = copies
+        self.profit = profit
+        self.sold_games = sold_games
+        self.returned_games = returned_games
+
+
+class PersistentIndexes:
+    """Structurally shared mirror of a store's indexes, maintained on every mutation.
+
+    Mutations build new versions of the touched trie paths only (O(log n) each) and
+    publish a new StoreState with a single attribute assignment, so taking a snapshot
+    is O(1) and never waits for a writer.
+    """
+
+    def __init__(self, games: Iterable[tuple[Game, int, int]], counters: tuple[int, int, int]) -> None:
+        """Build the mirror from the current store contents.
+
+        Args:
+            games: Tuples of (Game, copies in stock, price) per title.
+            counters: Profit, sold games and returned games.
+        """
+        titles = PersistentMap()
+        prices = PersistentMap()
+        indexes = {name: PersistentMap() for name in BUILTIN_INDEX_KEYS}
+        copies = 0
+        for game, amount, price in games:
+            titles = titles.set(game.game_id, (game, amount))
+            prices = prices.set(game.game_id, price)
+            for name, key_func in BUILTIN_INDEX_KEYS.items():
+                indexes[name] = _index_add(indexes[name], key_func(game), game)
+            copies += amount
+        self.state = StoreState(titles, indexes, prices, copies, *counters)
+
+    def add(self, game: Game, price: int) -> None:
+        """Record a copy added to the store.
+
+        Args:
+            game: Added game.
+            price: New price of the game.
+        """
+        state = self.state
+        entry = state.titles.get(game.game_id)
+        indexes = state.indexes
+        if entry is None:
+            indexes = {
+                name: _index_add(indexes[name], key_func(game), game) for name, key_func in BUILTIN_INDEX_KEYS.items()
+            }
+        amount = entry[1] + 1 if entry is not None else 1
+        self.state = StoreState(
+            state.titles.set(game.game_id, (game, amount)),
+            indexes,
+            state.prices.set(game.game_id, price),
+            state.copies + 1,
+            state.profit,
+            state.sold_games,
+            state.returned_games,
+        )
+
+    def remove(self, game: Game, counters: tuple[int, int, int]) -> None:
+        """Record a copy removed from the store and the current counters.
+
+        Args:
+            game: Removed game.
+            counters: Profit, sold games and returned games after the removal.
+        """
+        state = self.state
+        titles = state.titles
+        prices = state.prices
+        indexes = state.indexes
+        amount = titles[game.game_id][1] - 1
+        if amount:
+            titles = titles.set(game.game_id, (game, amount))
+        else:
+            titles = titles.delete(game.game_id)
+            prices = prices.delete(game.game_id)
+            indexes = {
+                name: _index_remove(indexes[name], key_func(game), game.game_id)
+                for name, key_func in BUILTIN_INDEX_KEYS.items()
+            }
+        self.state = StoreState(titles, indexes, prices, state.copies - 1, *counters)
+
+    def set_prices(self, prices: Iterable[tuple[Game, int]]) -> None:
+        """Record new prices of titles in stock.
+
+        Args:
+            prices: Pairs of game and new price.
+        """
+        state = self.state
+        updated = state.prices
+        for game, price in prices:
+            updated = updated.set(game.game_id, price)
+        self.state = StoreState(
+            state.titles,
+            state.indexes,
+            updated,
+            state.copies,
+            state.profit,
+            state.sold_games,
+            state.returned_games,
+        )
+
+    def set_counters(self, counters: tuple[int, int, int]) -> None:
+        """Record new profit and sale counters.
+
+        Args:
+            counters: Profit, sold games and returned games.
+        """
+        state = self.state
+        self.state = StoreState(state.titles, state.indexes, state.prices, state.copies, *counters)
+
+
+def _index_add(index: PersistentMap, key: Hashable, game: Game) -> PersistentMap:
+    """Return index with a title added to the bucket of a key."""
+    return index.set(key, index.get(key, PersistentMap()).set(game.game_id, game))
+
+
+def _index_remove(index: PersistentMap, key: Hashable, game_id: str) -> PersistentMap:
+    """Return index with a title removed from the bucket of a key, dropping empty buckets."""
+    bucket = index[key].delete(game_id)
+    return index.set(key, bucket) if len(bucket) else index.delete(key)
+
+
+class StoreSnapshot:
+    """Read-only point-in-time view of a GameStore.
+
+    The view never changes after it is taken, no matter what happens to the store.
+    """
+
+    def __init__(self, state: StoreState) -> None:
+        """Initialize view over a published store state.
+
+        Args:
+            state: Immutable store contents.
+        """
+        self._state = state
+
+    def __len__(self) -> int:
+        """Return total number of game copies at snapshot time.
+
+        Returns:
+            Count of all game copies.
+        """
+        return self._state.copies
+
+    def __contains__(self, game: Game) -> bool:
+        """Check if a game was in stock at snapshot time.
+
+        Args:
+            game: Game object to check for.
+
+        Returns:
+            True if at least one copy was in stock, False otherwise.
+        """
+        entry = self._state.titles.get(game.game_id)
+        return entry is not None and entry[0] == game
+
+    def __iter__(self) -> Iterator[Game]:
+        """Return iterator over all game copies at snapshot time.
+
+        Returns:
+            Iterator yielding each game once per copy.
+        """
+        for game, amount in (entry for _, entry in self._state.titles.items()):
+            for _ in range(amount):
+                yield game
+
+    def __repr__(self) -> str:
+        """Return summary of snapshot inventory.
+
+        Returns:
+            String with unique game count and total copies count.
+        """
+        return f"Game store snapshot: {len(self._state.titles)} unique games ({self._state.copies} total copies)"
+
+    def copies(self, game: Game) -> int:
+        """Return number of copies of a game at snapshot time.
+
+        Args:
+            game: Game to count.
+
+        Returns:
+            Copies in stock, 0 if absent.
+        """
+        entry = self._state.titles.get(game.game_id)
+        return entry[1] if entry is not None else 0
+
+    def price(self, game: Game) -> int | None:
+        """Return price of a game at snapshot time.
+
+        Args:
+            game: Game to look up.
+
+        Returns:
+            Price in rubles, None if the game was out of stock.
+        """
+        return self._state.prices.get(game.game_id)
+
+    def search(self, index: str, key: Hashable) -> list[Game]:
+        """Return distinct games with a key in an index.
+
+        Args:
+            index: Index name, e.g. "developer", "release_year" or "genre".
+            key: Key to search for.
+
+        Returns:
+            Games found, empty if none.
+
+        Raises:
+            KeyError: If the index is unknown.
+        """
+        bucket = self._state.indexes[index].get(key)
+        return [game for _, game in bucket.items()] if bucket is not None else []
+
+    def search_by_genre(self, genre: str) -> list[Game]:
+        """Return distinct games of a genre.
+
+        Args:
+            genre: Genre to search for.
+
+        Returns:
+            Games found, empty if none.
+        """
+        return self.search("genre", genre)
+
+    def search_by_release_year(self, release_year: int) -> list[Game]:
+        """Return distinct games released in a year.
+
+        Args:
+            release_year: Year to search for.
+
+        Returns:
+            Games found, empty if none.
+        """
+        return self.search("release_year", release_year)
+
+    def search_by_developer(self, developer: str) -> list[Game]:
+        """Return distinct games of a developer.
+
+        Args:
+            developer: Developer name to search for.
+
+        Returns:
+            Games found, empty if none.
+        """
+        return self.search("developer", developer)
+
+    def stats(self) -> dict[str, int]:
+        """Return store statistics at snapshot time.
+
+        Returns:
+            Dictionary with the same keys as `GameStore.stats()`.
+        """
+        state = self._state
+        return {
+            "games": state.copies,
+            "unique_games": len(state.titles),
+            "unique_developers": len(state.indexes["developer"]),
+            "unique_release_years": len(state.indexes["release_year"]),
+            "unique_genres": len(state.indexes["genre"]),
+            "profit": state.profit,
+            "sold_games": state.sold_games,
+            "returned_games": state.returned_games,
+        }
@@ -0,0 +1,519 @@
+import sqlite3
+
+from collections import OrderedDict
+from types import TracebackType
+from typing import Hashable
+from typing import Iterator
+
+from src.game import Game
+from src.game import game_type
+from src.game_collection import GameCollection
+from src.game_store import RETURN_PERIOD
+from src.price_history import fits_int64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS titles (
+    game_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    developer TEXT NOT NULL,
+    release_year INTEGER NOT NULL,
+    genre TEXT NOT NULL,
+    copies INTEGER NOT NULL,
+    price INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS titles_developer ON titles (developer);
+CREATE INDEX IF NOT EXISTS titles_release_year ON titles (release_year);
+CREATE INDEX IF NOT EXISTS titles_genre ON titles (genre);
+CREATE INDEX IF NOT EXISTS titles_price ON titles (price);
+CREATE TABLE IF NOT EXISTS sales (
+    sale_id INTEGER PRIMARY KEY,
+    game_id TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    price INTEGER NOT NULL,
+    returned INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sales_game ON sales (game_id, sale_id);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+COUNTERS = ("profit", "sold_games", "returned_games", "step")
+
+SEARCH_COLUMNS = ("developer", "release_year", "genre", "price")
+
+
+class _Title:
+    """Hot cache entry of a title in stock."""
+
+    __slots__ = ("game", "copies", "price")
+
+    def __init__(self, game: Game, copies: int, price: int) -> None:
+        """Initialize entry.
+
+        Args:
+            game: Game of the title.
+            copies: Copies in stock.
+            price: Current price in rubles.
+        """
+        self.game = game
+        self.copies = copies
+        self.price = price
+
+
+class SQLiteGameStore:
+    """GameStore backend keeping inventory and sales in an SQLite database.
+
+    Copies of a title are stored as one row with a copy count, and the developer,
+    release year, genre and price lookups are served by SQL indexes, so inventory size
+    is bounded by disk rather than memory. Mutations are grouped into transactions of
+    `batch_size` operations, and a bounded LRU cache of recently used titles answers
+    `buy_game` lookups without a query. The store supports the inventory, sales, search
+    and statistics API of GameStore.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        verbose: bool = True,
+        batch_size: int = 1000,
+        cache_size: int = 10_000,
+    ) -> None:
+        """Open or create a store database.
+
+        Args:
+            path: Database file path, `:memory:` for a temporary database.
+            verbose: Whether operations print their log messages.
+            batch_size: Number of mutations committed together.
+            cache_size: Maximum number of titles kept in the hot cache.
+
+        Raises:
+            ValueError: If batch or cache size is not positive.
+        """
+        if batch_size <= 0 or cache_size <= 0:
+            raise ValueError("Batch and cache sizes must be positive")
+        self._verbose = verbose
+        self._batch_size = batch_size
+        self._cache_size = cache_size
+        self._pending = 0
+        self._cache: OrderedDict[str, _Title] = OrderedDict()
+        self._db = sqlite3.connect(path, isolation_level=None)
+        self._db.executescript(SCHEMA)
+        counters = dict(self._db.execute("SELECT name, value FROM counters"))
+        self._profit: int = counters.get("profit", 0)
+        self._sold_games: int = counters.get("sold_games", 0)
+        self._return_games: int = counters.get("returned_games", 0)
+        self._step: int = counters.get("step", 0)
+        self.last_sale_id: int | None = None
+
+    def __enter__(self) -> "SQLiteGameStore":
+        """Return the store for use in a `with` block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Commit pending mutations and close the database."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return total number of game copies in store.
+
+        Returns:
+            Count of all game copies in inventory.
+        """
+        return self._db.execute("SELECT COALESCE(SUM(copies), 0) FROM titles").fetchone()[0]
+
+    def __contains__(self, game: Game) -> bool:
+        """Check if specific game copy exists in store.
+
+        Args:
+            game: Game object to check for.
+
+        Returns:
+            True if game exists in store, False otherwise.
+        """
+        entry = self._entry(game.game_id)
+        return entry is not None and entry.game == game
+
+    def __iter__(self) -> Iterator[Game]:
+        """Return iterator over all game copies in store.
+
+        Returns:
+            Iterator yielding each game once per copy.
+        """
+        rows = self._db.execute("SELECT title, developer, release_year, genre, game_id, copies FROM titles")
+        for title, developer, release_year, genre, game_id, copies in rows:
+            game = Game(title, developer, release_year, genre, game_id)
+            for _ in range(copies):
+                yield game
+
+    def __repr__(self) -> str:
+        """Return summary of store inventory.
+
+        Returns:
+            String with unique game count and total copies count.
+        """
+        unique_games, total_copies = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(copies), 0) FROM titles"
+        ).fetchone()
+        return f"Game store: {unique_games} unique games ({total_copies} total copies)"
+
+    @property
+    def step(self) -> int:
+        """Return current step of the store clock."""
+        return self._step
+
+    def tick(self, steps: int = 1) -> int:
+        """Advance the store clock.
+
+        Args:
+            steps: Number of steps to advance by.
+
+        Returns:
+            New current step.
+
+        Raises:
+            ValueError: If steps is negative.
+        """
+        if steps < 0:
+            raise ValueError("Clock cannot go backwards")
+        self._step += steps
+        return self._step
+
+    def add_game(self, game: Game, price: int) -> None:
+        """Add a game copy to store inventory with specified price.
+
+        Args:
+            game: Game object to add.
+            price: Price in rubles for the game.
+
+        Raises:
+            ValueError: If the price is not an integer within the int64 range or another game
+                has the same game_id; the store is left unchanged.
+        """
+        if not fits_int64(price):
+            raise ValueError("Price must be an int64 integer")
+        entry = self._entry(game.game_id)
+        if entry is not None and entry.game != game:
+            raise ValueError(f"Game id {game.game_id} belongs to another game")
+        self._begin()
+        if entry is None:
+            self._db.execute(
+                "INSERT INTO titles VALUES (?, ?, ?, ?, ?, 1, ?)",
+                (game.game_id, game.title, game.developer, game.release_year, game.genre, price),
+            )
+            self._remember(game.game_id, _Title(game, 1, price))
+        else:
+            self._db.execute(
+                "UPDATE titles SET copies = copies + 1, price = ? WHERE game_id = ?", (price, game.game_id)
+            )
+            entry.copies += 1
+            entry.price = price
+        self._done()
+        if self._verbose:
+            print(f'📦"{game.title}" added. New price: {price} rub')
+
+    @game_type
+    def remove_game(self, game: Game, print_log: bool = True) -> bool:
+        """Remove a game copy from store inventory.
+
+        Args:
+            game: Game object to remove.
+            print_log: Whether to print removal messages.
+
+        Returns:
+            True if removal successful, False if game not found.
+        """
+        entry = self._entry(game.game_id)
+        if entry is None or entry.game != game:
+            if self._verbose:
+                print(f'❌"{game.title}" remove failed:')
+                print("\t⚠️game is not in store")
+            return False
+        self._begin()
+        if entry.copies > 1:
+            self._db.execute("UPDATE titles SET copies = copies - 1 WHERE game_id = ?", (game.game_id,))
+        else:
+            self._db.execute("DELETE FROM titles WHERE game_id = ?", (game.game_id,))
+            del self._cache[game.game_id]
+        entry.copies -= 1
+        self._done()
+        if print_log and self._verbose:
+            print(f'🚫copy of "{game.title}" removed from sale.')
+        if not entry.copies and self._verbose:
+            print(f'⛔️"{game.title}" is out of stock.')
+        return True
+
+    @game_type
+    def return_game(self, game: Game, sale_id: int | None = None) -> bool:
+        """Process game return from a client.
+
+        Args:
+            game: Game object being returned.
+            sale_id: Purchase id saved from `last_sale_id` after `buy_game`; the latest
+                sale of the game that was not returned yet if omitted.
+
+        Returns:
+            True if return successful, False if there is no such sale or return period expired.
+        """
+        if sale_id is None:
+            row = self._db.execute(
+                "SELECT sale_id, game_id, step, price, returned FROM sales"
+                " WHERE game_id = ? AND returned = 0 AND step >= ? ORDER BY sale_id DESC LIMIT 1",
+                (game.game_id, self._step - RETURN_PERIOD),
+            ).fetchone()
+            if row is None:
+                if self._verbose:
+                    print(f'❌"{game.title}" return failed:')
+                    print("\t⚠️no purchase in the last two weeks")
+                return False
+        else:
+            row = self._db.execute(
+                "SELECT sale_id, game_id, step, price, returned FROM sales WHERE sale_id = ?", (sale_id,)
+            ).fetchone()
+        if row is None or row[1] != game.game_id or row[4]:
+            if self._verbose:
+                print(f'❌"{game.title}" return failed:')
+                print("\t⚠️no such purchase")
+            return False
+        row_id, _, step, price, _ = row
+        if self._step - step > RETURN_PERIOD:
+            if self._verbose:
+                print(f'❌"{game.title}" return failed:')
+                print("\t⚠️two weeks passed")
+            return False
+        if self._verbose:
+            print(f'↩️"{game.title}" returned by client. Price: {price} rub')
+        self._begin()
+        self._db.execute("UPDATE sales SET returned = 1 WHERE sale_id = ?", (row_id,))
+        self._profit -= price
+        self._return_games += 1
+        self._done()
+        return True
+
+    @game_type
+    def buy_game(self, game: Game, client_balance: int) -> bool:
+        """Process game purchase by a client.
+
+        A successful purchase is recorded in the sales table and its purchase id is
+        kept in `last_sale_id` for a later `return_game`.
+
+        Args:
+            game: Game object to purchase.
+            client_balance: Client's available balance in rubles.
+
+        Returns:
+            True if purchase successful, False if failed.
+        """
+        entry = self._entry(game.game_id)
+        if entry is None:
+            if self._verbose:
+                print(f'❌"{game.title}" sell failed:')
+                print("\t⚠️Game is not in store")
+            return False
+
+        price = entry.price
+        if client_balance < price:
+            if self._verbose:
+                print(f'❌"{game.title}" sell failed:')
+                print(f"\t⚠️Not enough money ({client_balance} rub of {price} rub)")
+            return False
+
+        if self._verbose:
+            print(f'✅"{game.title}" sold for {price} rub')
+        self._begin()
+        cursor = self._db.execute(
+            "INSERT INTO sales (game_id, step, price) VALUES (?, ?, ?)", (game.game_id, self._step, price)
+        )
+        self.last_sale_id = cursor.lastrowid
+        self._profit += price
+        self._sold_games += 1
+        self._done()
+        self.remove_game(game, False)
+        return True
+
+    def stats(self) -> dict[str, int]:
+        """Return store statistics.
+
+        Returns:
+            Dictionary with the same keys as `GameStore.stats()`.
+        """
+        games, unique_games, developers, years, genres = self._db.execute(
+            "SELECT COALESCE(SUM(copies), 0), COUNT(*), COUNT(DISTINCT developer),"
+            " COUNT(DISTINCT release_year), COUNT(DISTINCT genre) FROM titles"
+        ).fetchone()
+        return {
+            "games": games,
+            "unique_games": unique_games,
+            "unique_developers": developers,
+            "unique_release_years": years,
+            "unique_genres": genres,
+            "profit": self._profit,
+            "sold_games": self._sold_games,
+            "returned_games": self._return_games,
+        }
+
+    def get_stats(self) -> None:
+        """Display comprehensive store statistics."""
+        if not self._verbose:
+            return
+        stats = self.stats()
+        print(
+            "📊Statistics:\n"
+            + f"\t🎮Number of games: {stats['games']}\n"
+            + f"\t🆔Unique games: {stats['unique_games']}\n"
+            + f"\t‍💻Unique developers: {stats['unique_developers']}\n"
+            + f"\t📅Unique release years: {stats['unique_release_years']}\n"
+            + f"\t🎭Unique genres: {stats['unique_genres']}\n"
+            + f"\t💰Profit: {stats['profit']} rub\n"
+            + f"\t✅Sold games: {stats['sold_games']}\n"
+            + f"\t↩️Returned games: {stats['returned_games']}"
+        )
+
+    def search(self, name: str, key: Hashable) -> GameCollection:
+        """Return all copies with a value in an indexed column.
+
+        Args:
+            name: Column name: "developer", "release_year", "genre" or "price".
+            key: Value to look up.
+
+        Returns:
+            GameCollection of matching copies, empty if none.
+
+        Raises:
+            ValueError: If the column is not indexed.
+        """
+        if name not in SEARCH_COLUMNS:
+            raise ValueError(f"Index {name} does not exist")
+        rows = self._db.execute(
+            f"SELECT title, developer, release_year, genre, game_id, copies FROM titles WHERE {name} = ?", (key,)
+        )
+        found = GameCollection()
+        for title, developer, release_year, genre, game_id, copies in rows:
+            game = Game(title, developer, release_year, genre, game_id)
+            for _ in range(copies):
+                found.add_game(game)
+        return found
+
+    def search_by_genre(self, genre: str) -> bool:
+        """Search for games by genre.
+
+        Args:
+            genre: Genre to search for.
+
+        Returns:
+            True if games found, False otherwise.
+        """
+        result = self.search("genre", genre)
+        if self._verbose:
+            self.print_search(result, "genre", genre)
+        return len(result) != 0
+
+    def search_by_release_year(self, release_year: int) -> bool:
+        """Search for games by release year.
+
+        Args:
+            release_year: Year to search for.
+
+        Returns:
+            True if games found, False otherwise.
+        """
+        result = self.search("release_year", release_year)
+        if self._verbose:
+            self.print_search(result, "release year", release_year)
+        return len(result) != 0
+
+    def search_by_developer(self, developer: str) -> bool:
+        """Search for games by developer.
+
+        Args:
+            developer: Developer name to search for.
+
+        Returns:
+            True if games found, False otherwise.
+        """
+        result = self.search("developer", developer)
+        if self._verbose:
+            self.print_search(result, "developer", developer)
+        return len(result) != 0
+
+    @staticmethod
+    def print_search(found_games: GameCollection, search_type: str, value: str | int) -> bool:
+        """Display search results in formatted output.
+
+        Args:
+            found_games: Collection of found games.
+            search_type: Type of search performed.
+            value: Search parameter value.
+
+        Returns:
+            True if games found, False otherwise.
+        """
+        result = set(found_games)
+        print(f"🔍Search result ({search_type} - {value}):")
+        if result:
+            for game in result:
+                print(f"\t🎮{game}")
+            return True
+        print("\t🎮No games found")
+        return False
+
+    def flush(self) -> None:
+        """Commit pending mutations and the store counters."""
+        self._begin()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO counters VALUES (?, ?)",
+            zip(COUNTERS, (self._profit, self._sold_games, self._return_games, self._step)),
+        )
+        self._db.execute("COMMIT")
+        self._pending = 0
+
+    def close(self) -> None:
+        """Commit pending mutations and close the database."""
+        self.flush()
+        self._db.close()
+
+    def _begin(self) -> None:
+        """Open a batch transaction unless one is running."""
+        if not self._db.in_transaction:
+            self._db.execute("BEGIN")
+
+    def _done(self) -> None:
+        """Count a mutation and commit the batch when it is full."""
+        self._pending += 1
+        if self._pending >= self._batch_size:
+            self.flush()
+
+    def _entry(self, game_id: str) -> _Title | None:
+        """Return the cached entry of a title, loading it on a cache miss.
+
+        Args:
+            game_id: Game identifier.
+
+        Returns:
+            Mutable cache entry, None if the title is not in stock.
+        """
+        entry = self._cache.get(game_id)
+        if entry is not None:
+            self._cache.move_to_end(game_id)
+            return entry
+        row = self._db.execute(
+            "SELECT title, developer, release_year, genre, copies, price FROM titles WHERE game_id = ?", (game_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        title, developer, release_year, genre, copies, price = row
+        entry = _Title(Game(title, developer, release_year, genre, game_id), copies, price)
+        self._remember(game_id, entry)
+        return entry
+
+    def _remember(self, game_id: str, entry: _Title) -> None:
+        """Put a title into the hot cache, evicting the least recently used one if full."""
+        self._cache[game_id] = entry
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
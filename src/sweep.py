@@ -0,0 +1,211 @@
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+from src.main import run_simulation
+
+DEFAULT_CACHE_DIR = ".sweep_cache"
+
+_code_version: str | None = None
+
+
+def code_version() -> str:
+    """Return a digest of the simulator source code.
+
+    Every module of the `src` package is hashed, so cached results are recomputed
+    after any change to the code that produced them.
+
+    Returns:
+        Hex SHA-256 digest of the sources.
+    """
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256()
+        for path in sorted(Path(__file__).parent.glob("*.py")):
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+
+def grid(starts: Iterable[int], steps: Iterable[int], seeds: Iterable[int | None]) -> list[tuple[int, int, int | None]]:
+    """Return every combination of run parameters.
+
+    Args:
+        starts: Start games amounts.
+        steps: Step counts.
+        seeds: Seeds.
+
+    Returns:
+        Runs in row-major order: start, then steps, then seed.
+    """
+    return list(itertools.product(starts, steps, seeds))
+
+
+def cache_key(run: tuple[int, int, int | None], version: str) -> str:
+    """Return the cache key of a run.
+
+    Args:
+        run: Start games amount, steps and seed.
+        version: Code version from `code_version`.
+
+    Returns:
+        Hex SHA-256 digest of the parameters, the seed and the code version.
+    """
+    start, steps, seed = run
+    text = json.dumps({"start": start, "steps": steps, "seed": seed, "code": version}, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResultCache:
+    """Directory of run results, one JSON file per cache key."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR) -> None:
+        """Initialize cache, creating the directory if needed.
+
+        Args:
+            directory: Directory holding cached results.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of the cache."""
+        return f"ResultCache({self.directory!r})"
+
+    def get(self, key: str) -> dict | None:
+        """Return a cached result.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Result summary, None if missing or unreadable.
+        """
+        try:
+            with open(self._path(key), encoding="utf-8") as stream:
+                return json.load(stream)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, result: dict) -> None:
+        """Store a result, replacing the file atomically so readers never see it half written.
+
+        Args:
+            key: Cache key.
+            result: Result summary.
+        """
+        path = self._path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as stream:
+            json.dump(result, stream)
+        os.replace(temporary, path)
+
+    def _path(self, key: str) -> str:
+        """Return the file path of a cache key."""
+        return os.path.join(self.directory, f"{key}.json")
+
+
+def sweep(
+    runs: list[tuple[int, int, int | None]],
+    cache_dir: str | None = DEFAULT_CACHE_DIR,
+    jobs: int | None = None,
+    version: str | None = None,
+) -> list[dict]:
+    """Run simulations for a list of parameters, reusing cached results.
+
+    Runs missing from the cache are computed in a process pool with `run_simulation`
+    and cached. Runs without a seed are random, so they are never cached.
+
+    Args:
+        runs: Start games amount, steps and seed of each run.
+        cache_dir: Cache directory, None to disable caching.
+        jobs: Number of worker processes, the CPU count if omitted.
+        version: Code version the cache is keyed by, `code_version()` if omitted.
+
+    Returns:
+        Summaries in the order of runs, as returned by `run_simulation`, with a
+        "cached" flag telling whether the result was reused.
+    """
+    cache = ResultCache(cache_dir) if cache_dir is not None else None
+    version = version if version is not None else code_version()
+    found: dict[int, dict] = {}
+    pending: list[tuple[int, int, int | None]] = []
+    targets: list[list[int]] = []
+    positions: dict[tuple[int, int, int | None], int] = {}
+    for index, run in enumerate(runs):
+        seeded = run[2] is not None
+        cached = cache.get(cache_key(run, version)) if cache is not None and seeded else None
+        if cached is not None:
+            found[index] = {**cached, "run": index, "cached": True}
+        elif seeded and run in positions:
+            targets[positions[run]].append(index)
+        else:
+            if seeded:
+                positions[run] = len(pending)
+            pending.append(run)
+            targets.append([index])
+
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+    arguments = (range(len(pending)), pending, itertools.repeat(None), itertools.repeat(True))
+    if workers == 1:
+        computed = list(map(run_simulation, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            computed = list(pool.map(run_simulation, *arguments))
+
+    for run, indexes, result in zip(pending, targets, computed):
+        if cache is not None and run[2] is not None:
+            cache.put(cache_key(run, version), result)
+        for index in indexes:
+            found[index] = {**result, "run": index, "cached": False}
+    return [found[index] for index in range(len(runs))]
+
+
+def main(argv: list[str]) -> int:
+    """Run a parameter sweep from the command line.
+
+    Args:
+        argv: Command-line arguments without the program name.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.sweep", description="Run a grid of cached simulations.")
+    parser.add_argument("--starts", type=int, nargs="+", required=True, help="start games amounts")
+    parser.add_argument("--steps", type=int, nargs="+", required=True, help="step counts")
+    parser.add_argument("--seeds", type=int, nargs="+", required=True, help="seeds")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("-c", "--cache-dir", default=DEFAULT_CACHE_DIR, help="directory of cached results")
+    parser.add_argument("--no-cache", action="store_true", help="recompute every run without caching")
+    parser.add_argument("-s", "--summary", help="path of the JSON summary, '-' for stdout")
+    options = parser.parse_args(argv)
+
+    runs = grid(options.starts, options.steps, options.seeds)
+    results = sweep(runs, None if options.no_cache else options.cache_dir, options.jobs)
+    if options.summary == "-":
+        print(json.dumps(results, indent=2))
+        return 0
+    for result in results:
+        stats = result["stats"]
+        print(
+            f"{'💾' if result['cached'] else '✅'}run {result['run']} (sm {result['start']} {result['steps']} "
+            f"{result['seed']}): profit {stats['profit']} rub, sold {stats['sold_games']}"
+        )
+    cached = sum(result["cached"] for result in results)
+    print(f"📊{len(results)} runs, {cached} from cache, {len(results) - cached} computed")
+    if options.summary is not None:
+        with open(options.summary, "w", encoding="utf-8") as stream:
+            json.dump(results, stream, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
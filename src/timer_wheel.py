@@ -0,0 +1,184 @@
+import heapq
+
+from typing import Generic
+from typing import Hashable
+from typing import TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class TimerWheel(Generic[K]):
+    """Hierarchical timing wheel expiring many timers in bulk.
+
+    Level 0 has one slot per step; each higher level has slots covering a whole
+    turn of the level below. A timer is filed at the lowest level whose current turn
+    contains its deadline and moves down one level each time that turn starts, so
+    scheduling and cancelling are O(1) and each timer is moved at most once per level.
+    Every level keeps a bitmap of its non-empty slots, so advancing the clock jumps
+    straight to the next slot that holds timers instead of visiting every step.
+    Deadlines beyond the top level wait in an overflow heap and are filed when the
+    top-level turn of their deadline starts. Timers are keyed by any hashable type `K`,
+    and `advance` returns the keys as given to `schedule`.
+    """
+
+    def __init__(self, start: int = 0, slot_bits: int = 6, levels: int = 4) -> None:
+        """Initialize an empty wheel.
+
+        Args:
+            start: Current step.
+            slot_bits: Log2 of the number of slots per level.
+            levels: Number of levels.
+
+        Raises:
+            ValueError: If the wheel has no slots or no levels.
+        """
+        if slot_bits <= 0 or levels <= 0:
+            raise ValueError("Timer wheel needs slots and levels")
+        self._now = start
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels = levels
+        self._wheels: list[list[dict[K, int]]] = [[{} for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self._occupied = [0] * levels
+        self._overflow: list[tuple[int, int, K]] = []
+        self._sequence = 0
+        self._slots: dict[K, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        """Return number of scheduled timers that have not fired yet.
+
+        Returns:
+            Count of pending timers.
+        """
+        return len(self._slots)
+
+    def __contains__(self, key: K) -> bool:
+        """Check if a timer is pending.
+
+        Args:
+            key: Timer key.
+
+        Returns:
+            True if the timer is scheduled and has not fired or been cancelled.
+        """
+        return key in self._slots
+
+    @property
+    def now(self) -> int:
+        """Return current step of the wheel."""
+        return self._now
+
+    def schedule(self, key: K, deadline: int) -> None:
+        """Schedule a timer.
+
+        Args:
+            key: Value returned by `advance` when the timer fires.
+            deadline: Step the timer fires at; past deadlines fire on the next step.
+
+        Raises:
+            ValueError: If a timer with the same key is already pending.
+        """
+        if key in self._slots:
+            raise ValueError("Timer is already scheduled")
+        self._place(key, max(deadline, self._now + 1))
+
+    def cancel(self, key: K) -> bool:
+        """Remove a pending timer.
+
+        Args:
+            key: Timer key.
+
+        Returns:
+            True if the timer was pending, False if it already fired or was never scheduled.
+        """
+        position = self._slots.pop(key, None)
+        if position is None:
+            return False
+        level, slot = position
+        if level == self._levels:
+            return True
+        entries = self._wheels[level][slot]
+        del entries[key]
+        if not entries:
+            self._occupied[level] &= ~(1 << slot)
+        return True
+
+    def advance(self, to: int) -> list[K]:
+        """Move the clock forward and collect fired timers.
+
+        Args:
+            to: New current step; earlier steps leave the wheel unchanged.
+
+        Returns:
+            Keys of the timers with deadlines up to the new step, in deadline order.
+        """
+        expired: list[K] = []
+        bits = self._bits
+        wheels = self._wheels
+        slots = self._slots
+        while slots and (step := self._next_event()) <= to:
+            self._now = step
+            top = bits * self._levels
+            overflow = self._overflow
+            while overflow and overflow[0][0] >> top == step >> top:
+                deadline, sequence, key = heapq.heappop(overflow)
+                if slots.get(key) == (self._levels, sequence):
+                    self._place(key, deadline)
+            for level in range(self._levels - 1, 0, -1):
+                if step & ((1 << bits * level) - 1):
+                    continue
+                slot = (step >> bits * level) & self._mask
+                entries = wheels[level][slot]
+                if entries:
+                    wheels[level][slot] = {}
+                    self._occupied[level] &= ~(1 << slot)
+                    for key, deadline in entries.items():
+                        self._place(key, deadline)
+            slot = step & self._mask
+            entries = wheels[0][slot]
+            if entries:
+                wheels[0][slot] = {}
+                self._occupied[0] &= ~(1 << slot)
+                expired.extend(entries)
+                for key in entries:
+                    del slots[key]
+        self._now = max(self._now, to)
+        return expired
+
+    def _next_event(self) -> int:
+        """Return the next step that fires timers or moves them down a level.
+
+        Timers at a level always sit in slots after the current one, so the first
+        occupied slot of the lowest non-empty level holds the earliest event; with every
+        level empty, the overflow is next filed at the top-level turn of its earliest deadline.
+        Cancelled overflow timers stay in the heap until they reach its top and are dropped here.
+        """
+        bits = self._bits
+        for level in range(self._levels):
+            current = (self._now >> bits * level) & self._mask
+            later = self._occupied[level] >> current + 1
+            if later:
+                slot = current + (later & -later).bit_length()
+                turn = self._now >> bits * (level + 1) << bits * (level + 1)
+                return turn | slot << bits * level
+        overflow = self._overflow
+        while self._slots.get(overflow[0][2]) != (self._levels, overflow[0][1]):
+            heapq.heappop(overflow)
+        top = bits * self._levels
+        return overflow[0][0] >> top << top
+
+    def _place(self, key: K, deadline: int) -> None:
+        """File a timer at the lowest level whose current turn contains its deadline."""
+        bits = self._bits
+        now = self._now
+        for level in range(self._levels):
+            shift = bits * level
+            if deadline >> shift + bits == now >> shift + bits:
+                slot = (deadline >> shift) & self._mask
+                self._wheels[level][slot][key] = deadline
+                self._occupied[level] |= 1 << slot
+                self._slots[key] = (level, slot)
+                return
+        self._sequence += 1
+        heapq.heappush(self._overflow, (deadline, self._sequence, key))
+        self._slots[key] = (self._levels, self._sequence)
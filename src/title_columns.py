@@ -0,0 +1,88 @@
+from array import array
+
+from src.game import Game
+
+
+class TitleColumns:
+    """Per-title parallel arrays kept up to date by the store for vectorized passes.
+
+    Every title seen since the columns were started owns one row: its list price (the
+    first price it had), copies sold net of returns, copies in stock, release year and
+    current price. Mutations update one row in O(1), so a pass over all titles reads
+    whole int64 columns instead of walking the indexes. Rows of titles that go out of
+    stock stay with a stock of zero and are reused when the title comes back.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.games: list[Game] = []
+        self.rows: dict[str, int] = {}
+        self.list_price: array = array("q")
+        self.sold: array = array("q")
+        self.stock: array = array("q")
+        self.release_year: array = array("q")
+        self.price: array = array("q")
+
+    def __len__(self) -> int:
+        """Return number of rows.
+
+        Returns:
+            Count of titles seen, including ones out of stock.
+        """
+        return len(self.games)
+
+    def __repr__(self) -> str:
+        """Return summary of the columns.
+
+        Returns:
+            String with the numbers of rows and titles in stock.
+        """
+        return f"TitleColumns: {len(self.games)} titles ({sum(count > 0 for count in self.stock)} in stock)"
+
+    def add(self, game: Game, price: int) -> None:
+        """Count a copy added to stock at a price.
+
+        Args:
+            game: Added game.
+            price: Current price of the title in rubles.
+        """
+        row = self.rows.get(game.game_id)
+        if row is None:
+            self.rows[game.game_id] = len(self.games)
+            self.games.append(game)
+            self.list_price.append(price)
+            self.sold.append(0)
+            self.stock.append(1)
+            self.release_year.append(game.release_year)
+            self.price.append(price)
+            return
+        self.stock[row] += 1
+        self.price[row] = price
+
+    def remove(self, game_id: str) -> None:
+        """Count a copy leaving stock.
+
+        Args:
+            game_id: Identifier of a title with a row.
+        """
+        self.stock[self.rows[game_id]] -= 1
+
+    def sell(self, game_id: str, copies: int = 1) -> None:
+        """Count sold copies, negative for returns.
+
+        Args:
+            game_id: Identifier of the title.
+            copies: Number of copies sold.
+        """
+        row = self.rows.get(game_id)
+        if row is not None:
+            self.sold[row] += copies
+
+    def set_price(self, game_id: str, price: int) -> None:
+        """Store the current price of a title.
+
+        Args:
+            game_id: Identifier of a title with a row.
+            price: New price in rubles.
+        """
+        self.price[self.rows[game_id]] = price
@@ -0,0 +1,229 @@
+import struct
+
+from types import TracebackType
+from typing import BinaryIO
+from typing import Iterable
+from typing import Iterator
+
+from src.game import Game
+from src.game_store import GameStore
+from src.simulation import EVENTS_DATABASE
+from src.simulation import SEARCH_TYPES
+from src.simulation import Step
+
+TRACE_MAGIC = b"GSTR"
+
+TRACE_VERSION = 3
+
+HEADER = struct.Struct("<4sHI")
+
+GAME_FIELDS = struct.Struct("<i")
+
+RECORD = struct.Struct("<BBIqqBq")
+
+NO_GAME = 0xFFFFFFFF
+
+BUFFER_SIZE = 1 << 16
+
+
+def _write_text(stream: BinaryIO, text: str) -> None:
+    """Write a length-prefixed UTF-8 string.
+
+    Args:
+        stream: Binary stream to write to.
+        text: String to write.
+    """
+    data = text.encode()
+    stream.write(struct.pack("<H", len(data)) + data)
+
+
+def _read_text(stream: BinaryIO) -> str:
+    """Read a length-prefixed UTF-8 string.
+
+    Args:
+        stream: Binary stream to read from.
+
+    Returns:
+        Decoded string.
+    """
+    (length,) = struct.unpack("<H", stream.read(2))
+    return stream.read(length).decode()
+
+
+class TraceWriter:
+    """Writes simulation events to a compact binary trace file.
+
+    The file starts with the catalog of games the run draws from, followed by one
+    fixed-size record per event (event, search type, game index, price, balance, days,
+    store clock step).
+    """
+
+    def __init__(self, path: str, catalog: Iterable[Game]) -> None:
+        """Open a trace file and write its header.
+
+        Args:
+            path: Path of the trace file to create.
+            catalog: Games that recorded events may refer to.
+        """
+        games = list(catalog)
+        self._indexes: dict[str, int] = {game.game_id: index for index, game in enumerate(games)}
+        self._events: dict[str, int] = {event: code for code, event in enumerate(EVENTS_DATABASE)}
+        self._search_types: dict[str, int] = {search_type: code + 1 for code, search_type in enumerate(SEARCH_TYPES)}
+        self._buffer = bytearray()
+        self._stream: BinaryIO = open(path, "wb")
+        self._stream.write(HEADER.pack(TRACE_MAGIC, TRACE_VERSION, len(games)))
+        for game in games:
+            _write_text(self._stream, game.title)
+            _write_text(self._stream, game.developer)
+            _write_text(self._stream, game.genre)
+            _write_text(self._stream, game.game_id)
+            self._stream.write(GAME_FIELDS.pack(game.release_year))
+        self.records: int = 0
+
+    def __enter__(self) -> "TraceWriter":
+        """Return the writer for use in a `with` block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush and close the trace file."""
+        self.close()
+
+    def record(self, step: Step, clock: int = 0) -> None:
+        """Append a simulation event to the trace.
+
+        Args:
+            step: Event to record.
+            clock: Store clock step the event is applied at.
+
+        Raises:
+            ValueError: If the event refers to a game outside the catalog.
+        """
+        game_index = NO_GAME
+        if step.game is not None:
+            if step.game.game_id not in self._indexes:
+                raise ValueError("Game is not in trace catalog")
+            game_index = self._indexes[step.game.game_id]
+        self._buffer += RECORD.pack(
+            self._events[step.event],
+            self._search_types.get(step.search_type, 0),
+            game_index,
+            step.price,
+            step.balance,
+            step.days,
+            clock,
+        )
+        self.records += 1
+        if len(self._buffer) >= BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records to the file."""
+        self._stream.write(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Flush remaining records and close the file."""
+        if self._stream.closed:
+            return
+        self.flush()
+        self._stream.close()
+
+
+def read_trace(path: str) -> tuple[list[Game], bytes]:
+    """Read the catalog and the raw event records of a trace file.
+
+    Args:
+        path: Path of the trace file.
+
+    Returns:
+        Catalog of games and the packed event records.
+
+    Raises:
+        ValueError: If the file is not a trace of a supported version.
+    """
+    with open(path, "rb") as stream:
+        magic, version, catalog_size = HEADER.unpack(stream.read(HEADER.size))
+        if magic != TRACE_MAGIC or version != TRACE_VERSION:
+            raise ValueError("Unsupported trace file")
+        catalog = []
+        for _ in range(catalog_size):
+            title = _read_text(stream)
+            developer = _read_text(stream)
+            genre = _read_text(stream)
+            game_id = _read_text(stream)
+            (release_year,) = GAME_FIELDS.unpack(stream.read(GAME_FIELDS.size))
+            catalog.append(Game(title, developer, release_year, genre, game_id))
+        records = stream.read()
+    if len(records) % RECORD.size:
+        raise ValueError("Truncated trace file")
+    return catalog, records
+
+
+def iter_trace(path: str) -> Iterator[Step]:
+    """Decode a trace file into simulation steps.
+
+    Args:
+        path: Path of the trace file.
+
+    Returns:
+        Iterator over the recorded steps in order.
+    """
+    catalog, records = read_trace(path)
+    search_types = [""] + SEARCH_TYPES
+    for event, search_type, game_index, price, balance, days, _ in RECORD.iter_unpack(records):
+        game = catalog[game_index] if game_index != NO_GAME else None
+        yield Step(EVENTS_DATABASE[event], game, price, balance, days, search_types[search_type])
+
+
+def replay(path: str, store: GameStore | None = None) -> GameStore:
+    """Apply a recorded trace to a store without RNG draws or printing.
+
+    The store clock is advanced to the recorded step of each event, counting from the
+    store's current step, so returns see the same purchase ages as the recorded run.
+
+    Args:
+        path: Path of the trace file.
+        store: Store to apply events to; a fresh quiet store is created if omitted.
+
+    Returns:
+        Store after all recorded events were applied.
+    """
+    if store is None:
+        store = GameStore(verbose=False)
+    catalog, records = read_trace(path)
+    add_game = store.add_game
+    remove_game = store.remove_game
+    buy_game = store.buy_game
+    return_game = store.return_game
+    searches = (store.search_by_genre, store.search_by_release_year, store.search_by_developer)
+    events = {event: code for code, event in enumerate(EVENTS_DATABASE)}
+    add, remove, buy, search, return_ = (events[name] for name in ("add", "remove", "buy", "search", "return"))
+
+    start = store.step
+    for event, search_type, game_index, price, balance, _, clock in RECORD.iter_unpack(records):
+        if start + clock != store.step:
+            store.tick(start + clock - store.step)
+        if event == add:
+            add_game(catalog[game_index], price)
+        elif event == buy:
+            buy_game(catalog[game_index], balance)
+        elif event == remove:
+            remove_game(catalog[game_index])
+        elif event == return_:
+            return_game(catalog[game_index])
+        elif event == search:
+            game = catalog[game_index]
+            if search_type == 1:
+                searches[0](game.genre)
+            elif search_type == 2:
+                searches[1](game.release_year)
+            else:
+                searches[2](game.developer)
+        else:
+            store.get_stats()
+    return store
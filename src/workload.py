@@ -0,0 +1,189 @@
+from typing import Iterator
+from typing import Sequence
+
+import numpy as np
+
+from src.game import Game
+from src.game_collection import GameCollection
+from src.simulation import EVENTS_DATABASE
+from src.simulation import SEARCH_TYPES
+from src.simulation import Step
+from src.workload_spec import Phase
+from src.workload_spec import WorkloadSpec
+from src.workload_spec import validate_event_weights
+
+CHUNK_SIZE = 1 << 16
+
+
+class Workload:
+    """Pre-generated simulation events stored as parallel NumPy arrays.
+
+    Attributes:
+        events: Event index into EVENTS_DATABASE per step.
+        games: Game index into the catalog per step.
+        prices: Price per step, 0 for events without a price.
+        balances: Client balance per step, 0 for events other than "buy".
+        days: Days since purchase per step, 0 for events other than "return".
+        search_types: Search criterion index into SEARCH_TYPES per step.
+    """
+
+    def __init__(
+        self,
+        events: np.ndarray,
+        games: np.ndarray,
+        prices: np.ndarray,
+        balances: np.ndarray,
+        days: np.ndarray,
+        search_types: np.ndarray,
+    ) -> None:
+        """Initialize workload from equally sized arrays.
+
+        Args:
+            events: Event index into EVENTS_DATABASE per step.
+            games: Game index into the catalog per step.
+            prices: Price per step.
+            balances: Client balance per step.
+            days: Days since purchase per step.
+            search_types: Search criterion index into SEARCH_TYPES per step.
+        """
+        self.events = events
+        self.games = games
+        self.prices = prices
+        self.balances = balances
+        self.days = days
+        self.search_types = search_types
+
+    def __len__(self) -> int:
+        """Return number of steps in the workload.
+
+        Returns:
+            Count of generated steps.
+        """
+        return len(self.events)
+
+    def __repr__(self) -> str:
+        """Return summary of the workload.
+
+        Returns:
+            String with step count and per-event totals.
+        """
+        counts = np.bincount(self.events, minlength=len(EVENTS_DATABASE))
+        mix = ", ".join(f"{event}: {count}" for event, count in zip(EVENTS_DATABASE, counts.tolist()))
+        return f"Workload: {len(self)} steps ({mix})"
+
+    def steps(self, catalog: GameCollection | Sequence[Game], first: int = 0) -> Iterator[Step]:
+        """Convert the arrays into simulation steps, a chunk at a time.
+
+        Args:
+            catalog: Games the generated game indexes refer to.
+            first: Index of the first step to produce.
+
+        Returns:
+            Iterator over steps in generation order.
+        """
+        search_types = SEARCH_TYPES
+        for start in range(first, len(self), CHUNK_SIZE):
+            stop = start + CHUNK_SIZE
+            chunk = zip(
+                self.events[start:stop].tolist(),
+                self.games[start:stop].tolist(),
+                self.prices[start:stop].tolist(),
+                self.balances[start:stop].tolist(),
+                self.days[start:stop].tolist(),
+                self.search_types[start:stop].tolist(),
+            )
+            for event, game, price, balance, days, search_type in chunk:
+                name = EVENTS_DATABASE[event]
+                if name == "stats":
+                    yield Step(name)
+                else:
+                    yield Step(
+                        name,
+                        catalog[game],
+                        price,
+                        balance,
+                        days,
+                        search_types[search_type] if name == "search" else "",
+                    )
+
+
+def event_probabilities(weights: dict[str, float] | None = None) -> np.ndarray:
+    """Normalize event weights into probabilities ordered like EVENTS_DATABASE.
+
+    Args:
+        weights: Relative weight per event name; missing events get weight 0.
+            Uniform over EVENTS_DATABASE if omitted.
+
+    Returns:
+        Probability of each event in EVENTS_DATABASE order.
+
+    Raises:
+        ValueError: If an event is unknown, a weight is negative or all weights are 0.
+    """
+    if weights is None:
+        return np.full(len(EVENTS_DATABASE), 1 / len(EVENTS_DATABASE))
+    validate_event_weights(weights)
+    probabilities = np.array([weights.get(event, 0.0) for event in EVENTS_DATABASE], dtype=np.float64)
+    return probabilities / probabilities.sum()
+
+
+def generate_workload(
+    steps: int,
+    catalog_size: int,
+    weights: dict[str, float] | None = None,
+    random_seed: int | None = None,
+    spec: WorkloadSpec | None = None,
+) -> Workload:
+    """Generate simulation events for many steps in one vectorized pass.
+
+    Value ranges match the `random_*` helpers of the simulation module.
+
+    Args:
+        steps: Number of steps to generate.
+        catalog_size: Number of games events may refer to.
+        weights: Relative weight per event name, uniform if omitted.
+        random_seed: Optional seed for the NumPy generator.
+        spec: Optional workload spec with phases and Zipf game popularity; replaces `weights`.
+
+    Returns:
+        Workload with one entry per step.
+
+    Raises:
+        ValueError: If both `weights` and `spec` are given.
+    """
+    if weights is not None and spec is not None:
+        raise ValueError("Pass either event weights or a workload spec")
+    rng = np.random.default_rng(random_seed)
+    event_index = {event: code for code, event in enumerate(EVENTS_DATABASE)}
+
+    if spec is None:
+        events = rng.choice(len(EVENTS_DATABASE), size=steps, p=event_probabilities(weights)).astype(np.uint8)
+        games = rng.integers(0, catalog_size, size=steps, dtype=np.uint32)
+    else:
+        events = np.empty(steps, dtype=np.uint8)
+        phases = spec.phases or [Phase(1)]
+        if spec.phases:
+            phase_ends = np.cumsum([phase.steps for phase in phases])
+            phase_of_step = np.searchsorted(phase_ends, np.arange(steps) % spec.cycle_length(), side="right")
+        else:
+            phase_of_step = np.zeros(steps, dtype=np.intp)
+        for index, phase in enumerate(phases):
+            mask = phase_of_step == index
+            phase_weights = phase.event_weights if phase.event_weights is not None else spec.event_weights
+            probabilities = event_probabilities(phase_weights)
+            events[mask] = rng.choice(len(EVENTS_DATABASE), size=int(mask.sum()), p=probabilities)
+        popularity = np.array(spec.game_weights(catalog_size))
+        games = rng.choice(catalog_size, size=steps, p=popularity / popularity.sum()).astype(np.uint32)
+    prices = rng.integers(500, 3501, size=steps, dtype=np.uint32)
+    balances = rng.integers(1000, 7001, size=steps, dtype=np.uint32)
+    days = rng.integers(1, 61, size=steps, dtype=np.uint8)
+    search_types = rng.integers(0, len(SEARCH_TYPES), size=steps, dtype=np.uint8)
+
+    is_add = events == event_index["add"]
+    is_return = events == event_index["return"]
+    prices[~(is_add | is_return)] = 0
+    balances[events != event_index["buy"]] = 0
+    days[~is_return] = 0
+    search_types[events != event_index["search"]] = 0
+    games[events == event_index["stats"]] = 0
+    return Workload(events, games, prices, balances, days, search_types)
@@ -0,0 +1,211 @@
+from bisect import bisect
+from itertools import accumulate
+from random import choice
+from random import randint
+from random import random
+from typing import Sequence
+
+from src.game import Game
+from src.game_collection import GameCollection
+from src.simulation import EVENTS_DATABASE
+from src.simulation import SEARCH_TYPES
+from src.simulation import Step
+from src.simulation import random_balance
+from src.simulation import random_price
+
+
+class Phase:
+    """Stretch of simulation steps with its own event mix.
+
+    Attributes:
+        steps: Number of steps the phase lasts.
+        event_weights: Relative weight per event name, None to use the spec's weights.
+    """
+
+    def __init__(self, steps: int, event_weights: dict[str, float] | None = None) -> None:
+        """Initialize a phase.
+
+        Args:
+            steps: Number of steps the phase lasts.
+            event_weights: Relative weight per event name, None to use the spec's weights.
+
+        Raises:
+            ValueError: If the phase has no steps.
+        """
+        if steps <= 0:
+            raise ValueError("Phase must last at least one step")
+        self.steps = steps
+        self.event_weights = event_weights
+
+    def __repr__(self) -> str:
+        """Return string representation of the phase."""
+        return f"Phase({self.steps}, {self.event_weights})"
+
+
+class WorkloadSpec:
+    """Description of simulated traffic: event mix, game popularity and phases.
+
+    Game popularity follows a Zipf law over the catalog order: the game at rank `r`
+    (starting from 1) is drawn with weight `1 / r ** zipf_exponent`, so exponent 0 is
+    uniform. Phases run in order and repeat once the last one ends.
+
+    Attributes:
+        event_weights: Relative weight per event name; missing events are never drawn.
+        zipf_exponent: Skew of game popularity.
+        phases: Phases of the workload, empty for a single unchanging mix.
+    """
+
+    def __init__(
+        self,
+        event_weights: dict[str, float] | None = None,
+        zipf_exponent: float = 0.0,
+        phases: list[Phase] | None = None,
+    ) -> None:
+        """Initialize a workload spec.
+
+        Args:
+            event_weights: Relative weight per event name, uniform if omitted.
+            zipf_exponent: Skew of game popularity, 0 for uniform.
+            phases: Optional phases with their own event mix.
+
+        Raises:
+            ValueError: If weights are invalid or the exponent is negative.
+        """
+        if zipf_exponent < 0:
+            raise ValueError("Zipf exponent must be non-negative")
+        self.event_weights = event_weights if event_weights is not None else dict.fromkeys(EVENTS_DATABASE, 1.0)
+        self.zipf_exponent = zipf_exponent
+        self.phases = phases if phases is not None else []
+        for weights in [self.event_weights] + [phase.event_weights for phase in self.phases]:
+            if weights is not None:
+                validate_event_weights(weights)
+
+    def __repr__(self) -> str:
+        """Return string representation of the spec."""
+        return f"WorkloadSpec({self.event_weights}, zipf={self.zipf_exponent}, phases={self.phases})"
+
+    def cycle_length(self) -> int:
+        """Return number of steps after which the phases repeat.
+
+        Returns:
+            Sum of phase lengths, 0 without phases.
+        """
+        return sum(phase.steps for phase in self.phases)
+
+    def game_weights(self, catalog_size: int) -> list[float]:
+        """Return relative popularity of each catalog position.
+
+        Args:
+            catalog_size: Number of games in the catalog.
+
+        Returns:
+            Zipf weight per catalog position.
+        """
+        return [1 / rank**self.zipf_exponent for rank in range(1, catalog_size + 1)]
+
+    def sampler(self, catalog: GameCollection | Sequence[Game]) -> "SpecSampler":
+        """Create a step sampler drawing from the global `random` generator.
+
+        Args:
+            catalog: Games to draw from, most popular first.
+
+        Returns:
+            Sampler producing steps that follow this spec.
+        """
+        return SpecSampler(self, catalog)
+
+
+def validate_event_weights(weights: dict[str, float]) -> None:
+    """Check event weights refer to known events and can be normalized.
+
+    Args:
+        weights: Relative weight per event name.
+
+    Raises:
+        ValueError: If an event is unknown, a weight is negative or all weights are 0.
+    """
+    unknown = set(weights) - set(EVENTS_DATABASE)
+    if unknown:
+        raise ValueError(f"Unknown events: {', '.join(sorted(unknown))}")
+    if any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+        raise ValueError("Event weights must be non-negative with a positive sum")
+
+
+class SpecSampler:
+    """Draws simulation steps following a WorkloadSpec.
+
+    Cumulative weights are precomputed, so each draw is one `random()` call and a binary search.
+    """
+
+    def __init__(self, spec: WorkloadSpec, catalog: GameCollection | Sequence[Game]) -> None:
+        """Initialize sampler for a spec and a catalog.
+
+        Args:
+            spec: Workload description to follow.
+            catalog: Games to draw from, most popular first.
+        """
+        self._catalog = catalog
+        self._game_cumulative = list(accumulate(spec.game_weights(len(catalog))))
+        self._cycle = spec.cycle_length()
+        self._phase_ends: list[int] = list(accumulate(phase.steps for phase in spec.phases))
+        self._event_cumulative: list[list[float]] = []
+        for phase in spec.phases or [Phase(1)]:
+            weights = phase.event_weights if phase.event_weights is not None else spec.event_weights
+            self._event_cumulative.append(list(accumulate(weights.get(event, 0.0) for event in EVENTS_DATABASE)))
+
+    def random_game(self) -> Game:
+        """Draw a game according to its popularity.
+
+        Returns:
+            Game from the catalog.
+        """
+        cumulative = self._game_cumulative
+        return self._catalog[bisect(cumulative, random() * cumulative[-1])]
+
+    def random_event(self, step_index: int) -> str:
+        """Draw an event using the mix of the phase active at a step.
+
+        Args:
+            step_index: Zero-based index of the simulation step.
+
+        Returns:
+            Event name from EVENTS_DATABASE.
+        """
+        phase = 0
+        if self._cycle:
+            phase = bisect(self._phase_ends, step_index % self._cycle)
+        cumulative = self._event_cumulative[phase]
+        return EVENTS_DATABASE[bisect(cumulative, random() * cumulative[-1])]
+
+    def step(self, step_index: int) -> Step:
+        """Draw a simulation event together with its parameters.
+
+        Args:
+            step_index: Zero-based index of the simulation step.
+
+        Returns:
+            Step following the spec's event mix and game popularity.
+        """
+        event = self.random_event(step_index)
+
+        match event:
+            case "add":
+                return Step(event, self.random_game(), random_price())
+            case "remove":
+                return Step(event, self.random_game())
+            case "buy":
+                return Step(event, self.random_game(), balance=random_balance())
+            case "search":
+                search_type: str = choice(SEARCH_TYPES)
+                return Step(event, self.random_game(), search_type=search_type)
+            case "return":
+                days: int = randint(1, 60)
+                return Step(event, self.random_game(), random_price(), days=days)
+        return Step(event)
+
+
+SALE_BURSTS_SPEC = WorkloadSpec(
+    {"search": 60, "buy": 15, "add": 15, "return": 4, "remove": 3, "stats": 3},
+    zipf_exponent=1.1,
+    phases=[Phase(900), Phase(100, {"buy": 60, "search": 30, "add": 10})],
+)
@@ -0,0 +1,62 @@
+import os
+import tempfile
+
+import pytest
+
+from src.catalog_generator import CatalogSpec
+from src.catalog_generator import fill_store
+from src.catalog_generator import generate_catalog
+from src.catalog_generator import read_catalog
+from src.catalog_generator import write_catalog
+from src.game_store import GameStore
+
+
+def test_generate_catalog_is_deterministic() -> None:
+    """Test the same seed produces the same games with unique ids."""
+    first = list(generate_catalog(500, random_seed=7))
+    second = list(generate_catalog(500, random_seed=7))
+    assert first == second
+    assert len({game.game_id for game in first}) == 500
+    assert first != list(generate_catalog(500, random_seed=8))
+
+
+def test_catalog_distributions() -> None:
+    """Test generated games respect the configured distributions."""
+    spec = CatalogSpec(developers=5, developer_skew=2.0, genre_weights={"Racing": 1}, first_year=2000, last_year=2001)
+    games = list(generate_catalog(2000, spec))
+    assert {game.genre for game in games} == {"Racing"}
+    assert {game.release_year for game in games} <= {2000, 2001}
+    studios = [game.developer for game in games]
+    assert len(set(studios)) <= 5
+    assert studios.count("Studio 00000") > studios.count("Studio 00004") * 4
+
+
+def test_invalid_spec() -> None:
+    """Test empty, reversed, negative and all-zero distributions are rejected."""
+    with pytest.raises(ValueError):
+        CatalogSpec(developers=0)
+    with pytest.raises(ValueError):
+        CatalogSpec(first_year=2020, last_year=2010)
+    with pytest.raises(ValueError):
+        CatalogSpec(genre_weights={"RPG": 1.0, "FPS": -1.0})
+    with pytest.raises(ValueError):
+        CatalogSpec(genre_weights={"RPG": 0.0})
+    with pytest.raises(ValueError):
+        CatalogSpec(first_year=2000, last_year=2001, year_weights={2000: 0, 2001: 0})
+
+
+def test_fill_store() -> None:
+    """Test streaming a catalog into a quiet store."""
+    store = GameStore(verbose=False)
+    assert fill_store(store, generate_catalog(300), copies=2) == 600
+    assert len(store) == 600
+    assert len(store._by_id) == 300
+
+
+def test_write_and_read_catalog() -> None:
+    """Test a catalog file round-trips every game."""
+    games = list(generate_catalog(100, random_seed=1))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.csv")
+        assert write_catalog(path, games) == 100
+        assert list(read_catalog(path)) == games
@@ -0,0 +1,74 @@
+import pytest
+
+from src.change_feed import ADD
+from src.change_feed import ChangeFeed
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+
+
+def test_store_mutations_reach_subscribers() -> None:
+    """Test every store mutation is delivered in order with the store clock."""
+    store = GameStore(verbose=False)
+    subscription = store.change_feed().subscribe()
+    game = GAMES_DATABASE[0]
+    store.add_game(game, 1000)
+    store.add_game(game, 1000)
+    store.tick()
+    store.buy_game(game, 5000)
+    store.return_game(game)
+    store.set_prices([game], [1200])
+    store.remove_game(game)
+
+    changes = subscription.poll()
+    assert [(change.kind, change.step, change.value) for change in changes] == [
+        ("add", 0, 1000),
+        ("add", 0, 1000),
+        ("buy", 1, 1000),
+        ("remove", 1, 0),
+        ("return", 1, 1000),
+        ("price", 1, 1200),
+        ("remove", 1, 0),
+    ]
+    assert [change.sequence for change in changes] == list(range(7))
+    assert all(change.game_id == game.game_id for change in changes)
+    assert subscription.poll() == []
+
+
+def test_subscribers_read_batches_independently() -> None:
+    """Test each subscription keeps its own cursor and batch size."""
+    feed = ChangeFeed(16)
+    early = feed.subscribe()
+    for step in range(10):
+        feed.append(ADD, f"G{step}", step, step)
+    late = feed.subscribe()
+    assert late.lag == 0
+
+    assert [change.step for change in early.poll(4)] == [0, 1, 2, 3]
+    assert early.lag == 6
+    assert [change.step for change in early.poll()] == list(range(4, 10))
+    assert [change.step for change in feed.subscribe(from_start=True).poll()] == list(range(10))
+
+
+def test_slow_subscriber_skips_overwritten_changes() -> None:
+    """Test a subscriber lapped by the writer counts the changes it missed."""
+    feed = ChangeFeed(5)
+    assert feed.capacity == 8
+    subscription = feed.subscribe()
+    for step in range(20):
+        feed.append(ADD, "G", step)
+    assert len(feed) == 8
+
+    assert [change.step for change in subscription.poll()] == list(range(12, 20))
+    assert subscription.missed == 12
+    with pytest.raises(ValueError):
+        ChangeFeed(0)
+
+
+def test_change_feed_starts_once() -> None:
+    """Test the store keeps one feed and records nothing before it is started."""
+    store = GameStore(verbose=False)
+    store.add_game(GAMES_DATABASE[0], 1000)
+    feed = store.change_feed(4)
+    assert store.change_feed() is feed
+    assert feed.capacity == 4
+    assert feed.head == 0
@@ -0,0 +1,86 @@
+import os
+import pickle
+
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+import pytest
+
+from src.checkpoint import RUN_SUFFIX
+from src.checkpoint import Checkpointer
+from src.checkpoint import load_checkpoint
+from src.checkpoint import resume
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.pricing import PricingEngine
+from src.rankings import CountRanking
+from src.simulation import run_steps
+from src.simulation import simulate
+from src.workload import generate_workload
+from src.workload_spec import SALE_BURSTS_SPEC
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        lambda: {},
+        lambda: {"spec": SALE_BURSTS_SPEC, "pricing": PricingEngine(interval=70)},
+        lambda: {"workload": generate_workload(3000, len(GAMES_DATABASE), random_seed=5)},
+    ],
+)
+def test_resume_matches_uninterrupted_run(tmp_path: Path, options: Callable[[], dict[str, Any]]) -> None:
+    """Test a run resumed from a checkpoint ends exactly like an uninterrupted one."""
+    path = str(tmp_path / "run.ckpt")
+    expected = simulate(40, 3000, 11, verbose=False, **options())
+    checkpointer = Checkpointer(path, interval=1000)
+    simulate(40, 3000, 11, verbose=False, checkpoint=checkpointer, **options())
+    assert checkpointer.saved == 2
+    state = load_checkpoint(path)
+    assert state["next_step"] == 2000
+    assert "workload" not in state
+    assert load_checkpoint(path + RUN_SUFFIX).keys() == {"workload", "sampler"}
+
+    resumed = resume(path)
+    assert resumed.stats() == expected.stats()
+    assert resumed.step == expected.step
+    assert resumed.top_sellers(5) == expected.top_sellers(5)
+    assert resumed.low_stock(5) == expected.low_stock(5)
+    assert resumed.last_sale_id == expected.last_sale_id
+    assert resumed._open_sales == expected._open_sales
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_checkpoint_rejects_other_files(tmp_path: Path) -> None:
+    """Test invalid checkpoint files and settings are rejected."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a checkpoint")
+    with pytest.raises(ValueError):
+        load_checkpoint(str(path))
+    with pytest.raises(ValueError):
+        Checkpointer(str(path), interval=0)
+
+
+def test_unpicklable_index_fails_before_first_step(tmp_path: Path) -> None:
+    """Test a store with a lambda index is rejected before the run starts."""
+    store = GameStore(verbose=False)
+    store.add_index("pair", lambda game: (game.developer, game.genre))
+    checkpointer = Checkpointer(str(tmp_path / "run.ckpt"), interval=10)
+
+    with pytest.raises(ValueError):
+        run_steps(store, 0, 50, None, None, None, False, None, checkpointer)
+    assert store.step == 0
+    assert not os.listdir(tmp_path)
+
+
+def test_count_ranking_pickles_in_order() -> None:
+    """Test a pickled ranking keeps counts and the order of titles."""
+    ranking = CountRanking()
+    for position, game in enumerate(list(GAMES_DATABASE)[:20]):
+        for _ in range(position % 4 + 1):
+            ranking.increment(game)
+    restored = pickle.loads(pickle.dumps(ranking))
+    assert restored.highest(20) == ranking.highest(20)
+    assert restored.lowest(20) == ranking.lowest(20)
+    restored.increment(GAMES_DATABASE[0])
+    assert restored.count(GAMES_DATABASE[0].game_id) == 2
@@ -0,0 +1,102 @@
+import csv
+import gzip
+import json
+
+from pathlib import Path
+
+import pytest
+
+from src.export import EXPORT_FIELDS
+from src.export import export_columnar
+from src.export import export_csv
+from src.export import export_jsonl
+from src.export import iter_titles
+from src.export import read_columnar
+from src.game import Game
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+
+NON_ASCII_GAME = Game("Ведьмак 3: Дикая Охота", "CD Projekt Red", 2015, "RPG", "WTC_CDP_RU")
+
+
+def _store() -> GameStore:
+    """Return a store with several copies of a few titles, one with a non-ASCII title."""
+    store = GameStore(verbose=False)
+    for position, game in enumerate(list(GAMES_DATABASE)[:9] + [NON_ASCII_GAME]):
+        for _ in range(position % 3 + 1):
+            store.add_game(game, 1000 + 10 * position)
+    return store
+
+
+def _expected(store: GameStore) -> list[dict]:
+    """Return one row per title as exporters should write it."""
+    return [
+        {
+            "game_id": game.game_id,
+            "title": game.title,
+            "developer": game.developer,
+            "release_year": game.release_year,
+            "genre": game.genre,
+            "copies": copies,
+            "price": price,
+        }
+        for game, copies, price in iter_titles(store)
+    ]
+
+
+def test_iter_titles_groups_copies() -> None:
+    """Test the inventory is read once per title with copy counts and prices."""
+    store = _store()
+    rows = list(iter_titles(store))
+    assert len(rows) == 10
+    assert sum(copies for _, copies, _ in rows) == len(store)
+    assert rows[2] == (GAMES_DATABASE[2], 3, 1020)
+
+
+@pytest.mark.parametrize("name", ["titles.csv", "titles.csv.gz"])
+def test_export_csv(tmp_path: Path, name: str) -> None:
+    """Test CSV export round-trips through the csv module, compressed or not."""
+    store = _store()
+    path = tmp_path / name
+    assert export_csv(store, str(path), chunk_rows=3) == 10
+    opener = gzip.open if name.endswith(".gz") else open
+    with opener(path, "rt", newline="", encoding="utf-8") as stream:
+        rows = list(csv.DictReader(stream))
+    assert list(rows[0]) == EXPORT_FIELDS
+    integers = ("release_year", "copies", "price")
+    assert [{**row, **{field: int(row[field]) for field in integers}} for row in rows] == _expected(store)
+
+
+def test_export_jsonl(tmp_path: Path) -> None:
+    """Test JSONL export writes one object per title."""
+    store = _store()
+    path = tmp_path / "titles.jsonl"
+    assert export_jsonl(store, str(path), chunk_rows=4) == 10
+    text = path.read_text(encoding="utf-8")
+    assert NON_ASCII_GAME.title in text
+    assert [json.loads(line) for line in text.splitlines()] == _expected(store)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_export_columnar(tmp_path: Path, compress: bool) -> None:
+    """Test columnar export is read back in row groups."""
+    store = _store()
+    store.add_game(GAMES_DATABASE[11], 500)
+    path = tmp_path / "titles.col"
+    assert export_columnar(store, str(path), compress=compress, chunk_rows=4) == 11
+    groups = list(read_columnar(str(path)))
+    assert [len(group["game_id"]) for group in groups] == [4, 4, 3]
+    rows = [dict(zip(EXPORT_FIELDS, values)) for group in groups for values in zip(*group.values())]
+    assert rows == _expected(store)
+
+
+def test_read_columnar_rejects_other_files(tmp_path: Path) -> None:
+    """Test foreign and truncated files are rejected."""
+    path = tmp_path / "titles.col"
+    path.write_bytes(b"not columnar")
+    with pytest.raises(ValueError):
+        list(read_columnar(str(path)))
+    export_columnar(_store(), str(path))
+    path.write_bytes(path.read_bytes()[:-5])
+    with pytest.raises(ValueError):
+        list(read_columnar(str(path)))
@@ -0,0 +1,100 @@
+import pytest
+
+from src.federation import StoreFederation
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+
+
+def make_federation() -> StoreFederation:
+    """Build a federation of three quiet stores with overlapping stock."""
+    federation = StoreFederation(verbose=False)
+    north = GameStore(verbose=False)
+    north.add_game(GAMES_DATABASE[0], 1500)
+    federation.add_store("north", north, (0.0, 10.0))
+    federation.add_store("south", GameStore(verbose=False), (0.0, -10.0))
+    federation.add_store("east", GameStore(verbose=False), (10.0, 0.0))
+    federation.add_game("south", GAMES_DATABASE[0], 1000)
+    federation.add_game("south", GAMES_DATABASE[0], 1000)
+    federation.add_game("east", GAMES_DATABASE[1], 700)
+    return federation
+
+
+def test_where_reports_stock_per_store() -> None:
+    """Test the availability index covers joined and added stock."""
+    federation = make_federation()
+
+    assert federation.where(GAMES_DATABASE[0]) == {"north": 1, "south": 2}
+    assert federation.where(GAMES_DATABASE[1]) == {"east": 1}
+    assert federation.where(GAMES_DATABASE[2]) == {}
+    assert federation.search("developer", "Remedy Entertainment").keys() == {"north", "south", "east"}
+    assert federation.search("developer", "Ubisoft") == {}
+
+
+def test_buy_routes_to_cheapest_or_nearest() -> None:
+    """Test purchases go to the cheapest store, or the nearest one given a location."""
+    federation = make_federation()
+    game = GAMES_DATABASE[0]
+
+    assert federation.buy_game(game, 5000) == "south"
+    assert federation.buy_game(game, 5000, near=(1.0, 9.0)) == "north"
+    assert federation.where(game) == {"south": 1}
+    assert federation.buy_game(game, 500) is None
+    assert federation.buy_game(game, 1000) == "south"
+    assert federation.where(game) == {}
+    assert federation.buy_game(game, 5000) is None
+
+
+def test_transfer_is_all_or_nothing() -> None:
+    """Test transfers move every requested copy or none."""
+    federation = make_federation()
+    game = GAMES_DATABASE[0]
+
+    assert not federation.transfer(game, "south", "east", 3)
+    assert federation.where(game) == {"north": 1, "south": 2}
+    assert federation.transfer(game, "south", "east", 2)
+    assert federation.where(game) == {"north": 1, "east": 2}
+    assert federation["east"].price(game.game_id) == 1000
+    assert federation.transfer(game, "north", "east")
+    assert federation["east"].price(game.game_id) == 1000
+    assert federation.where(game) == {"east": 3}
+    with pytest.raises(ValueError):
+        federation.transfer(game, "east", "east")
+    with pytest.raises(ValueError):
+        federation.add_store("east", GameStore(verbose=False))
+
+
+def test_where_follows_direct_store_changes() -> None:
+    """Test availability stays current when member stores change on their own."""
+    federation = make_federation()
+    game = GAMES_DATABASE[0]
+    north, south = federation["north"], federation["south"]
+
+    north.buy_game(game, 5000)
+    assert federation.where(game) == {"south": 2}
+    hold_id = south.reserve(game, 2)
+    south.remove_game(game)
+    assert federation.where(game) == {}
+    assert federation.buy_game(game, 5000) is None
+    south.tick(2)
+    assert south.holds() == 0
+    assert federation.where(game) == {"south": 1}
+    assert not south.commit(hold_id)
+    north.add_game(GAMES_DATABASE[2], 900)
+    assert federation.where(GAMES_DATABASE[2]) == {"north": 1}
+
+
+def test_store_with_overflowed_feed_is_reindexed() -> None:
+    """Test a store whose feed dropped unread changes is indexed again from its stock."""
+    federation = StoreFederation(verbose=False)
+    store = GameStore(verbose=False)
+    store.change_feed(capacity=4)
+    federation.add_store("small", store)
+    for game in list(GAMES_DATABASE)[:10]:
+        store.add_game(game, 1000)
+    for game in list(GAMES_DATABASE)[:5]:
+        store.remove_game(game)
+
+    assert federation.where(list(GAMES_DATABASE)[7]) == {"small": 1}
+    assert federation._subscriptions["small"].missed > 0
+    assert federation.where(list(GAMES_DATABASE)[2]) == {}
+    assert set(federation._availability) == {game.game_id for game in list(GAMES_DATABASE)[5:10]}
@@ -0,0 +1,56 @@
+import inspect
+
+from src.game import set_type_checks
+from src.game import type_checks_disabled
+from src.game import type_checks_enabled
+from src.game_collection import GameCollection
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+
+
+def test_game_type_keeps_metadata() -> None:
+    """Test decorated methods keep their name, docstring and signature."""
+    assert GameCollection.add_game.__name__ == "add_game"
+    assert GameCollection.add_game.__doc__ is not None
+    assert list(inspect.signature(GameStore.remove_game).parameters) == ["self", "game", "print_log"]
+    assert inspect.unwrap(GameStore.remove_game) is not GameStore.remove_game
+
+
+def test_game_type_keeps_defaults_and_keywords() -> None:
+    """Test wrappers accept defaults and keyword arguments."""
+    store = GameStore()
+    store.add_game(GAMES_DATABASE[0], 999)
+    assert store.remove_game(game=GAMES_DATABASE[0], print_log=False)
+    assert len(store) == 0
+
+
+def test_type_checks_disabled_context() -> None:
+    """Test validation can be switched off for a trusted block and restored."""
+    collection = GameCollection()
+    with type_checks_disabled():
+        assert not type_checks_enabled()
+        collection.add_game("not a game")
+    assert type_checks_enabled()
+    assert len(collection) == 1
+
+    try:
+        collection.add_game("not a game")
+        assert False
+    except TypeError as e:
+        assert str(e) == "Game must be of type Game"
+
+
+def test_set_type_checks() -> None:
+    """Test global switch disables and re-enables validation."""
+    collection = GameCollection()
+    set_type_checks(False)
+    try:
+        assert "not a game" not in collection
+    finally:
+        set_type_checks(True)
+
+    try:
+        "not a game" in collection
+        assert False
+    except TypeError as e:
+        assert str(e) == "Game must be of type Game"
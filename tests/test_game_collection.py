@@ -206,3 +206,13 @@ def test_collection_as_iterable() -> None:
         count += 1
 
     assert count == 3
+
+
+def test_discard() -> None:
+    """Test discard removes one copy and reports missing games."""
+    collection = GameCollection([GAMES_DATABASE[0], GAMES_DATABASE[1], GAMES_DATABASE[0]])
+
+    assert collection.discard(GAMES_DATABASE[0])
+    assert list(collection) == [GAMES_DATABASE[1], GAMES_DATABASE[0]]
+    assert not collection.discard(GAMES_DATABASE[2])
+    assert len(collection) == 2
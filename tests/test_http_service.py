@@ -0,0 +1,170 @@
+import asyncio
+import json
+
+from typing import Any
+
+import pytest
+
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.http_service import StoreService
+from src.http_service import load_test
+from src.http_service import read_message
+
+
+async def _request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    method: str,
+    target: str,
+    fields: dict[str, Any] | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """Send one request over an open connection and return status and JSON payload."""
+    body = json.dumps(fields).encode() if fields is not None else b""
+    writer.write(f"{method} {target} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    message = await read_message(reader)
+    assert message is not None
+    status_line, headers, response = message
+    assert headers["connection"] == "keep-alive"
+    return int(status_line.split(" ")[1]), json.loads(response)
+
+
+def test_endpoints_over_one_connection() -> None:
+    """Test add, buy, return, search and stats on a single keep-alive connection."""
+
+    async def scenario() -> None:
+        service = StoreService(GameStore(verbose=False))
+        await service.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+        game = GAMES_DATABASE[0]
+        try:
+            added = await _request(reader, writer, "POST", "/add", {"game_id": game.game_id, "price": 900, "copies": 2})
+            assert added == (200, {"ok": True})
+            status, sale = await _request(reader, writer, "POST", "/buy", {"game_id": game.game_id, "balance": 1000})
+            assert (status, sale) == (200, {"ok": True, "sale_id": 0})
+            status, refused = await _request(reader, writer, "POST", "/buy", {"game_id": game.game_id, "balance": 10})
+            assert refused == {"ok": False, "sale_id": None}
+            returned = await _request(reader, writer, "POST", "/return", {"game_id": game.game_id, "sale_id": 0})
+            assert returned == (200, {"ok": True})
+
+            status, found = await _request(reader, writer, "GET", f"/search?index=release_year&key={game.release_year}")
+            assert found["games"] == [{**found["games"][0], "game_id": game.game_id, "copies": 1}]
+            status, stats = await _request(reader, writer, "GET", "/stats")
+            assert (stats["games"], stats["sold_games"], stats["returned_games"], stats["profit"]) == (1, 1, 1, 0)
+
+            assert (await _request(reader, writer, "POST", "/buy", {"game_id": "NOPE", "balance": 1}))[0] == 404
+            assert (await _request(reader, writer, "GET", "/missing"))[0] == 404
+            assert (await _request(reader, writer, "POST", "/add", {"game_id": game.game_id}))[0] == 400
+            assert (await _request(reader, writer, "GET", "/search?index=price&key=1"))[0] == 400
+        finally:
+            writer.close()
+            await service.close()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_requests_are_batched() -> None:
+    """Test concurrent clients share batches and get consistent results."""
+
+    async def scenario() -> dict[str, float]:
+        store = GameStore(verbose=False)
+        for game in GAMES_DATABASE:
+            store.add_game(game, 1000)
+        ledger = store.ledger()
+        service = StoreService(store)
+        await service.start()
+        try:
+            report = await load_test("127.0.0.1", service.port, connections=8, requests=800)
+        finally:
+            await service.close()
+        assert service.requests == 800
+        assert service.batches < service.requests
+        assert store.stats()["sold_games"] == len(ledger)
+        return report
+
+    report = asyncio.run(scenario())
+    assert report["requests"] == 800
+    assert report["errors"] == 0
+    assert 0 < report["p50_ms"] <= report["p99_ms"]
+
+
+def test_failing_operation_does_not_stop_the_service(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an exception in the store is answered with an error and later requests still run."""
+
+    def broken(*args: Any) -> None:
+        raise RuntimeError("broken index")
+
+    async def scenario() -> None:
+        store = GameStore(verbose=False)
+        monkeypatch.setattr(store, "search", broken)
+        service = StoreService(store)
+        await service.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+        try:
+            status, payload = await _request(reader, writer, "GET", "/search?index=genre&key=RPG")
+            assert status == 500
+            assert "broken index" in payload["error"]
+            status, stats = await asyncio.wait_for(_request(reader, writer, "GET", "/stats"), 5)
+            assert (status, stats["games"]) == (200, 0)
+            assert service._batcher is not None and not service._batcher.done()
+        finally:
+            writer.close()
+            await service.close()
+
+    asyncio.run(scenario())
+
+
+def test_add_rejects_invalid_prices() -> None:
+    """Test booleans, non-positive and out-of-range prices and copies are rejected before the store."""
+
+    async def scenario() -> None:
+        store = GameStore(verbose=False)
+        service = StoreService(store)
+        await service.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+        game_id = GAMES_DATABASE[0].game_id
+        try:
+            invalid: list[dict[str, Any]] = [
+                {"price": True},
+                {"price": 0},
+                {"price": -5},
+                {"price": 10**30},
+                {"price": 100, "copies": False},
+                {"price": 100, "copies": 10**9},
+            ]
+            for fields in invalid:
+                status, _ = await _request(reader, writer, "POST", "/add", {"game_id": game_id, **fields})
+                assert status == 400
+            status, _ = await _request(reader, writer, "POST", "/buy", {"game_id": game_id, "balance": True})
+            assert status == 400
+            assert len(store) == 0
+            assert (await _request(reader, writer, "POST", "/add", {"game_id": game_id, "price": 2**63 - 1}))[0] == 200
+        finally:
+            writer.close()
+            await service.close()
+
+    asyncio.run(scenario())
+
+
+def test_search_keys_with_spaces() -> None:
+    """Test encoded multi-word keys are found and an unencoded request line is rejected."""
+
+    async def scenario() -> None:
+        store = GameStore(verbose=False)
+        store.add_game(GAMES_DATABASE[0], 1000)
+        service = StoreService(store)
+        await service.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+        try:
+            status, found = await _request(reader, writer, "GET", "/search?index=developer&key=Remedy+Entertainment")
+            assert (status, [game["game_id"] for game in found["games"]]) == (200, [GAMES_DATABASE[0].game_id])
+            writer.write(b"GET /search?index=developer&key=Remedy Entertainment HTTP/1.1\r\n\r\n")
+            message = await read_message(reader)
+            assert message is not None
+            assert message[0].split(" ")[1] == "400"
+            assert message[1]["connection"] == "close"
+        finally:
+            writer.close()
+            await service.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,58 @@
+from src import instrumentation
+from src.game_collection import GameCollection
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+
+
+def test_disabled_by_default() -> None:
+    """Test no method is wrapped until instrumentation is enabled."""
+    assert not instrumentation.is_enabled()
+    assert "__wrapped__" not in vars(GameStore.get_stats)
+
+
+def test_records_calls_and_restores_methods() -> None:
+    """Test enabled instrumentation counts calls and disable restores originals."""
+    original_add = GameStore.__dict__["add_game"]
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        store = GameStore()
+        store.add_game(GAMES_DATABASE[0], 999)
+        store.add_game(GAMES_DATABASE[0], 999)
+        store.buy_game(GAMES_DATABASE[0], 5000)
+        GameStore.print_search(GameCollection(), "genre", "Action")
+    finally:
+        instrumentation.disable()
+
+    assert GameStore.__dict__["add_game"] is original_add
+    stats = instrumentation.snapshot()
+    assert stats["GameStore.add_game"]["calls"] == 2
+    assert stats["GameStore.buy_game"]["calls"] == 1
+    assert stats["GameDict.add_game"]["calls"] == 8
+    assert stats["GameStore.print_search"]["calls"] == 1
+    assert 0 < stats["GameStore.add_game"]["p50_ns"] <= stats["GameStore.add_game"]["p99_ns"]
+
+
+def test_prometheus_export() -> None:
+    """Test Prometheus text contains counters and quantiles per method."""
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        GameStore().add_game(GAMES_DATABASE[1], 999)
+    finally:
+        instrumentation.disable()
+
+    text = instrumentation.to_prometheus()
+    assert 'game_store_method_calls_total{method="GameStore.add_game"} 1' in text
+    assert 'game_store_method_latency_seconds{method="GameStore.add_game",quantile="0.99"}' in text
+    assert "# TYPE game_store_method_latency_seconds summary" in text
+
+
+def test_histogram_quantiles() -> None:
+    """Test histogram quantiles fall into power-of-two buckets."""
+    histogram = instrumentation.LatencyHistogram()
+    assert histogram.quantile(0.5) == 0
+    for elapsed in [100] * 99 + [10_000]:
+        histogram.record(elapsed)
+    assert histogram.quantile(0.5) == 128
+    assert histogram.quantile(0.999) == 16384
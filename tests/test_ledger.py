@@ -0,0 +1,42 @@
+from src.ledger import Sale
+from src.ledger import SalesLedger
+
+
+def test_ledger_records_sales() -> None:
+    """Test sales are found by purchase id and by game."""
+    ledger = SalesLedger()
+    first = ledger.record("CTL_RMD", 3, 1000)
+    second = ledger.record("HLF_VLV", 4, 700)
+    third = ledger.record("CTL_RMD", 9, 1200)
+
+    assert (first, second, third) == (0, 1, 2)
+    assert len(ledger) == 3
+    assert ledger.get(third) == Sale(2, "CTL_RMD", 9, 1200, False)
+    assert ledger.get(3) is None
+    assert ledger.get(-1) is None
+    assert ledger.sales_of("CTL_RMD") == [0, 2]
+    assert ledger.sales_of("MISSING") == []
+
+
+def test_mark_returned() -> None:
+    """Test returned sales stay in the ledger with their flag set."""
+    ledger = SalesLedger()
+    first = ledger.record("CTL_RMD", 1, 1000)
+    second = ledger.record("CTL_RMD", 10, 1000)
+    ledger.mark_returned(second)
+
+    assert ledger.get(first) == Sale(first, "CTL_RMD", 1, 1000, False)
+    assert ledger.get(second) == Sale(second, "CTL_RMD", 10, 1000, True)
+    assert repr(ledger) == "SalesLedger: 2 sales (1 returned)"
+
+
+def test_ledger_starts_at_first_id() -> None:
+    """Test a ledger started mid-run numbers sales from its first id."""
+    ledger = SalesLedger(first_id=40)
+    sale_id = ledger.record("CTL_RMD", 7, 900)
+
+    assert sale_id == 40
+    assert ledger.get(40) == Sale(40, "CTL_RMD", 7, 900, False)
+    assert ledger.get(0) is None
+    ledger.mark_returned(40)
+    assert ledger.get(40) == Sale(40, "CTL_RMD", 7, 900, True)
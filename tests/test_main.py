@@ -0,0 +1,73 @@
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from src import games_db
+from src import main
+
+
+def test_main_import_is_lazy() -> None:
+    """Test importing the CLI does not load the simulation or build the catalog."""
+    code = "import sys, src.main, src.games_db; print('src.simulation' in sys.modules, src.games_db._games_database)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["False", "None"]
+
+
+def test_games_database_is_cached() -> None:
+    """Test the lazily built catalog is created once and shared."""
+    assert games_db.GAMES_DATABASE is games_db.get_games_database()
+    with pytest.raises(AttributeError):
+        getattr(games_db, "MISSING_ATTRIBUTE")
+
+
+def test_parse_sm_args() -> None:
+    """Test sm arguments are parsed and invalid ones rejected."""
+    assert main.parse_sm_args(["10", "100"]) == (10, 100, None)
+    assert main.parse_sm_args(["10", "100", "3"]) == (10, 100, 3)
+    assert main.parse_sm_args(["10"]) is None
+    assert main.parse_sm_args(["10", "x"]) is None
+    assert main.parse_sm_args(["10", "100", "x"]) is None
+
+
+def test_split_and_read_runs(tmp_path: Path) -> None:
+    """Test runs are read from argv words and from a specification file."""
+    assert main.split_runs(["sm", "1", "2", "sm", "3", "4", "5"]) == [(1, 2, None), (3, 4, 5)]
+    with pytest.raises(ValueError):
+        main.split_runs(["run", "1", "2"])
+
+    specs = tmp_path / "runs.txt"
+    specs.write_text("# comment\nsm 1 2 3\n\n4 5\n", encoding="utf-8")
+    assert main.read_runs(str(specs)) == [(1, 2, 3), (4, 5, None)]
+
+
+def test_batch_runs_in_pool(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test batch mode runs simulations concurrently and writes outputs and summary."""
+    summary = tmp_path / "summary.json"
+    output_dir = tmp_path / "runs"
+    argv = ["sm", "5", "200", "1", "sm", "5", "200", "1", "sm", "3", "50", "2", "-j", "2"]
+    assert main.batch(argv + ["-o", str(output_dir), "-s", str(summary)]) == 0
+
+    results = json.loads(summary.read_text(encoding="utf-8"))
+    assert [result["run"] for result in results] == [0, 1, 2]
+    assert results[0]["stats"] == results[1]["stats"]
+    assert "Simulation complete" in (output_dir / "run_2.log").read_text(encoding="utf-8")
+    assert capsys.readouterr().out.count("✅run") == 3
+
+
+def test_batch_quiet_json_summary(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test quiet batch mode prints only the JSON summary."""
+    assert main.batch(["-q", "-j", "1", "-s", "-", "sm", "2", "30", "4"]) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert results[0]["steps"] == 30
+    assert set(results[0]["stats"]) >= {"profit", "sold_games", "returned_games"}
+
+
+def test_batch_accepts_options_between_runs(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test options may be placed between sm groups."""
+    assert main.batch(["sm", "2", "30", "4", "-q", "-j", "1", "sm", "3", "20", "5", "-s", "-"]) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert [(result["start"], result["steps"], result["seed"]) for result in results] == [(2, 30, 4), (3, 20, 5)]
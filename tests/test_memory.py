@@ -0,0 +1,36 @@
+import sys
+
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.memory import deep_sizeof
+
+
+def test_deep_sizeof_counts_shared_objects_once() -> None:
+    """Test an object reachable twice, or already seen, is not counted again."""
+    shared = list(range(1000, 1100))
+    container = [shared, shared]
+    seen: set[int] = set()
+
+    alone = deep_sizeof(shared, seen)
+    assert alone >= sys.getsizeof(shared) + 100 * sys.getsizeof(1000)
+    assert deep_sizeof(container, seen) == sys.getsizeof(container)
+    assert deep_sizeof(container) == alone + sys.getsizeof(container)
+
+
+def test_memory_report_breaks_down_store() -> None:
+    """Test the report covers every structure and extra copies only grow the containers."""
+    store = GameStore(verbose=False)
+    for game in list(GAMES_DATABASE)[:10]:
+        store.add_game(game, 1000)
+    before = store.memory_report()
+    for _ in range(50):
+        store.add_game(GAMES_DATABASE[0], 1000)
+    after = store.memory_report()
+
+    assert before["total"] == sum(size for name, size in before.items() if name != "total")
+    assert {"games", "all_copies", "by_id", "index:developer", "prices", "snapshot"} <= before.keys()
+    assert after["games"] == before["games"]
+    assert after["all_copies"] > before["all_copies"]
+    assert after["snapshot"] == 0
+    store.snapshot()
+    assert store.memory_report()["snapshot"] > 0
@@ -0,0 +1,122 @@
+import pytest
+
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.price_history import PriceHistory
+from src.price_history import TimeSeries
+from src.simulation import simulate
+
+
+def test_time_series_lookups() -> None:
+    """Test value at a step and range totals match a plain scan."""
+    series = TimeSeries()
+    points = [(step // 3, step * 7 % 11) for step in range(300)]
+    for step, value in points:
+        series.append(step, value)
+
+    assert len(series) == 300
+    assert series.value_at(-1) is None
+    assert series.value_at(0) == points[2][1]
+    assert series.value_at(50) == points[152][1]
+    assert series.value_at(1000) == points[-1][1]
+    for start, stop in [(0, 100), (10, 11), (30, 30), (95, 200)]:
+        assert series.total(start, stop) == sum(value for step, value in points if start <= step < stop)
+    windows = series.totals_per_window(7, 0, 100)
+    assert len(windows) == 15
+    assert windows == [series.total(edge, min(edge + 7, 100)) for edge in range(0, 100, 7)]
+
+
+def test_time_series_rejects_past_steps() -> None:
+    """Test appending a point before the last one raises ValueError."""
+    series = TimeSeries()
+    series.append(5, 1)
+    with pytest.raises(ValueError):
+        series.append(4, 1)
+    with pytest.raises(ValueError):
+        series.totals_per_window(0, 0, 10)
+
+
+def test_time_series_rejects_overflow_atomically() -> None:
+    """Test a point outside int64 leaves the series, the history and the store unchanged."""
+    series = TimeSeries()
+    series.append(0, (1 << 63) - 1)
+    with pytest.raises(ValueError):
+        series.append(1, 1 << 63)
+    with pytest.raises(ValueError):
+        series.append(1, 1)
+    assert len(series.values) == len(series.steps) == 1
+    with pytest.raises(ValueError):
+        series.check(1, 1)
+    series.check(1, -1)
+    assert len(series) == 1
+
+    history = PriceHistory()
+    with pytest.raises(ValueError):
+        history.record_price("CTL_RMD", 0, 1 << 63)
+    history.record_price("CTL_RMD", 0, 1000)
+    assert history.price_changes("CTL_RMD") == [(0, 1000)]
+
+    store = GameStore(verbose=False)
+    game = GAMES_DATABASE[0]
+    store.add_game(game, 1000)
+    for price in (1 << 63, 10.5, "1000"):
+        with pytest.raises(ValueError):
+            store.add_game(game, price)  # type: ignore[arg-type]
+    assert len(store) == 1
+    assert len(store._by_id[game.game_id]) == 1
+    assert store._prices[game] == 1000
+    with pytest.raises(ValueError):
+        store.set_prices([game], [1 << 63])
+    assert store._prices[game] == 1000
+
+
+def test_price_history_skips_unchanged_prices() -> None:
+    """Test only actual price changes are recorded."""
+    history = PriceHistory()
+    history.record_price("CTL_RMD", 0, 1000)
+    history.record_price("CTL_RMD", 2, 1000)
+    history.record_price("CTL_RMD", 4, 1200)
+
+    assert history.price_changes("CTL_RMD") == [(0, 1000), (4, 1200)]
+    assert history.price_at("CTL_RMD", 3) == 1000
+    assert history.price_at("CTL_RMD", 4) == 1200
+    assert history.price_at("MISSING", 4) is None
+    assert history.price_changes("MISSING") == []
+
+
+def test_store_records_prices_and_revenue() -> None:
+    """Test the store records prices, sales and refunds on its clock."""
+    store = GameStore(verbose=False)
+    game = GAMES_DATABASE[0]
+    history = store.history()
+    store.add_game(game, 1000)
+    store.add_game(game, 1000)
+    store.tick()
+    store.buy_game(game, 5000)
+    first_sale = store.last_sale_id
+    store.tick(2)
+    store.add_game(game, 1500)
+    store.buy_game(game, 5000)
+    store.return_game(game, first_sale)
+
+    assert store.history() is history
+    assert store.step == 3
+    assert history.price_changes(game.game_id) == [(0, 1000), (3, 1500)]
+    assert history.revenue(0, 4) == store.stats()["profit"] == 1500
+    assert history.revenue_per_window(2, 0, 4) == [1000, 500]
+    assert history.revenue(0, 4, game.game_id) == 1500
+    assert history.revenue(0, 4, GAMES_DATABASE[1].game_id) == 0
+    with pytest.raises(ValueError):
+        store.tick(-1)
+
+
+def test_simulation_advances_store_clock() -> None:
+    """Test simulate ticks once per step and a history started afterwards holds current prices only."""
+    store = simulate(10, 200, 3, verbose=False)
+
+    assert store.step == 200
+    assert store._history is None
+    history = store.history()
+    assert history.revenue(0, 201) == 0
+    for game in set(store):
+        assert history.price_changes(game.game_id) == [(200, store.price(game.game_id))]
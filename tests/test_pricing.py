@@ -0,0 +1,95 @@
+from collections import Counter
+from random import Random
+
+import numpy as np
+import pytest
+
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.pricing import PricingEngine
+from src.simulation import simulate
+
+
+def test_compute_applies_demand_scarcity_and_age() -> None:
+    """Test faster sellers, scarcer and newer titles get higher prices."""
+    engine = PricingEngine(current_year=2025, rounding=1)
+    list_prices = np.full(4, 1000.0)
+    velocity = np.array([0.0, 1.0, 0.5, 0.5])
+    stock = np.array([2.0, 2.0, 1.0, 2.0])
+    years = np.array([2025.0, 2025.0, 2025.0, 2005.0])
+
+    prices = engine.compute(list_prices, velocity, stock, years)
+
+    assert prices.dtype == np.int64
+    assert prices[1] > prices[0]
+    assert prices[2] > prices[3]
+    assert prices[3] < 1000 * (1 - 0.03 * 20) * 1.1
+
+
+def test_reprice_writes_changed_prices() -> None:
+    """Test a pass updates store prices, history and the snapshot mirror."""
+    store = GameStore(verbose=False)
+    for game in list(GAMES_DATABASE)[:6]:
+        for _ in range(3):
+            store.add_game(game, 2000)
+    snapshot = store.snapshot()
+    history = store.history()
+    engine = PricingEngine()
+    engine.attach(store)
+    store.tick(10)
+    for _ in range(2):
+        store.buy_game(GAMES_DATABASE[0], 5000)
+    store.buy_game(GAMES_DATABASE[1], 5000)
+
+    updated = engine.reprice(store)
+
+    assert updated > 0
+    assert store._prices[GAMES_DATABASE[0]] > store._prices[GAMES_DATABASE[2]]
+    assert store.snapshot().price(GAMES_DATABASE[0]) == store._prices[GAMES_DATABASE[0]]
+    assert snapshot.price(GAMES_DATABASE[0]) == 2000
+    assert history.price_changes(GAMES_DATABASE[0].game_id)[0] == (0, 2000)
+    assert history.price_at(GAMES_DATABASE[0].game_id, store.step) == store._prices[GAMES_DATABASE[0]]
+    assert engine.reprice(store) >= 0
+    with pytest.raises(ValueError):
+        PricingEngine(interval=0)
+    with pytest.raises(ValueError):
+        store.set_prices([GAMES_DATABASE[10]], [100])
+
+
+def test_simulation_runs_pricing_every_interval(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test simulate calls the engine every interval steps."""
+    simulate(10, 100, 5, pricing=PricingEngine(interval=25))
+
+    assert capsys.readouterr().out.count("💹Prices updated") == 4
+
+
+def test_title_columns_follow_store_mutations() -> None:
+    """Test the store keeps stock, net sales and prices of its title columns exact."""
+    rng = Random(3)
+    store = GameStore(verbose=False)
+    for game in list(GAMES_DATABASE)[:5]:
+        store.add_game(game, 1500)
+    columns = store.title_columns()
+    sold: Counter = Counter()
+    for _ in range(2000):
+        game = rng.choice(list(GAMES_DATABASE)[:10])
+        action = rng.random()
+        if action < 0.4:
+            store.add_game(game, rng.randrange(100, 3000))
+        elif action < 0.7 and store.buy_game(game, 5000):
+            sold[game.game_id] += 1
+        elif action < 0.8 and store.return_game(game):
+            sold[game.game_id] -= 1
+        elif action < 0.9:
+            store.remove_game(game)
+        else:
+            store.tick()
+
+    assert len(columns) == 10
+    for game_id, row in columns.rows.items():
+        copies = store._by_id.search(game_id)
+        assert columns.stock[row] == len(copies)
+        assert columns.sold[row] == sold[game_id]
+        if copies:
+            assert columns.price[row] == store._prices[copies[0]]
+    assert store.memory_report()["columns"] > 0
@@ -0,0 +1,88 @@
+from collections import Counter
+from random import Random
+
+import pytest
+
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.rankings import CountRanking
+
+
+def test_count_ranking_matches_counter() -> None:
+    """Test random increments and decrements keep buckets sorted and counts exact."""
+    rng = Random(0)
+    ranking = CountRanking()
+    expected: Counter = Counter()
+    for _ in range(5000):
+        game = rng.choice(GAMES_DATABASE)
+        if expected[game.game_id] and rng.random() < 0.45:
+            ranking.decrement(game)
+            expected[game.game_id] -= 1
+            if not expected[game.game_id]:
+                del expected[game.game_id]
+        else:
+            ranking.increment(game)
+            expected[game.game_id] += 1
+
+    assert len(ranking) == len(expected)
+    counts = sorted(expected.values(), reverse=True)
+    highest = ranking.highest(len(expected))
+    assert [count for _, count in highest] == counts
+    assert all(expected[game.game_id] == count for game, count in highest)
+    assert [count for _, count in ranking.lowest(3)] == sorted(expected.values())[:3]
+    assert ranking.count("MISSING") == 0
+
+
+def test_count_ranking_from_counts() -> None:
+    """Test a ranking built from counts matches one built by increments."""
+    counts = [(game, position % 4) for position, game in enumerate(list(GAMES_DATABASE)[:12])]
+    ranking = CountRanking.from_counts(counts)
+    expected = CountRanking()
+    for game, count in counts:
+        for _ in range(count):
+            expected.increment(game)
+
+    assert len(ranking) == 9
+    assert sorted(ranking.highest(12), key=lambda pair: pair[0].game_id) == sorted(
+        expected.highest(12), key=lambda pair: pair[0].game_id
+    )
+    assert [count for _, count in ranking.lowest(12)] == sorted(count for _, count in counts if count)
+    ranking.decrement(counts[1][0])
+    assert counts[1][0].game_id not in ranking
+
+
+def test_count_ranking_drops_titles_at_zero() -> None:
+    """Test a title leaves the ranking when its count reaches zero."""
+    ranking = CountRanking()
+    game = GAMES_DATABASE[0]
+    ranking.increment(game)
+    ranking.decrement(game)
+
+    assert game.game_id not in ranking
+    assert ranking.highest(5) == []
+    with pytest.raises(ValueError):
+        ranking.decrement(game)
+
+
+def test_store_top_sellers_and_low_stock() -> None:
+    """Test store rankings follow purchases, returns and removals."""
+    store = GameStore(verbose=False)
+    first, second, third = GAMES_DATABASE[0], GAMES_DATABASE[1], GAMES_DATABASE[2]
+    for game, copies in ((first, 5), (second, 3), (third, 2)):
+        for _ in range(copies):
+            store.add_game(game, 1000)
+    assert store.top_sellers() == []
+
+    store.buy_game(first, 1000)
+    store.buy_game(first, 1000)
+    store.buy_game(second, 1000)
+    store.buy_game(third, 1000)
+    store.buy_game(third, 1000)
+    store.return_game(third)
+
+    assert store.top_sellers(2) == [(first, 2), (second, 1)]
+    assert store.low_stock(2) == [(second, 2), (first, 3)]
+
+    store.remove_game(second)
+    store.remove_game(second)
+    assert store.low_stock() == [(first, 3)]
@@ -0,0 +1,112 @@
+from random import Random
+
+import pytest
+
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.timer_wheel import TimerWheel
+
+
+def test_timer_wheel_fires_at_deadlines() -> None:
+    """Test timers across every level and the overflow fire exactly when due."""
+    rng = Random(0)
+    wheel: TimerWheel[int] = TimerWheel(start=7, slot_bits=3, levels=2)
+    deadlines = {}
+    now = 7
+    for key in range(2000):
+        deadline = now + int(rng.choice([1, 8, 64, 1000]) * rng.random())
+        wheel.schedule(key, deadline)
+        deadlines[key] = max(deadline, now + 1)
+        if key % 10 == 0:
+            target = now + rng.randrange(50)
+            for fired in wheel.advance(target):
+                assert now < deadlines.pop(fired) <= target
+            now = target
+    for fired in wheel.advance(now + 10_000):
+        assert deadlines.pop(fired) > now
+    assert not deadlines
+    assert len(wheel) == 0
+
+
+def test_timer_wheel_cancel_and_sparse_advance() -> None:
+    """Test cancelled timers leave the wheel and far deadlines are reached without stepping."""
+    wheel: TimerWheel[str] = TimerWheel(slot_bits=3, levels=2)
+    wheel.schedule("a", 5)
+    wheel.schedule("b", 40)
+    wheel.schedule("c", 10**9)
+    wheel.schedule("d", 10**8)
+    assert wheel.cancel("d")
+    wheel.schedule("d", 10**10)
+    with pytest.raises(ValueError):
+        wheel.schedule("a", 6)
+    assert wheel.cancel("b")
+    assert not wheel.cancel("b")
+    assert "b" not in wheel
+    assert len(wheel) == 3
+
+    assert wheel.advance(100) == ["a"]
+    calls = 0
+    next_event = wheel._next_event
+
+    def counted() -> int:
+        nonlocal calls
+        calls += 1
+        return next_event()
+
+    wheel._next_event = counted  # type: ignore[method-assign]
+    assert wheel.advance(10**9) == ["c"]
+    assert calls < 100
+    assert wheel.advance(10**10) == ["d"]
+    assert len(wheel) == 0
+    assert wheel.now == 10**10
+
+
+def test_reserve_and_commit() -> None:
+    """Test a committed hold is sold at the held price."""
+    store = GameStore(verbose=False)
+    game = GAMES_DATABASE[0]
+    store.add_game(game, 1000)
+    store.add_game(game, 1000)
+    ledger = store.ledger()
+
+    hold_id = store.reserve(game, 5)
+    assert hold_id == 1
+    assert len(store) == 1
+    store.add_game(game, 1500)
+
+    assert store.commit(hold_id)
+    assert not store.commit(hold_id)
+    assert hold_id not in store._hold_timers
+    assert not store.release(hold_id)
+    assert store._profit == 1000
+    assert store._sold_games == 1
+    sale = ledger.get(store.last_sale_id) if store.last_sale_id is not None else None
+    assert sale is not None and sale.price == 1000
+    assert len(store) == 2
+
+
+def test_release_and_expiry_restock() -> None:
+    """Test released and expired holds put their copies back on sale."""
+    store = GameStore(verbose=False)
+    game = GAMES_DATABASE[1]
+    store.add_game(game, 800)
+
+    hold_id = store.reserve(game, 3)
+    assert hold_id is not None
+    assert game not in store
+    assert store.reserve(game, 3) is None
+    assert store.release(hold_id)
+    assert len(store) == 1
+    assert store._prices[game] == 800
+
+    expiring = store.reserve(game, 3)
+    assert expiring is not None
+    store.tick(2)
+    assert store.holds() == 1
+    assert game not in store
+    store.tick()
+    assert store.holds() == 0
+    assert game in store
+    assert not store.commit(expiring)
+    with pytest.raises(ValueError):
+        store.reserve(game, 0)
@@ -0,0 +1,117 @@
+import struct
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.catalog_generator import fill_store
+from src.catalog_generator import generate_catalog
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.shm_replica import SEQUENCE_OFFSET
+from src.shm_replica import ReplicaReader
+from src.shm_replica import ReplicaWriter
+
+
+def read_in_worker(name: str, developer: str, game_id: str) -> tuple[int, list[str], int]:
+    """Attach to a replica from another process and query it."""
+    reader = ReplicaReader(name)
+    try:
+        found = [game.game_id for game in reader.search_by_developer(developer)]
+        return reader.version, sorted(found), reader.copies(game_id)
+    finally:
+        reader.close()
+
+
+def test_replica_matches_store() -> None:
+    """Test every index key and stock check agrees with the published store."""
+    store = GameStore(verbose=False)
+    games = list(generate_catalog(500, random_seed=3))
+    fill_store(store, games, copies=2)
+    store.buy_game(games[0], 10_000)
+    writer = ReplicaWriter(store, capacity=1 << 20)
+    reader = ReplicaReader(writer.name)
+    try:
+        assert reader.version == 0
+        assert writer.publish() == 1
+        for name in ("developer", "release_year", "genre"):
+            keys = {getattr(game, name) for game in games}
+            for key in keys:
+                assert sorted(reader.search(name, key), key=str) == sorted(set(store.search(name, key)), key=str)
+        assert reader.copies(games[0].game_id) == 1
+        assert reader.copies(games[1].game_id) == 2
+        assert reader.price(games[1].game_id) == 1000
+        assert reader.copies("MISSING") == 0
+        assert reader.price("MISSING") is None
+        assert reader.search_by_developer("Nobody") == []
+        with pytest.raises(ValueError):
+            reader.search("title", "Control")
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_replica_is_read_from_other_processes() -> None:
+    """Test a reader process sees each new publish and leaves the segment alive when it exits."""
+    store = GameStore(verbose=False)
+    store.add_game(GAMES_DATABASE[0], 1000)
+    writer = ReplicaWriter(store, capacity=1 << 16)
+    try:
+        writer.publish()
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            first = pool.submit(read_in_worker, writer.name, "Remedy Entertainment", GAMES_DATABASE[0].game_id)
+            assert first.result() == (1, [GAMES_DATABASE[0].game_id], 1)
+            store.add_game(GAMES_DATABASE[1], 1000)
+            store.add_game(GAMES_DATABASE[0], 1000)
+            writer.publish()
+            second = pool.submit(read_in_worker, writer.name, "Remedy Entertainment", GAMES_DATABASE[0].game_id)
+            assert second.result() == (2, sorted([GAMES_DATABASE[0].game_id, GAMES_DATABASE[1].game_id]), 2)
+        reader = ReplicaReader(writer.name)
+        assert reader.copies(GAMES_DATABASE[0].game_id) == 2
+        reader.close()
+    finally:
+        writer.close()
+
+
+def test_publish_rejects_small_segment() -> None:
+    """Test a payload larger than the segment is not published."""
+    store = GameStore(verbose=False)
+    fill_store(store, generate_catalog(100))
+    writer = ReplicaWriter(store, capacity=256)
+    try:
+        with pytest.raises(ValueError):
+            writer.publish()
+    finally:
+        writer.close()
+
+
+def test_replica_keeps_int64_prices() -> None:
+    """Test prices beyond 32 bits are published and read back."""
+    store = GameStore(verbose=False)
+    store.add_game(GAMES_DATABASE[0], 1 << 40)
+    writer = ReplicaWriter(store, capacity=1 << 16)
+    reader = ReplicaReader(writer.name)
+    try:
+        writer.publish()
+        assert reader.price(GAMES_DATABASE[0].game_id) == 1 << 40
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_reader_times_out_on_unfinished_publish() -> None:
+    """Test a reader gives up when the writer left the sequence odd, e.g. by dying mid-publish."""
+    store = GameStore(verbose=False)
+    store.add_game(GAMES_DATABASE[0], 1000)
+    writer = ReplicaWriter(store, capacity=1 << 16)
+    reader = ReplicaReader(writer.name, timeout=0.01)
+    try:
+        writer.publish()
+        buffer = writer._shm.buf
+        assert buffer is not None
+        struct.pack_into("<Q", buffer, SEQUENCE_OFFSET, 3)
+        with pytest.raises(TimeoutError):
+            reader.copies(GAMES_DATABASE[0].game_id)
+    finally:
+        reader.close()
+        writer.close()
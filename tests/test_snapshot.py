@@ -0,0 +1,83 @@
+from random import Random
+
+from src.catalog_generator import generate_catalog
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.persistent_map import PersistentMap
+
+
+def test_persistent_map_keeps_old_versions() -> None:
+    """Test updates return new maps and leave previous versions intact."""
+    rng = Random(0)
+    current = PersistentMap()
+    expected: dict = {}
+    versions = []
+    for step in range(3000):
+        key = rng.choice([rng.randrange(300), f"key{rng.randrange(300)}"])
+        if rng.random() < 0.6:
+            current = current.set(key, step)
+            expected[key] = step
+        else:
+            current = current.delete(key)
+            expected.pop(key, None)
+        if step % 300 == 0:
+            versions.append((current, dict(expected)))
+
+    assert len(current) == len(expected)
+    assert dict(current.items()) == expected
+    for version, contents in versions:
+        assert dict(version.items()) == contents
+        assert len(version) == len(contents)
+
+
+def test_snapshot_is_isolated_from_writes() -> None:
+    """Test a snapshot keeps showing the store as it was when taken."""
+    store = GameStore(verbose=False)
+    store.add_game(GAMES_DATABASE[0], 1000)
+    store.add_game(GAMES_DATABASE[0], 1200)
+    store.add_game(GAMES_DATABASE[5], 900)
+    before = store.snapshot()
+
+    store.buy_game(GAMES_DATABASE[5], 5000)
+    store.add_game(GAMES_DATABASE[9], 700)
+    store.return_game(GAMES_DATABASE[5])
+    after = store.snapshot()
+
+    assert len(before) == 3
+    assert GAMES_DATABASE[5] in before
+    assert before.copies(GAMES_DATABASE[0]) == 2
+    assert before.price(GAMES_DATABASE[0]) == 1200
+    assert before.search_by_developer("Valve") == [GAMES_DATABASE[5]]
+    assert before.stats()["profit"] == 0
+
+    assert GAMES_DATABASE[5] not in after
+    assert after.price(GAMES_DATABASE[5]) is None
+    assert after.search_by_developer("Valve") == []
+    assert after.search_by_genre("Survival Horror") == [GAMES_DATABASE[9]]
+    assert after.stats() == store.stats()
+
+
+def test_snapshot_matches_store_after_random_operations() -> None:
+    """Test snapshots stay consistent with the store through many mutations."""
+    games = list(generate_catalog(50, random_seed=3))
+    rng = Random(5)
+    store = GameStore(verbose=False)
+    store.add_game(games[0], 100)
+    store.snapshot()
+    for _ in range(2000):
+        game = rng.choice(games)
+        if rng.random() < 0.5:
+            store.add_game(game, rng.randint(500, 3500))
+        else:
+            store.buy_game(game, rng.randint(1000, 7000))
+
+    snapshot = store.snapshot()
+    assert snapshot.stats() == store.stats()
+    assert sorted(game.game_id for game in snapshot) == sorted(game.game_id for game in store)
+    for game in games:
+        assert snapshot.copies(game) == len(store._by_id.search(game.game_id))
+        assert snapshot.price(game) == store._prices.get(game)
+    for developer in {game.developer for game in store}:
+        assert sorted(game.game_id for game in snapshot.search_by_developer(developer)) == sorted(
+            {game.game_id for game in store._by_developer[developer]}
+        )
@@ -0,0 +1,101 @@
+import sqlite3
+
+from pathlib import Path
+from random import Random
+
+import pytest
+
+from src.game import Game
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.sqlite_store import SQLiteGameStore
+
+
+def test_sqlite_store_matches_game_store() -> None:
+    """Test random operations give the same inventory and statistics in both stores."""
+    rng = Random(0)
+    memory = GameStore(verbose=False)
+    sqlite = SQLiteGameStore(verbose=False, batch_size=7, cache_size=3)
+    for _ in range(2000):
+        game = rng.choice(GAMES_DATABASE)
+        action = rng.randrange(5)
+        for store in (memory, sqlite):
+            if action == 0:
+                store.add_game(game, 500 + 100 * (game.release_year % 7))
+            elif action == 1:
+                store.remove_game(game)
+            elif action == 2:
+                store.buy_game(game, 1000)
+            elif action == 3:
+                store.return_game(game)
+            else:
+                store.tick()
+
+    assert sqlite.stats() == memory.stats()
+    assert len(sqlite) == len(memory)
+    assert sorted(game.game_id for game in sqlite) == sorted(game.game_id for game in memory)
+    for game in GAMES_DATABASE:
+        assert (game in sqlite) == (game in memory)
+        assert sorted(map(str, sqlite.search("developer", game.developer))) == sorted(
+            map(str, memory.search("developer", game.developer))
+        )
+
+
+def test_sqlite_store_persists_between_sessions(tmp_path: Path) -> None:
+    """Test inventory, counters and sales survive closing the database."""
+    path = str(tmp_path / "store.db")
+    game = GAMES_DATABASE[0]
+    with SQLiteGameStore(path, verbose=False) as store:
+        store.add_game(game, 1000)
+        store.add_game(game, 1200)
+        store.add_game(GAMES_DATABASE[5], 900)
+        store.buy_game(game, 2000)
+        sale_id = store.last_sale_id
+        store.tick(3)
+
+    with SQLiteGameStore(path, verbose=False) as store:
+        assert store.step == 3
+        assert len(store) == 2
+        assert store.stats()["profit"] == 1200
+        assert store.search_by_release_year(GAMES_DATABASE[5].release_year)
+        assert [found.game_id for found in store.search("price", 1200)] == [game.game_id]
+        assert store.return_game(game, sale_id)
+        assert not store.return_game(game, sale_id)
+        assert store.stats()["returned_games"] == 1
+
+
+def test_sqlite_store_validates_arguments() -> None:
+    """Test invalid sizes, unknown indexes and non-Game arguments are rejected."""
+    with pytest.raises(ValueError):
+        SQLiteGameStore(batch_size=0)
+    store = SQLiteGameStore(verbose=False)
+    with pytest.raises(ValueError):
+        store.search("title", "Control")
+    with pytest.raises(TypeError):
+        store.buy_game("Control", 1000)
+
+
+def test_sqlite_store_rejects_invalid_adds() -> None:
+    """Test out-of-range prices and conflicting games leave the store unchanged."""
+    store = SQLiteGameStore(verbose=False)
+    game = GAMES_DATABASE[0]
+    store.add_game(game, 1000)
+    with pytest.raises(ValueError, match="int64"):
+        store.add_game(game, 1 << 63)
+    impostor = Game("Other", game.developer, game.release_year, game.genre, game.game_id)
+    with pytest.raises(ValueError, match="another game"):
+        store.add_game(impostor, 1000)
+    assert store._db.execute("SELECT title, copies, price FROM titles").fetchall() == [(game.title, 1, 1000)]
+
+
+def test_sqlite_store_cache_follows_failed_statements() -> None:
+    """Test a failed statement leaves the hot cache matching the database."""
+    store = SQLiteGameStore(verbose=False)
+    game = GAMES_DATABASE[0]
+    store.add_game(game, 1000)
+    store.add_game(game, 1000)
+    store._db.execute("CREATE TRIGGER block_updates BEFORE UPDATE ON titles BEGIN SELECT RAISE(ABORT, 'blocked'); END")
+    with pytest.raises(sqlite3.IntegrityError):
+        store.remove_game(game)
+    assert store._cache[game.game_id].copies == 2
+    assert len(store) == 2
@@ -1,5 +1,8 @@
+from src.game import Game
+from src.game_store import RETURN_PERIOD
 from src.game_store import GameStore
 from src.games_db import GAMES_DATABASE
+from src.ledger import Sale
 
 
 def test_empty_store() -> None:
@@ -61,18 +64,25 @@ def test_buy_game_success_and_failure() -> None:
 
 
 def test_return_game() -> None:
-    """Test successful game return within 14-day period."""
+    """Test successful game return within 14-day period refunds the recorded price."""
     store = GameStore()
     game = GAMES_DATABASE[1]
 
     store.add_game(game, 499)
-    store._profit = 1000
-
-    result = store.return_game(game, 499, 2)
+    store.add_game(game, 799)
+    ledger = store.ledger()
+    store.buy_game(game, 1000)
+    sale_id = store.last_sale_id
+    assert sale_id is not None
+    store.tick(2)
+
+    result = store.return_game(game, sale_id)
     assert result
-    assert store._profit == 501
+    assert store._profit == 0
     assert store._return_games == 1
     assert len(store) == 1
+    sale = ledger.get(sale_id)
+    assert sale is not None and sale.returned
 
 
 def test_search_functions() -> None:
@@ -141,8 +151,8 @@ def test_complete_scenario() -> None:
     assert store._sold_games == 1
     assert store._return_games == 0
 
-    store.return_game(game, 800, 1)
-    assert store._profit == 200
+    store.return_game(game)
+    assert store._profit == 0
     assert store._sold_games == 1
     assert store._return_games == 1
 
@@ -168,14 +178,37 @@ def test_return_game_failure() -> None:
     game = GAMES_DATABASE[3]
 
     store.add_game(game, 1000)
-    store._profit = 500
+    store.buy_game(game, 1000)
+    store.tick(15)
 
-    result = store.return_game(game, 1000, 15)
+    result = store.return_game(game, store.last_sale_id)
     assert not result
-    assert store._profit == 500
+    assert not store.return_game(game)
+    assert store._profit == 1000
     assert store._return_games == 0
 
 
+def test_return_game_requires_matching_sale() -> None:
+    """Test returns fail for unsold games, other games' sales and repeated returns."""
+    store = GameStore(verbose=False)
+    game = GAMES_DATABASE[3]
+
+    assert not store.return_game(game)
+    store.add_game(game, 1000)
+    store.add_game(GAMES_DATABASE[4], 700)
+    store.buy_game(game, 1000)
+    sale_id = store.last_sale_id
+    assert sale_id is not None
+
+    assert not store.return_game(GAMES_DATABASE[4], sale_id)
+    assert not store.return_game(game, sale_id + 1)
+    assert store.return_game(game, sale_id)
+    assert not store.return_game(game, sale_id)
+    assert not store.return_game(game)
+    assert store._profit == 0
+    assert store._return_games == 1
+
+
 def test_print_search_method() -> None:
     """Test static search result display method."""
     from src.game_collection import GameCollection
@@ -260,3 +293,131 @@ def test_racing_games_from_database() -> None:
 
     assert store.search_by_genre("Racing")
     assert store.search_by_developer("Electronic Arts") or store.search_by_developer("Codemasters")
+
+
+def test_composite_index() -> None:
+    """Test custom composite index is filled, maintained and searchable."""
+    store = GameStore()
+    store.add_game(GAMES_DATABASE[5], 999)
+    store.add_index("developer_genre", lambda game: (game.developer, game.genre))
+    store.add_game(GAMES_DATABASE[6], 999)
+    store.add_game(GAMES_DATABASE[6], 999)
+
+    assert len(store.search("developer_genre", ("Valve", "FPS"))) == 1
+    assert len(store.search("developer_genre", ("Valve", "Puzzle"))) == 2
+
+    store.buy_game(GAMES_DATABASE[6], 5000)
+    assert len(store.search("developer_genre", ("Valve", "Puzzle"))) == 1
+
+    try:
+        store.add_index("developer_genre", lambda game: game.title)
+        assert False
+    except ValueError as e:
+        assert str(e) == "Index developer_genre already exists"
+
+
+def test_drop_index() -> None:
+    """Test dropped built-in indexes stop being maintained but stay searchable."""
+    store = GameStore()
+    store.drop_index("genre")
+    store.drop_index("developer")
+    assert store.indexes() == ["release_year"]
+
+    store.add_game(GAMES_DATABASE[0], 999)
+    store.add_game(GAMES_DATABASE[9], 999)
+    assert store.search_by_genre("Survival Horror")
+    assert not store.search_by_genre("Racing")
+    assert store.search_by_developer("Remedy Entertainment")
+    assert store.stats()["unique_genres"] == 2
+    assert store.stats()["unique_developers"] == 2
+
+    try:
+        store.drop_index("genre")
+        assert False
+    except ValueError as e:
+        assert str(e) == "Index genre does not exist"
+
+    try:
+        store.search("title", "Control")
+        assert False
+    except ValueError as e:
+        assert str(e) == "Index title does not exist"
+
+    try:
+        store._by_genre
+        assert False
+    except ValueError as e:
+        assert str(e) == "Index genre was dropped"
+
+
+def test_restore_builtin_index() -> None:
+    """Test a dropped built-in index is restored by name and refuses a foreign key."""
+    store = GameStore()
+    store.add_game(GAMES_DATABASE[0], 999)
+    store.drop_index("genre")
+
+    try:
+        store.add_index("genre", lambda game: game.title)
+        assert False
+    except ValueError as e:
+        assert str(e) == "Index genre is built in and keeps its own key"
+
+    try:
+        store.add_index("title")
+        assert False
+    except ValueError as e:
+        assert str(e) == "Index title needs a key function"
+
+    store.add_index("genre")
+    assert len(store._by_genre["Action"]) == 1
+
+
+def test_remove_game_keeps_indexes_consistent() -> None:
+    """Test single-pass removal updates every index and rejects unknown copies."""
+    store = GameStore()
+    store.add_game(GAMES_DATABASE[0], 999)
+    store.add_game(GAMES_DATABASE[1], 999)
+    store.add_game(GAMES_DATABASE[0], 999)
+
+    assert store.remove_game(GAMES_DATABASE[0])
+    assert len(store._by_id["CTL_RMD"]) == 1
+    assert len(store._by_developer["Remedy Entertainment"]) == 2
+    assert len(store._by_release_year[2019]) == 1
+    assert GAMES_DATABASE[0] in store
+
+    impostor = Game("Control", "Remedy Entertainment", 2019, "Action", "QTM_RMD")
+    assert not store.remove_game(impostor)
+    assert len(store) == 2
+
+    assert store.remove_game(GAMES_DATABASE[0])
+    assert GAMES_DATABASE[0] not in store
+    assert 2019 not in store._by_release_year
+    assert GAMES_DATABASE[0] not in store._prices
+
+
+def test_optional_structures_start_on_request() -> None:
+    """Test history, ledger and rankings stay off until asked for and open sales stay bounded."""
+    store = GameStore(verbose=False)
+    game = GAMES_DATABASE[3]
+    for _ in range(40):
+        store.add_game(game, 1000)
+    for _ in range(30):
+        store.buy_game(game, 1000)
+        store.tick()
+    assert (store._history, store._ledger, store._stock, store._sellers) == (None, None, None, None)
+    assert len(store._open_sales) == RETURN_PERIOD
+    assert store.memory_report()["ledger"] == 0
+
+    ledger = store.ledger()
+    store.buy_game(game, 1000)
+    sale_id = store.last_sale_id
+    assert sale_id == 30
+    assert ledger.get(sale_id) == Sale(sale_id, game.game_id, store.step, 1000, False)
+    assert ledger.get(sale_id - 1) is None
+    assert store.return_game(game, sale_id - 1)
+    assert store.return_game(game, sale_id)
+    assert ledger.get(sale_id) == Sale(sale_id, game.game_id, store.step, 1000, True)
+    assert not store.return_game(game, 0)
+    store.tick(RETURN_PERIOD + 1)
+    assert not store._open_sales
+    assert not store._open_by_game
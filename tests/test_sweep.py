@@ -0,0 +1,53 @@
+import json
+
+from pathlib import Path
+
+import pytest
+
+from src import sweep
+
+
+def test_grid_and_cache_key() -> None:
+    """Test the grid covers every combination and keys depend on parameters and code."""
+    assert sweep.grid([1, 2], [10], [None, 3]) == [(1, 10, None), (1, 10, 3), (2, 10, None), (2, 10, 3)]
+    key = sweep.cache_key((1, 10, 3), "a")
+    assert key == sweep.cache_key((1, 10, 3), "a")
+    assert key != sweep.cache_key((1, 10, 4), "a")
+    assert key != sweep.cache_key((1, 10, 3), "b")
+    assert sweep.code_version() == sweep.code_version()
+
+
+def test_sweep_reuses_cached_runs(tmp_path: Path) -> None:
+    """Test repeated sweeps compute only new points and match fresh results."""
+    cache_dir = str(tmp_path / "cache")
+    first = sweep.sweep([(3, 50, 1), (3, 50, 1), (3, 80, 2)], cache_dir, jobs=2, version="v1")
+    assert [result["cached"] for result in first] == [False, False, False]
+    assert [result["run"] for result in first] == [0, 1, 2]
+    assert first[0]["stats"] == first[1]["stats"]
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 2
+
+    second = sweep.sweep([(3, 80, 2), (3, 50, 1), (4, 50, 1)], cache_dir, jobs=1, version="v1")
+    assert [result["cached"] for result in second] == [True, True, False]
+    assert second[0]["stats"] == first[2]["stats"]
+    assert second[1]["run"] == 1
+
+    assert not any(result["cached"] for result in sweep.sweep([(3, 50, 1)], cache_dir, jobs=1, version="v2"))
+
+
+def test_unseeded_runs_are_not_cached(tmp_path: Path) -> None:
+    """Test runs without a seed are always computed."""
+    cache_dir = tmp_path / "cache"
+    results = sweep.sweep([(2, 20, None), (2, 20, None)], str(cache_dir), jobs=1)
+    assert not any(result["cached"] for result in results)
+    assert not list(cache_dir.glob("*.json"))
+
+
+def test_sweep_command_line(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the command line runs the grid and writes the summary."""
+    summary = tmp_path / "summary.json"
+    argv = ["--starts", "2", "--steps", "30", "--seeds", "1", "2", "-j", "1", "-c", str(tmp_path / "cache")]
+    assert sweep.main(argv + ["-s", str(summary)]) == 0
+    assert "2 runs, 0 from cache, 2 computed" in capsys.readouterr().out
+    assert sweep.main(argv) == 0
+    assert "2 runs, 2 from cache, 0 computed" in capsys.readouterr().out
+    assert [result["seed"] for result in json.loads(summary.read_text(encoding="utf-8"))] == [1, 2]
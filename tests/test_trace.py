@@ -0,0 +1,89 @@
+import os
+import tempfile
+
+import pytest
+
+from src.game_store import GameStore
+from src.games_db import GAMES_DATABASE
+from src.pricing import PricingEngine
+from src.simulation import Step
+from src.simulation import simulate
+from src.trace import RECORD
+from src.trace import TraceWriter
+from src.trace import iter_trace
+from src.trace import read_trace
+from src.trace import replay
+
+
+def test_record_and_read_trace() -> None:
+    """Test recorded steps are decoded back unchanged."""
+    steps = [
+        Step("add", GAMES_DATABASE[0], 1999),
+        Step("buy", GAMES_DATABASE[0], balance=2500),
+        Step("stats"),
+        Step("search", GAMES_DATABASE[5], search_type="developer"),
+        Step("return", GAMES_DATABASE[0], 1999, days=3),
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "run.trace")
+        with TraceWriter(path, GAMES_DATABASE) as writer:
+            for step in steps:
+                writer.record(step)
+
+        catalog, records = read_trace(path)
+        assert catalog == list(GAMES_DATABASE)
+        assert len(records) == len(steps) * RECORD.size
+        assert list(iter_trace(path)) == steps
+
+
+def test_trace_keeps_int64_values() -> None:
+    """Test prices, balances and clock steps beyond 32 bits survive a round trip."""
+    big = 2**40
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "run.trace")
+        with TraceWriter(path, GAMES_DATABASE) as writer:
+            writer.record(Step("add", GAMES_DATABASE[0], big))
+            writer.record(Step("buy", GAMES_DATABASE[0], balance=big), clock=2**33)
+
+        assert list(iter_trace(path)) == [
+            Step("add", GAMES_DATABASE[0], big),
+            Step("buy", GAMES_DATABASE[0], balance=big),
+        ]
+        store = replay(path)
+    assert store.step == 2**33
+    assert store._profit == big
+
+
+def test_repriced_run_cannot_be_recorded() -> None:
+    """Test a run with a pricing engine is not recorded, since traces carry no price changes."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "run.trace")
+        with TraceWriter(path, GAMES_DATABASE) as writer:
+            with pytest.raises(ValueError, match="Repriced runs cannot be recorded"):
+                simulate(5, 10, 1, recorder=writer, pricing=PricingEngine(), verbose=False)
+
+
+def test_replay_matches_simulation() -> None:
+    """Test replaying a recorded run reproduces the final store state."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "run.trace")
+        with TraceWriter(path, GAMES_DATABASE) as writer:
+            original = simulate(10, 300, 42, recorder=writer)
+        replayed = replay(path)
+
+    assert len(replayed) == len(original)
+    assert replayed._profit == original._profit
+    assert replayed._sold_games == original._sold_games
+    assert replayed._return_games == original._return_games
+    assert sorted(game.game_id for game in replayed) == sorted(game.game_id for game in original)
+
+
+def test_replay_is_silent(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test replay into a quiet store prints nothing."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "run.trace")
+        with TraceWriter(path, GAMES_DATABASE) as writer:
+            simulate(5, 50, 1, recorder=writer)
+        capsys.readouterr()
+        replay(path, GameStore(verbose=False))
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from src.games_db import GAMES_DATABASE
+from src.simulation import EVENTS_DATABASE
+from src.simulation import simulate
+from src.workload import event_probabilities
+from src.workload import generate_workload
+from src.workload_spec import Phase
+from src.workload_spec import WorkloadSpec
+
+
+def test_generate_workload_is_deterministic() -> None:
+    """Test the same seed produces identical arrays."""
+    first = generate_workload(1000, len(GAMES_DATABASE), random_seed=3)
+    second = generate_workload(1000, len(GAMES_DATABASE), random_seed=3)
+    assert len(first) == 1000
+    assert np.array_equal(first.events, second.events)
+    assert np.array_equal(first.games, second.games)
+    assert int(first.games.max()) < len(GAMES_DATABASE)
+
+
+def test_event_weights() -> None:
+    """Test events with zero weight are never generated."""
+    workload = generate_workload(5000, len(GAMES_DATABASE), {"buy": 3, "search": 1}, random_seed=0)
+    names = {EVENTS_DATABASE[event] for event in np.unique(workload.events).tolist()}
+    assert names == {"buy", "search"}
+    buys = int((workload.events == EVENTS_DATABASE.index("buy")).sum())
+    assert 3500 < buys < 4000
+
+
+def test_invalid_weights() -> None:
+    """Test unknown events and all-zero weights are rejected."""
+    with pytest.raises(ValueError):
+        event_probabilities({"dance": 1})
+    with pytest.raises(ValueError):
+        event_probabilities({"buy": 0})
+
+
+def test_steps_match_event_fields() -> None:
+    """Test converted steps only carry the values their event needs."""
+    workload = generate_workload(2000, len(GAMES_DATABASE), random_seed=1)
+    for step in workload.steps(GAMES_DATABASE):
+        assert (step.game is None) == (step.event == "stats")
+        assert (step.price != 0) == (step.event in ("add", "return"))
+        assert (step.balance != 0) == (step.event == "buy")
+        assert (step.search_type != "") == (step.event == "search")
+
+
+def test_simulate_with_workload() -> None:
+    """Test simulation consumes a pre-generated workload."""
+    workload = generate_workload(200, len(GAMES_DATABASE), {"add": 1}, random_seed=2)
+    store = simulate(0, 200, 0, workload=workload)
+    assert len(store) == 200
+
+    with pytest.raises(ValueError):
+        simulate(0, 201, 0, workload=workload)
+
+
+def test_generate_workload_with_spec() -> None:
+    """Test spec phases and popularity shape the vectorized workload."""
+    spec = WorkloadSpec({"search": 1}, zipf_exponent=2.0, phases=[Phase(10), Phase(5, {"buy": 1})])
+    workload = generate_workload(3000, len(GAMES_DATABASE), random_seed=4, spec=spec)
+    in_sale = (np.arange(3000) % 15) >= 10
+    assert (workload.events[in_sale] == EVENTS_DATABASE.index("buy")).all()
+    assert (workload.events[~in_sale] == EVENTS_DATABASE.index("search")).all()
+    assert np.bincount(workload.games).argmax() == 0
+
+    with pytest.raises(ValueError):
+        generate_workload(10, len(GAMES_DATABASE), {"buy": 1}, spec=spec)
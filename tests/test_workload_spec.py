@@ -0,0 +1,53 @@
+from collections import Counter
+from random import seed
+
+import pytest
+
+from src.games_db import GAMES_DATABASE
+from src.simulation import simulate
+from src.workload_spec import SALE_BURSTS_SPEC
+from src.workload_spec import Phase
+from src.workload_spec import WorkloadSpec
+
+
+def test_invalid_spec() -> None:
+    """Test unknown events, negative skew and empty phases are rejected."""
+    with pytest.raises(ValueError):
+        WorkloadSpec({"dance": 1})
+    with pytest.raises(ValueError):
+        WorkloadSpec(zipf_exponent=-1)
+    with pytest.raises(ValueError):
+        Phase(0)
+    with pytest.raises(ValueError):
+        WorkloadSpec(phases=[Phase(10, {"buy": 0})])
+
+
+def test_event_weights_and_phases() -> None:
+    """Test each phase draws only events it gives weight to."""
+    spec = WorkloadSpec({"search": 1}, phases=[Phase(10), Phase(5, {"buy": 1})])
+    sampler = spec.sampler(GAMES_DATABASE)
+    seed(0)
+    events = [sampler.step(i).event for i in range(45)]
+    for i, event in enumerate(events):
+        assert event == ("search" if i % 15 < 10 else "buy")
+
+
+def test_zipf_popularity() -> None:
+    """Test skewed popularity makes the first catalog game the hottest."""
+    sampler = WorkloadSpec(zipf_exponent=1.5).sampler(GAMES_DATABASE)
+    seed(1)
+    counts = Counter(sampler.random_game().game_id for _ in range(5000))
+    hottest, _ = counts.most_common(1)[0]
+    assert hottest == GAMES_DATABASE[0].game_id
+    assert counts[GAMES_DATABASE[0].game_id] > 5 * counts[GAMES_DATABASE[len(GAMES_DATABASE) - 1].game_id]
+
+
+def test_simulate_with_spec() -> None:
+    """Test simulation follows the spec and stays reproducible."""
+    only_adds = WorkloadSpec({"add": 1})
+    assert len(simulate(0, 100, 5, spec=only_adds)) == 100
+
+    first = simulate(20, 500, 9, spec=SALE_BURSTS_SPEC)
+    second = simulate(20, 500, 9, spec=SALE_BURSTS_SPEC)
+    assert first._profit == second._profit
+    assert first._sold_games == second._sold_games